@@ -0,0 +1,72 @@
+"""
+Measure the time spent exporting a large list of IPs as columns, by building a record
+per object and reading its fields, and like :py:meth:`.RecordSet.to_columns()` which
+extracts each column from the decoded JSON at once.
+
+Both start from the decoded JSON, decoding the response taking the same time either
+way.
+
+Run with: PYTHONPATH=. python benchmarks/columns.py [--items 1000000] [--rounds 3]
+"""
+
+import argparse
+import time
+from typing import Any, Callable
+
+from pyixapi.core import columns
+from pyixapi.core.api import API
+from pyixapi.core.transport import LocalTransport
+from pyixapi.models import IP
+
+
+def make_ips(items: int) -> list[dict]:
+    return [
+        {
+            "id": f"IP-{i:07d}",
+            "managing_account": "ACC-000001",
+            "consuming_account": f"ACC-{i % 500:06d}",
+            "external_ref": None,
+            "version": 6 if i % 2 else 4,
+            "address": f"2001:db8::{i:x}" if i % 2 else f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}",
+            "prefix_length": 64 if i % 2 else 24,
+            "fqdn": None,
+            "valid_not_before": "2024-01-01T00:00:00Z",
+            "valid_not_after": None,
+            "network_service_config": f"NSC-{i // 2:06d}",
+        }
+        for i in range(items)
+    ]
+
+
+def measure(function: Callable[[], Any], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    payload = make_ips(args.items)
+    api = API("https://ixapi.example.net/api/v2", "key", "secret", transport=LocalTransport())
+    endpoint = api.ips
+    fields = list(payload[0])
+
+    def from_records() -> dict[str, list]:
+        records = [IP(i, api, endpoint) for i in payload]
+        return {field: [getattr(r, field) for r in records] for field in fields}
+
+    def to_columns() -> dict[str, list]:
+        return columns.to_columns(payload)
+
+    print(f"ips: {args.items} items, {len(fields)} fields")
+    print(f"from records: {measure(from_records, args.rounds) * 1e3:8.1f} ms")
+    print(f"  to_columns: {measure(to_columns, args.rounds) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Measure the time spent decoding and encoding IX-API payloads with each JSON codec.
+
+Payloads mimic the largest lists returned by IX-API implementations, such as the IPs
+or network service configs of a large IXP. Each codec decodes the raw bytes of the
+response like pyixapi does, the ``requests`` baseline decodes them with
+``Response.json()`` which is used when no codec is configured.
+
+Run with: PYTHONPATH=. python benchmarks/json_codecs.py [--items 10000] [--rounds 20]
+"""
+
+import argparse
+import time
+from typing import Any, Callable
+
+import requests
+
+from pyixapi.core.codec import CODECS, JSONCodec
+
+
+def make_ips(items: int) -> list[dict]:
+    return [
+        {
+            "id": f"IP-{i:06d}",
+            "managing_account": "ACC-000001",
+            "consuming_account": f"ACC-{i % 500:06d}",
+            "external_ref": None,
+            "address": f"2001:db8:{i // 65536:x}:{i % 65536:x}::1",
+            "version": 6,
+            "fqdn": f"as{64500 + i % 1000}.peering.example.net",
+            "prefix_length": 64,
+            "valid_not_before": "2024-01-01T00:00:00Z",
+            "valid_not_after": None,
+            "network_service": "NS-000001",
+        }
+        for i in range(items)
+    ]
+
+
+def make_network_service_configs(items: int) -> list[dict]:
+    return [
+        {
+            "id": f"NSC-{i:06d}",
+            "type": "exchange_lan",
+            "state": "production",
+            "status": [],
+            "managing_account": "ACC-000001",
+            "consuming_account": f"ACC-{i % 500:06d}",
+            "billing_account": f"ACC-{i % 500:06d}",
+            "role_assignments": [f"RA-{i:06d}-1", f"RA-{i:06d}-2"],
+            "contract_ref": None,
+            "purchase_order": "",
+            "network_service": "NS-000001",
+            "connection": f"CONN-{i:06d}",
+            "capacity": 100000,
+            "vlan_config": {"vlan_type": "dot1q", "vlan": 100 + i % 4000, "vlan_ethertype": "0x8100"},
+            "asns": [64500 + i % 1000],
+            "macs": [f"MAC-{i:06d}"],
+            "ips": [f"IP-{i:06d}", f"IP-{i + items:06d}"],
+            "listed": True,
+            "product_offering": "PO-000001",
+            "decommission_at": None,
+            "charged_until": None,
+        }
+        for i in range(items)
+    ]
+
+
+def measure(function: Callable[[], Any], rounds: int) -> float:
+    function()  # warm up
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    return (time.perf_counter() - start) / rounds
+
+
+def available_codecs() -> list[JSONCodec]:
+    codecs = []
+    for codec_class in CODECS.values():
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            print(f"{codec_class.name} is not installed, skipped")
+    return codecs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    codecs = available_codecs()
+    for name, payload in (
+        ("ips", make_ips(args.items)),
+        ("network_service_configs", make_network_service_configs(args.items)),
+    ):
+        body = JSONCodec().dumps(payload)
+
+        def baseline() -> Any:
+            r = requests.Response()
+            r._content = body
+            r.encoding = None
+            return r.json()
+
+        print(f"\n{name}: {args.items} items, {len(body) / 1e6:.1f} MB")
+        print(f"{'requests (no codec)':>20}: decode {measure(baseline, args.rounds) * 1e3:8.1f} ms")
+        for codec in codecs:
+            decode = measure(lambda: codec.loads(body), args.rounds)
+            encode = measure(lambda: codec.dumps(payload), args.rounds)
+            print(f"{codec.name:>20}: decode {decode * 1e3:8.1f} ms, encode {encode * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Measure the memory taken by the records of large result sets, with the default
+record layout and with compact records.
+
+Result sets mimic the IPs and MACs of a large IXP. Records are built from a decoded
+response like a :py:class:`.RecordSet` does, and the memory still allocated once the
+response is dropped is counted, including the parts of the response the records keep.
+
+Run with: PYTHONPATH=. python benchmarks/record_memory.py [--items 100000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from pyixapi.core.api import API
+from pyixapi.core.response import build_record
+from pyixapi.core.transport import LocalTransport
+
+
+def make_ips(items: int) -> list[dict]:
+    return [
+        {
+            "id": f"IP-{i:06d}",
+            "managing_account": "ACC-000001",
+            "consuming_account": f"ACC-{i % 500:06d}",
+            "external_ref": None,
+            "address": f"2001:db8:{i // 65536:x}:{i % 65536:x}::1",
+            "version": 6,
+            "fqdn": f"as{64500 + i % 1000}.peering.example.net",
+            "prefix_length": 64,
+            "valid_not_before": "2024-01-01T00:00:00Z",
+            "valid_not_after": None,
+            "network_service": "NS-000001",
+        }
+        for i in range(items)
+    ]
+
+
+def make_macs(items: int) -> list[dict]:
+    return [
+        {
+            "id": f"MAC-{i:06d}",
+            "managing_account": "ACC-000001",
+            "consuming_account": f"ACC-{i % 500:06d}",
+            "external_ref": None,
+            "address": f"02:00:{i >> 24 & 255:02x}:{i >> 16 & 255:02x}:{i >> 8 & 255:02x}:{i & 255:02x}",
+            "valid_not_before": "2024-01-01T00:00:00Z",
+            "valid_not_after": None,
+        }
+        for i in range(items)
+    ]
+
+
+def measure(api: API, name: str, body: str) -> int:
+    endpoint = getattr(api, name)
+    gc.collect()
+    tracemalloc.start()
+    records = [build_record(endpoint, values) for values in json.loads(body)]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100000)
+    args = parser.parse_args()
+
+    for name, payload in (("ips", make_ips(args.items)), ("macs", make_macs(args.items))):
+        print(f"\n{name}: {args.items} items")
+        for compact_records in (False, True):
+            api = API(
+                "https://ixapi.example.net/api/v2",
+                "key",
+                "secret",
+                transport=LocalTransport(),
+                compact_records=compact_records,
+            )
+            size = measure(api, name, json.dumps(payload))
+            layout = "compact" if compact_records else "default"
+            print(f"{layout:>8}: {size / 1e6:8.1f} MB, {size / args.items:6.0f} bytes per record")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Measure the time spent building records when going through a large list to look at a
+few fields, with eager records and with lazy ones.
+
+The list mimics the network service configs of a large IXP. Each run builds the
+records of the whole list from its decoded JSON, like a :py:class:`.RecordSet` does,
+and reads the ``id`` and ``state`` fields of each, then casts every record as a dict
+to measure the cost of building all the fields lazily.
+
+Run with: PYTHONPATH=. python benchmarks/records.py [--items 10000] [--rounds 20]
+"""
+
+import argparse
+import time
+from typing import Any, Callable
+
+from pyixapi.core.api import API
+from pyixapi.core.transport import LocalTransport
+from pyixapi.models import NetworkServiceConfig
+
+
+def make_network_service_configs(items: int) -> list[dict]:
+    return [
+        {
+            "id": f"NSC-{i:06d}",
+            "type": "exchange_lan",
+            "state": "production" if i % 10 else "decommissioned",
+            "status": [{"severity": 6, "tag": "info", "message": "ok", "attrs": {}, "timestamp": None}],
+            "managing_account": "ACC-000001",
+            "consuming_account": f"ACC-{i % 500:06d}",
+            "billing_account": f"ACC-{i % 500:06d}",
+            "role_assignments": [f"RA-{i:06d}-1", f"RA-{i:06d}-2"],
+            "contract_ref": None,
+            "purchase_order": "",
+            "network_service": "NS-000001",
+            "connection": f"CONN-{i:06d}",
+            "capacity": 100000,
+            "vlan_config": {"vlan_type": "dot1q", "vlan": 100 + i % 4000, "vlan_ethertype": "0x8100"},
+            "asns": [64500 + i % 1000],
+            "macs": [f"MAC-{i:06d}"],
+            "ips": [f"IP-{i:06d}", f"IP-{i + items:06d}"],
+            "listed": True,
+            "product_offering": "PO-000001",
+            "decommission_at": None,
+            "charged_until": None,
+        }
+        for i in range(items)
+    ]
+
+
+def measure(function: Callable[[], Any], rounds: int) -> float:
+    function()  # warm up
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    payload = make_network_service_configs(args.items)
+    print(f"network_service_configs: {args.items} items")
+    for lazy_records in (False, True):
+        api = API("https://ixapi.example.net/api/v2", "key", "secret", transport=LocalTransport())
+        api.lazy_records = lazy_records
+        endpoint = api.network_service_configs
+
+        def filter_by_state() -> list[str]:
+            records = (NetworkServiceConfig(i, api, endpoint) for i in payload)
+            return [r.id for r in records if r.state == "production"]
+
+        def cast_as_dict() -> list[dict]:
+            return [dict(NetworkServiceConfig(i, api, endpoint)) for i in payload]
+
+        name = "lazy" if lazy_records else "eager"
+        print(
+            f"{name:>6}: filter by state {measure(filter_by_state, args.rounds) * 1e3:8.1f} ms, "
+            f"cast as dict {measure(cast_as_dict, args.rounds) * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
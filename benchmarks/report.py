@@ -0,0 +1,89 @@
+"""
+Measure the time spent computing the monthly utilisation of many ports, one
+``statistics_timeseries`` call after the other with the statistics computed sample by
+sample, and with :py:class:`.UtilisationReport`.
+
+Each port has a month of 5 minute samples. The in-process transport waits
+``--latency`` seconds before answering each timeseries call, standing in for the
+IX-API server.
+
+Run with: PYTHONPATH=. python benchmarks/report.py [--ports 200] [--latency 0.05]
+"""
+
+import argparse
+import json
+import random
+import time
+
+from pyixapi.core.api import API
+from pyixapi.core.report import UtilisationReport
+from pyixapi.core.transport import LocalRequest, LocalTransport, TransportResponse
+
+FIELDS = ["timestamp", "average_bps_in", "average_bps_out", "max_bps_in", "max_bps_out"]
+SAMPLES = 31 * 24 * 12
+
+
+def make_timeseries(seed: int) -> bytes:
+    rng = random.Random(seed)
+    start = 1704067200
+    samples = [
+        [
+            time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(start + 300 * i)),
+            *(round(rng.uniform(0, 8e9)) for _ in range(len(FIELDS) - 1)),
+        ]
+        for i in range(SAMPLES)
+    ]
+    return json.dumps({"precision": 300, "fields": FIELDS, "samples": samples}).encode()
+
+
+def naive(ports: list, percentile: float, threshold: float) -> list[dict]:
+    results = []
+    for port in ports:
+        response = port.statistics_timeseries("5m")
+        stats = {}
+        for index, field in enumerate(response["fields"][1:3], 1):
+            values = sorted(sample[index] for sample in response["samples"] if sample[index] is not None)
+            position = (len(values) - 1) * percentile / 100
+            low = int(position)
+            high = min(low + 1, len(values) - 1)
+            stats[field] = {
+                "percentile": values[low] + (values[high] - values[low]) * (position - low),
+                "max": max(values),
+                "mean": sum(values) / len(values),
+                "time_above": 300 * len([v for v in values if v > port.speed * 1e6 * threshold]),
+            }
+        results.append(stats)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ports", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+
+    bodies = [make_timeseries(i) for i in range(8)]
+
+    def handler(request: LocalRequest) -> TransportResponse:
+        time.sleep(args.latency)
+        port = int(request.url.split("/")[-4].split("-")[1])
+        return TransportResponse(200, bodies[port % len(bodies)], {}, url=request.url)
+
+    transport = LocalTransport()
+    transport.add("get", "/ports", [{"id": f"PORT-{i}", "name": f"eth{i}", "speed": 10000} for i in range(args.ports)])
+    transport.add("get", "/statistics/5m/timeseries", handler=handler)
+    api = API("https://ixapi.example.net/api/v2", "key", "secret", transport=transport)
+    ports = list(api.ports.all())
+
+    print(f"{args.ports} ports, {SAMPLES} samples each, {args.latency * 1e3:.0f} ms per call")
+    start = time.perf_counter()
+    naive(ports, 95, 0.8)
+    print(f"     sequential: {time.perf_counter() - start:8.2f} s")
+    start = time.perf_counter()
+    UtilisationReport("5m", max_workers=args.workers).run(ports)
+    print(f"         report: {time.perf_counter() - start:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
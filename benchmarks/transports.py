@@ -0,0 +1,100 @@
+"""
+Measure the per-call overhead of the built-in transports.
+
+A local HTTP server answers every GET with the same JSON list, so the numbers reflect
+the cost of the client stack (pyixapi, transport and HTTP library) rather than of a
+remote IX-API implementation. The in-process transport does no I/O at all and gives
+the overhead of pyixapi alone.
+
+Run with: PYTHONPATH=. python benchmarks/transports.py [--calls 2000] [--items 10]
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pyixapi
+from pyixapi.core.transport import LocalTransport, RequestsTransport, Transport, Urllib3Transport
+
+KEY = "benchmark-key"
+SECRET = "benchmark-secret"
+
+
+def make_payload(items: int) -> list[dict]:
+    return [
+        {
+            "id": f"CONN-{i:06d}",
+            "name": f"Connection {i}",
+            "state": "production",
+            "mode": "lag_lacp",
+            "speed": 100000,
+            "ports": [f"PORT-{i:06d}-1", f"PORT-{i:06d}-2"],
+        }
+        for i in range(items)
+    ]
+
+
+def serve(body: bytes) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def measure(url: str, transport: Transport, calls: int) -> float:
+    api = pyixapi.api(url, KEY, SECRET, transport=transport)
+    list(api.connections.all())  # warm up the connection pool
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        list(api.connections.all())
+    elapsed = time.perf_counter() - start
+
+    transport.close()
+    return elapsed / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=10)
+    args = parser.parse_args()
+
+    payload = make_payload(args.items)
+    server = serve(json.dumps(payload).encode())
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/v2"
+
+    import requests
+
+    local = LocalTransport()
+    local.add("get", "/connections", payload)
+
+    results = {
+        "requests": measure(url, RequestsTransport(requests.Session()), args.calls),
+        "urllib3": measure(url, Urllib3Transport(), args.calls),
+        "local (no I/O)": measure(url, local, args.calls),
+    }
+    server.shutdown()
+
+    print(f"{args.calls} calls listing {args.items} connections")
+    for name, per_call in results.items():
+        print(f"{name:>16}: {per_call * 1e6:9.1f} µs/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 from .core.api import API as api
+from .core.api import AsyncAPI as async_api
 from .core.api import __version__  # noqa: F401
 from .core.query import ContentError, RequestError
 
-__all__ = ("api", "ContentError", "RequestError")
+__all__ = ("api", "async_api", "ContentError", "RequestError")
@@ -1,12 +1,24 @@
+import asyncio
+import threading
 import warnings
 from typing import Any
 
 import requests
-
-from pyixapi.core.endpoint import Endpoint
-from pyixapi.core.query import Request
-from pyixapi.core.response import Record
-from pyixapi.core.token import Token
+from requests.adapters import HTTPAdapter
+
+from pyixapi.core.batch import AsyncBatcher, BaseBatcher, Batcher
+from pyixapi.core.cache import ConditionalCache, ResponseCache, TimeseriesCache, cache_scope
+from pyixapi.core.codec import JSONCodec, get_codec
+from pyixapi.core.endpoint import AsyncEndpoint, BaseEndpoint, Endpoint
+from pyixapi.core.identity import IdentityMap
+from pyixapi.core.pagination import Pagination
+from pyixapi.core.patch import check_patch_format
+from pyixapi.core.query import AsyncRequest, BaseRequest, Request, RequestError
+from pyixapi.core.ratelimit import RateLimiter
+from pyixapi.core.response import AsyncRecord, Record, async_model
+from pyixapi.core.retry import Retry
+from pyixapi.core.token import AsyncTokenManager, BaseTokenManager, Token, TokenManager
+from pyixapi.core.transport import Transport
 from pyixapi.core.util import cat
 from pyixapi.models import (
     IP,
@@ -37,14 +49,18 @@ from pyixapi.models import (
 __version__ = "0.3.0"
 
 
-class API(object):
+class BaseAPI(object):
     """
-    The API object is the entrypoint for pyixapi.
-
-    After instantiating the API() with the appropriate named arguments you can specify
-    which app and endpoint you wish to interact with.
+    Settings, authentication state and endpoints shared by :py:class:`.API` and
+    :py:class:`.AsyncAPI`.
     """
 
+    _endpoint_class: type[BaseEndpoint] = BaseEndpoint
+    _request_class: type[BaseRequest] = BaseRequest
+    _token_manager_class: type[BaseTokenManager] = BaseTokenManager
+
+    http_session: Any
+
     def __init__(
         self,
         url: str,
@@ -54,39 +70,267 @@ class API(object):
         refresh_token: str = "",
         user_agent: str = f"pyixapi/{__version__}",
         proxies: dict[str, str] | None = None,
+        transport: Any = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        refresh_margin: int | None = None,
+        retry: Retry | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        json_codec: str | JSONCodec | None = None,
+        pagination: Pagination | None = None,
+        batcher: BaseBatcher | None = None,
+        identity_map: IdentityMap | None = None,
+        lazy_records: bool = False,
+        compact_records: bool = False,
+        patch_format: str | None = None,
+        timeseries_cache: TimeseriesCache | None = None,
     ) -> None:
         self.url = url.rstrip("/")
         self.key = key
         self.secret = secret
         self.access_token = Token.from_jwt(access_token) if access_token else None
         self.refresh_token = Token.from_jwt(refresh_token) if refresh_token else None
-        self.http_session = requests.Session()
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
         self.user_agent = user_agent
         self.proxies = proxies
+        self.transport = transport
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.cache_scope = cache_scope(key)
+        self.conditional_cache = conditional_cache
+        self.json_codec = get_codec(json_codec) if json_codec is not None else None
+        self.pagination = pagination
+        self.batcher = batcher
+        self.identity_map = identity_map
+        self.lazy_records = lazy_records
+        self.compact_records = compact_records
+        self.patch_format = check_patch_format(patch_format)
+        self.timeseries_cache = timeseries_cache
         self._version: int | None = None
+        self._version_lock = threading.Lock()
+        self._auth_lock = threading.RLock()
+        self._auth_record: Any = None
+        self.token_manager = (
+            self._token_manager_class(self, margin=refresh_margin) if refresh_margin is not None else None
+        )
 
-        self.auth = Endpoint(self, "auth")
-        self.connections = Endpoint(self, "connections", model=Connection)
-        self.contacts = Endpoint(self, "contacts", model=Contact)
-        self.devices = Endpoint(self, "devices", model=Device)
-        self.facilities = Endpoint(self, "facilities", model=Facility)
-        self.ips = Endpoint(self, "ips", model=IP)
-        self.macs = Endpoint(self, "macs", model=MAC)
-        self.network_feature_configs = Endpoint(self, "network-feature-configs", model=NetworkFeatureConfig)
-        self.network_features = Endpoint(self, "network-features", model=NetworkFeature)
-        self.network_service_configs = Endpoint(self, "network-service-configs", model=NetworkServiceConfig)
-        self.network_services = Endpoint(self, "network-services", model=NetworkService)
-        self.pops = Endpoint(self, "pops", model=PoP)
+        self.auth = self._endpoint_class(self, "auth")
+        self.connections = self._endpoint_class(self, "connections", model=Connection)
+        self.contacts = self._endpoint_class(self, "contacts", model=Contact)
+        self.devices = self._endpoint_class(self, "devices", model=Device)
+        self.facilities = self._endpoint_class(self, "facilities", model=Facility)
+        self.ips = self._endpoint_class(self, "ips", model=IP)
+        self.macs = self._endpoint_class(self, "macs", model=MAC)
+        self.network_feature_configs = self._endpoint_class(self, "network-feature-configs", model=NetworkFeatureConfig)
+        self.network_features = self._endpoint_class(self, "network-features", model=NetworkFeature)
+        self.network_service_configs = self._endpoint_class(self, "network-service-configs", model=NetworkServiceConfig)
+        self.network_services = self._endpoint_class(self, "network-services", model=NetworkService)
+        self.pops = self._endpoint_class(self, "pops", model=PoP)
         # Version 2+
-        self.availability_zones = Endpoint(self, "availability-zones", model=AvailabilityZone)
-        self.member_joining_rules = Endpoint(self, "member-joining-rules", model=MemberJoiningRule)
-        self.metro_areas = Endpoint(self, "metro-areas", model=MetroArea)
-        self.metro_area_networks = Endpoint(self, "metro-area-networks", model=MetroAreaNetwork)
-        self.ports = Endpoint(self, "ports", model=Port)
-        self.port_reservations = Endpoint(self, "port-reservations", model=PortReservation)
-        self.roles = Endpoint(self, "roles", model=Role)
-        self.role_assignments = Endpoint(self, "role-assignments", model=RoleAssignment)
-        self.routing_functions = Endpoint(self, "routing-functions", model=RoutingFunction)
+        self.availability_zones = self._endpoint_class(self, "availability-zones", model=AvailabilityZone)
+        self.member_joining_rules = self._endpoint_class(self, "member-joining-rules", model=MemberJoiningRule)
+        self.metro_areas = self._endpoint_class(self, "metro-areas", model=MetroArea)
+        self.metro_area_networks = self._endpoint_class(self, "metro-area-networks", model=MetroAreaNetwork)
+        self.ports = self._endpoint_class(self, "ports", model=Port)
+        self.port_reservations = self._endpoint_class(self, "port-reservations", model=PortReservation)
+        self.roles = self._endpoint_class(self, "roles", model=Role)
+        self.role_assignments = self._endpoint_class(self, "role-assignments", model=RoleAssignment)
+        self.routing_functions = self._endpoint_class(self, "routing-functions", model=RoutingFunction)
+
+    @property
+    def version(self) -> int:
+        raise NotImplementedError
+
+    def _set_version(self, version: int) -> int:
+        if version == 1:
+            warnings.warn(
+                "IX-API version 1 is deprecated and will not be supported in future releases of pyixapi.",
+                DeprecationWarning,
+                stacklevel=3,
+            )
+        return version
+
+    def _request_kwargs(self, base: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+        kwargs.setdefault("token", self.access_token)
+        kwargs.setdefault("reauth", self._renew_after_unauthorized)
+        kwargs.setdefault("cache_scope", self.cache_scope)
+        return dict(
+            base=base,
+            http_session=self.http_session,
+            user_agent=self.user_agent,
+            proxies=self.proxies,
+            transport=self.transport,
+            retry=self.retry,
+            rate_limiter=self.rate_limiter,
+            conditional_cache=self.conditional_cache,
+            codec=self.json_codec,
+            **kwargs,
+        )
+
+    def _request(self, base: str, **kwargs: Any) -> BaseRequest:
+        """
+        Build a request sharing the session, token and settings of this instance.
+        """
+        return self._request_class(**self._request_kwargs(base, kwargs))
+
+    def _renew_after_unauthorized(self, failed_token: Token | None) -> Any:
+        raise NotImplementedError
+
+    def _set_tokens(self, r: dict[str, Any]) -> Any:
+        self.access_token = Token.from_jwt(r["access_token"])
+        self.refresh_token = Token.from_jwt(r["refresh_token"])
+        self._auth_record = self.auth.return_obj(r, self, self.auth)
+        self._start_token_manager()
+
+        return self._auth_record
+
+    def _start_token_manager(self) -> None:
+        """
+        Start renewing the tokens pair in the background, once there are tokens.
+        """
+        if self.token_manager is not None and self.access_token is not None:
+            self.token_manager.start()
+
+
+class API(BaseAPI):
+    """
+    The API object is the entrypoint for pyixapi.
+
+    After instantiating the API() with the appropriate named arguments you can specify
+    which app and endpoint you wish to interact with.
+
+    HTTP requests are sent through ``http_session`` unless another
+    :py:class:`.Transport` is given, such as :py:class:`.Urllib3Transport` or
+    :py:class:`.LocalTransport`.
+
+    Calls rejected with a 401 because the access token was revoked or expired early
+    are replayed once after renewing the tokens pair, concurrent failures sharing a
+    single renewal. Calls failing with a transient error, such as a 503, can be retried
+    by giving a :py:class:`.Retry` policy, and the rate of calls can be capped with a
+    :py:class:`.RateLimiter`. Responses of endpoints which rarely change can be kept
+    in a :py:class:`.ResponseCache`, while a :py:class:`.ConditionalCache` avoids
+    downloading again responses which did not change. A :py:class:`.TimeseriesCache`
+    keeps the past samples of typed statistics timeseries, so that only the recent
+    ones are fetched again.
+
+    Response bodies are decoded, and request bodies encoded, by the JSON handling of
+    the transport unless ``json_codec`` names a :py:class:`.JSONCodec`, such as
+    ``orjson``, or is ``auto`` to pick the fastest one installed.
+
+    Lists are expected in a single response unless a :py:class:`.Pagination` is given,
+    such as :py:class:`.LimitOffsetPagination`, in which case they are fetched page by
+    page, the next pages being fetched in the background. The pagination applies to
+    the lists of every endpoint, which are all expected to support it. Lookups of single objects by
+    ID made at about the same time can be sent together by giving a
+    :py:class:`.Batcher`, or an :py:class:`.AsyncBatcher` to :py:class:`.AsyncAPI`.
+    With an :py:class:`.IdentityMap`, each object is represented by a single record
+    refreshed in place whenever the object is fetched again. With ``lazy_records``,
+    the fields of records are only built when they are read, which makes going through
+    large lists to look at a few fields cheaper. With ``compact_records``, records use
+    the :py:class:`.CompactRecord` layout, which takes about half the memory when
+    keeping large lists around. Changes to records are saved by sending the fields which
+    changed, or the smallest ``merge-patch`` or ``json-patch`` document when
+    ``patch_format`` is set.
+
+    An API instance is thread-safe and can be shared by many threads. Authentication
+    and version probing are serialised so that concurrent callers trigger a single
+    request, and the connection pool of the HTTP session can be sized with
+    ``pool_connections`` (number of hosts) and ``pool_maxsize`` (connections per host)
+    to match the number of threads.
+
+    When ``refresh_margin`` is set, a :py:class:`.TokenManager` renews the tokens pair
+    in the background, ``refresh_margin`` seconds before the access token expires. It
+    starts once tokens are given or obtained and stops with :py:meth:`.API.close()`.
+    """
+
+    _endpoint_class: type[Endpoint] = Endpoint
+    _request_class: type[Request] = Request
+    _token_manager_class: type[TokenManager] = TokenManager
+
+    auth: Endpoint
+    connections: Endpoint
+    contacts: Endpoint
+    devices: Endpoint
+    facilities: Endpoint
+    ips: Endpoint
+    macs: Endpoint
+    network_feature_configs: Endpoint
+    network_features: Endpoint
+    network_service_configs: Endpoint
+    network_services: Endpoint
+    pops: Endpoint
+    availability_zones: Endpoint
+    member_joining_rules: Endpoint
+    metro_areas: Endpoint
+    metro_area_networks: Endpoint
+    ports: Endpoint
+    port_reservations: Endpoint
+    roles: Endpoint
+    role_assignments: Endpoint
+    routing_functions: Endpoint
+    batcher: Batcher | None
+    token_manager: TokenManager | None
+
+    def __init__(
+        self,
+        url: str,
+        key: str,
+        secret: str,
+        access_token: str = "",
+        refresh_token: str = "",
+        user_agent: str = f"pyixapi/{__version__}",
+        proxies: dict[str, str] | None = None,
+        transport: Transport | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        refresh_margin: int | None = None,
+        retry: Retry | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        json_codec: str | JSONCodec | None = None,
+        pagination: Pagination | None = None,
+        batcher: Batcher | None = None,
+        identity_map: IdentityMap | None = None,
+        lazy_records: bool = False,
+        compact_records: bool = False,
+        patch_format: str | None = None,
+        timeseries_cache: TimeseriesCache | None = None,
+    ) -> None:
+        super().__init__(
+            url,
+            key,
+            secret,
+            access_token=access_token,
+            refresh_token=refresh_token,
+            user_agent=user_agent,
+            proxies=proxies,
+            transport=transport,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            refresh_margin=refresh_margin,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            conditional_cache=conditional_cache,
+            json_codec=json_codec,
+            pagination=pagination,
+            batcher=batcher,
+            identity_map=identity_map,
+            lazy_records=lazy_records,
+            compact_records=compact_records,
+            patch_format=patch_format,
+            timeseries_cache=timeseries_cache,
+        )
+        self.http_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.http_session.mount("http://", adapter)
+        self.http_session.mount("https://", adapter)
+        self._start_token_manager()
 
     @property
     def version(self) -> int:
@@ -99,37 +343,27 @@ class API(object):
         if self._version is not None:
             return self._version
 
-        version = Request(
-            base=self.url,
-            token=self.access_token,
-            http_session=self.http_session,
-            user_agent=self.user_agent,
-            proxies=self.proxies,
-        ).get_version()
-
-        if version == 1:
-            warnings.warn(
-                "IX-API version 1 is deprecated and will not be supported in future releases of pyixapi.",
-                DeprecationWarning,
-                stacklevel=2,
-            )
+        with self._version_lock:
+            if self._version is None:
+                self._version = self._set_version(self._request(self.url).get_version())
+        return self._version
 
-        self._version = version
-        return version
+    def _request(self, base: str, **kwargs: Any) -> Request:
+        return self._request_class(**self._request_kwargs(base, kwargs))
 
     @property
     def accounts(self) -> Endpoint:
-        return Endpoint(self, "customers" if self.version == 1 else "accounts", model=Account)
+        return self._endpoint_class(self, "customers" if self.version == 1 else "accounts", model=Account)
 
     @property
     def demarcs(self) -> Endpoint:
         if self.version != 1:
             raise AttributeError("demarcs endpoint is only available in IX-API v1")
-        return Endpoint(self, "demarcs", model=Demarc)
+        return self._endpoint_class(self, "demarcs", model=Demarc)
 
     @property
     def product_offerings(self) -> Endpoint:
-        return Endpoint(
+        return self._endpoint_class(
             self,
             "products" if self.version == 1 else "product-offerings",
             model=ProductOffering,
@@ -141,14 +375,7 @@ class API(object):
 
         Available in IX-API 2 or newer.
         """
-        r = Request(
-            base=cat(self.url, "account"),
-            token=self.access_token,
-            http_session=self.http_session,
-            user_agent=self.user_agent,
-            proxies=self.proxies,
-        )
-        return Account(r._make_call(), self, self.accounts)
+        return Account(self._request(cat(self.url, "account"))._make_call(), self, self.accounts)
 
     def authenticate(self) -> Record | None:
         """
@@ -160,45 +387,93 @@ class API(object):
         If a the access token is expired but the refresh token is still valid, the
         tokens pair will be refreshed by calling
         :py:meth:`.API.refresh_authentication()`.
+
+        Concurrent calls are serialised: threads waiting for an authentication in
+        progress find valid tokens once it is done and do not issue another request.
         """
         # Access token still valid, no need for re-auth
         if self.access_token and not self.access_token.is_expired:
             return None
-        # Refresh token still valid, prolong auth with it
-        if self.refresh_token and not self.refresh_token.is_expired:
-            return self.refresh_authentication()
 
-        r = Request(
-            cat(self.url, "auth", "token"),
-            http_session=self.http_session,
-            user_agent=self.user_agent,
-            proxies=self.proxies,
-        ).post(data={"api_key": self.key, "api_secret": self.secret})
+        with self._auth_lock:
+            if self.access_token and not self.access_token.is_expired:
+                return None
+            # Refresh token still valid, prolong auth with it
+            if self.refresh_token and not self.refresh_token.is_expired:
+                return self.refresh_authentication()
 
-        self.access_token = Token.from_jwt(r["access_token"])
-        self.refresh_token = Token.from_jwt(r["refresh_token"])
+            return self._authenticate_with_credentials()
 
-        return Record(r, self, self.auth)
+    def _authenticate_with_credentials(self) -> Record:
+        with self._auth_lock:
+            r = self._request(cat(self.url, "auth", "token"), token=None, reauth=None).post(
+                data={"api_key": self.key, "api_secret": self.secret}
+            )
+            return self._set_tokens(r)
 
     def refresh_authentication(self) -> Record:
         """
         Prolong authentication by refreshing the tokens pair.
+
+        Threads calling this method while a refresh is in progress wait for it and
+        share its result instead of refreshing the pair again.
         """
-        if not self.refresh_token:
+        refresh_token = self.refresh_token
+        if not refresh_token:
             raise ValueError("No refresh token available to refresh authentication")
 
-        r = Request(
-            cat(self.url, "auth", "refresh"),
-            token=self.refresh_token,
-            http_session=self.http_session,
-            user_agent=self.user_agent,
-            proxies=self.proxies,
-        ).post(data={"refresh_token": self.refresh_token.encoded})
+        with self._auth_lock:
+            if self.refresh_token is not refresh_token and self._auth_record is not None:
+                # Refreshed by another thread while waiting for the lock
+                return self._auth_record
 
-        self.access_token = Token.from_jwt(r["access_token"])
-        self.refresh_token = Token.from_jwt(r["refresh_token"])
+            r = self._request(cat(self.url, "auth", "refresh"), token=refresh_token, reauth=None).post(
+                data={"refresh_token": refresh_token.encoded}
+            )
+            return self._set_tokens(r)
+
+    def _renew_tokens(self) -> Record:
+        """
+        Renew the tokens pair, refreshing it when possible and authenticating again
+        with the API key and secret otherwise.
+        """
+        with self._auth_lock:
+            if self.refresh_token and not self.refresh_token.is_expired:
+                try:
+                    return self.refresh_authentication()
+                except RequestError:
+                    pass
+            return self._authenticate_with_credentials()
+
+    def _renew_after_unauthorized(self, failed_token: Token | None) -> Token | None:
+        """
+        Renew the tokens pair after ``failed_token`` was rejected and return the access
+        token to replay the call with.
+
+        Threads failing with the same token wait for the first one to renew it and
+        reuse its result.
+        """
+        with self._auth_lock:
+            if self.access_token is failed_token:
+                self._renew_tokens()
+            return self.access_token
+
+    def close(self) -> None:
+        """
+        Stop the background token renewal, if any, and close the HTTP connections.
+        """
+        if self.token_manager is not None:
+            self.token_manager.stop()
+        if self.transport is not None:
+            self.transport.close()
+        else:
+            self.http_session.close()
 
-        return Record(r, self, self.auth)
+    def __enter__(self) -> "API":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
 
     def extensions(self) -> list[dict[str, Any]]:
         """
@@ -206,13 +481,7 @@ class API(object):
 
         Available in IX-API 2 or newer.
         """
-        return Request(
-            base=cat(self.url, "extensions"),
-            token=self.access_token,
-            http_session=self.http_session,
-            user_agent=self.user_agent,
-            proxies=self.proxies,
-        )._make_call()
+        return self._request(cat(self.url, "extensions"))._make_call()
 
     def health(self) -> dict[str, Any]:
         """
@@ -223,13 +492,7 @@ class API(object):
         if self.version == 1:
             return {}
 
-        return Request(
-            base=self.url,
-            token=self.access_token,
-            http_session=self.http_session,
-            user_agent=self.user_agent,
-            proxies=self.proxies,
-        ).get_health()
+        return self._request(self.url).get_health()
 
     def implementation(self) -> dict[str, Any]:
         """
@@ -237,10 +500,309 @@ class API(object):
 
         Available in IX-API 2 or newer.
         """
-        return Request(
-            base=cat(self.url, "implementation"),
-            token=self.access_token,
-            http_session=self.http_session,
-            user_agent=self.user_agent,
-            proxies=self.proxies,
-        )._make_call()
+        return self._request(cat(self.url, "implementation"))._make_call()
+
+
+class AsyncAPI(BaseAPI):
+    """
+    The AsyncAPI object is the asyncio entrypoint for pyixapi.
+
+    It exposes the same endpoints as :py:class:`.API`, but every method issuing an
+    HTTP request is a coroutine and record sets are consumed with ``async for``. HTTP
+    requests are made with an ``httpx.AsyncClient`` which requires the ``async``
+    extra to be installed (``pip install pyixapi[async]``), unless an asynchronous
+    transport is given.
+
+    The API version cannot be probed lazily from a property without blocking, so
+    :py:meth:`.AsyncAPI.get_version()` must be awaited before using
+    :py:attr:`.AsyncAPI.version` or the version dependent endpoints.
+
+    :Example:
+
+    >>> async with pyixapi.async_api(url, key, secret) as ixapi:
+    ...     await ixapi.authenticate()
+    ...     async for connection in ixapi.connections.all():
+    ...         print(await connection.statistics())
+    """
+
+    _endpoint_class: type[AsyncEndpoint] = AsyncEndpoint
+    _request_class: type[AsyncRequest] = AsyncRequest
+    _token_manager_class: type[AsyncTokenManager] = AsyncTokenManager
+
+    auth: AsyncEndpoint
+    connections: AsyncEndpoint
+    contacts: AsyncEndpoint
+    devices: AsyncEndpoint
+    facilities: AsyncEndpoint
+    ips: AsyncEndpoint
+    macs: AsyncEndpoint
+    network_feature_configs: AsyncEndpoint
+    network_features: AsyncEndpoint
+    network_service_configs: AsyncEndpoint
+    network_services: AsyncEndpoint
+    pops: AsyncEndpoint
+    availability_zones: AsyncEndpoint
+    member_joining_rules: AsyncEndpoint
+    metro_areas: AsyncEndpoint
+    metro_area_networks: AsyncEndpoint
+    ports: AsyncEndpoint
+    port_reservations: AsyncEndpoint
+    roles: AsyncEndpoint
+    role_assignments: AsyncEndpoint
+    routing_functions: AsyncEndpoint
+    batcher: AsyncBatcher | None
+    token_manager: AsyncTokenManager | None
+
+    def __init__(
+        self,
+        url: str,
+        key: str,
+        secret: str,
+        access_token: str = "",
+        refresh_token: str = "",
+        user_agent: str = f"pyixapi/{__version__}",
+        proxies: dict[str, str] | None = None,
+        http_session: Any = None,
+        transport: Any = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        refresh_margin: int | None = None,
+        retry: Retry | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        json_codec: str | JSONCodec | None = None,
+        pagination: Pagination | None = None,
+        batcher: AsyncBatcher | None = None,
+        identity_map: IdentityMap | None = None,
+        lazy_records: bool = False,
+        compact_records: bool = False,
+        patch_format: str | None = None,
+        timeseries_cache: TimeseriesCache | None = None,
+    ) -> None:
+        super().__init__(
+            url,
+            key,
+            secret,
+            access_token=access_token,
+            refresh_token=refresh_token,
+            user_agent=user_agent,
+            proxies=proxies,
+            transport=transport,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            refresh_margin=refresh_margin,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            conditional_cache=conditional_cache,
+            json_codec=json_codec,
+            pagination=pagination,
+            batcher=batcher,
+            identity_map=identity_map,
+            lazy_records=lazy_records,
+            compact_records=compact_records,
+            patch_format=patch_format,
+            timeseries_cache=timeseries_cache,
+        )
+        if http_session is None and transport is None:
+            http_session = self._create_http_session()
+        self.http_session = http_session
+        self._async_auth_lock = asyncio.Lock()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Started by __aenter__() instead
+            pass
+        else:
+            self._start_token_manager()
+
+    def _create_http_session(self) -> Any:
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError("httpx is required to use AsyncAPI, install it with: pip install pyixapi[async]") from e
+
+        limits = httpx.Limits(max_connections=self.pool_maxsize * self.pool_connections)
+        mounts = None
+        if self.proxies:
+            mounts = {
+                f"{scheme}://": httpx.AsyncHTTPTransport(proxy=url, limits=limits)
+                for scheme, url in self.proxies.items()
+            }
+        return httpx.AsyncClient(limits=limits, mounts=mounts)
+
+    def _request(self, base: str, **kwargs: Any) -> AsyncRequest:
+        return self._request_class(**self._request_kwargs(base, kwargs))
+
+    @property
+    def accounts(self) -> AsyncEndpoint:
+        return self._endpoint_class(self, "customers" if self.version == 1 else "accounts", model=Account)
+
+    @property
+    def demarcs(self) -> AsyncEndpoint:
+        if self.version != 1:
+            raise AttributeError("demarcs endpoint is only available in IX-API v1")
+        return self._endpoint_class(self, "demarcs", model=Demarc)
+
+    @property
+    def product_offerings(self) -> AsyncEndpoint:
+        return self._endpoint_class(
+            self,
+            "products" if self.version == 1 else "product-offerings",
+            model=ProductOffering,
+        )
+
+    async def __aenter__(self) -> "AsyncAPI":
+        self._start_token_manager()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Cancel the background token renewal, if any, and close the underlying HTTP
+        client and its connections, or the transport given instead.
+        """
+        if self.token_manager is not None:
+            self.token_manager.stop()
+        if self.transport is not None:
+            await self.transport.close()
+        elif self.http_session is not None:
+            await self.http_session.aclose()
+
+    @property
+    def version(self) -> int:
+        """
+        Get the API version of IX-API, as resolved by :py:meth:`.AsyncAPI.get_version()`.
+        """
+        if self._version is None:
+            raise RuntimeError("API version is not known yet, await AsyncAPI.get_version() first")
+        return self._version
+
+    async def get_version(self) -> int:
+        """
+        Resolve the API version of IX-API and cache it for the lifetime of the instance.
+        """
+        if self._version is None:
+            self._version = self._set_version(await self._request(self.url).get_version())
+        return self._version
+
+    async def account(self) -> Account:
+        """
+        Get the authenticated user's own account.
+
+        Available in IX-API 2 or newer.
+        """
+        return async_model(Account)(await self._request(cat(self.url, "account"))._make_call(), self, self.accounts)
+
+    async def authenticate(self) -> AsyncRecord | None:
+        """
+        Authenticate and generate a pair of tokens.
+
+        See :py:meth:`.API.authenticate()`. Concurrent calls are serialised: tasks
+        waiting for an authentication in progress find valid tokens once it is done and
+        do not issue another request.
+        """
+        # Access token still valid, no need for re-auth
+        if self.access_token and not self.access_token.is_expired:
+            return None
+
+        async with self._async_auth_lock:
+            if self.access_token and not self.access_token.is_expired:
+                return None
+            # Refresh token still valid, prolong auth with it
+            if self.refresh_token and not self.refresh_token.is_expired:
+                return await self._refresh_tokens(self.refresh_token)
+
+            return await self._request_tokens()
+
+    async def _authenticate_with_credentials(self) -> AsyncRecord:
+        async with self._async_auth_lock:
+            return await self._request_tokens()
+
+    async def _request_tokens(self) -> AsyncRecord:
+        # Callers must hold the authentication lock, which is not reentrant
+        r = await self._request(cat(self.url, "auth", "token"), token=None, reauth=None).post(
+            data={"api_key": self.key, "api_secret": self.secret}
+        )
+        return self._set_tokens(r)
+
+    async def _refresh_tokens(self, refresh_token: Token) -> AsyncRecord:
+        # Callers must hold the authentication lock, which is not reentrant
+        r = await self._request(cat(self.url, "auth", "refresh"), token=refresh_token, reauth=None).post(
+            data={"refresh_token": refresh_token.encoded}
+        )
+        return self._set_tokens(r)
+
+    async def _renew_tokens(self) -> AsyncRecord:
+        """
+        Renew the tokens pair, refreshing it when possible and authenticating again
+        with the API key and secret otherwise.
+
+        The caller must hold the authentication lock.
+        """
+        if self.refresh_token and not self.refresh_token.is_expired:
+            try:
+                return await self._refresh_tokens(self.refresh_token)
+            except RequestError:
+                pass
+        return await self._request_tokens()
+
+    async def _renew_after_unauthorized(self, failed_token: Token | None) -> Token | None:
+        """
+        Renew the tokens pair after ``failed_token`` was rejected and return the access
+        token to replay the call with.
+
+        See :py:meth:`.API._renew_after_unauthorized()`.
+        """
+        async with self._async_auth_lock:
+            if self.access_token is failed_token:
+                await self._renew_tokens()
+            return self.access_token
+
+    async def refresh_authentication(self) -> AsyncRecord:
+        """
+        Prolong authentication by refreshing the tokens pair.
+
+        Tasks calling this method while a refresh is in progress wait for it and share
+        its result instead of refreshing the pair again.
+        """
+        refresh_token = self.refresh_token
+        if not refresh_token:
+            raise ValueError("No refresh token available to refresh authentication")
+
+        async with self._async_auth_lock:
+            if self.refresh_token is not refresh_token and self._auth_record is not None:
+                # Refreshed by another task while waiting for the lock
+                return self._auth_record
+
+            return await self._refresh_tokens(refresh_token)
+
+    async def extensions(self) -> list[dict[str, Any]]:
+        """
+        Get the list of extensions supported by the IX-API implementation.
+
+        Available in IX-API 2 or newer.
+        """
+        return await self._request(cat(self.url, "extensions"))._make_call()
+
+    async def health(self) -> dict[str, Any]:
+        """
+        Get the health information from IX-API.
+
+        Available in IX-API 2 or newer.
+        """
+        if await self.get_version() == 1:
+            return {}
+
+        return await self._request(self.url).get_health()
+
+    async def implementation(self) -> dict[str, Any]:
+        """
+        Get implementation details of the IX-API server.
+
+        Available in IX-API 2 or newer.
+        """
+        return await self._request(cat(self.url, "implementation"))._make_call()
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any
+
+from pyixapi.core.response import get_return
+
+if TYPE_CHECKING:
+    from pyixapi.core.endpoint import AsyncEndpoint, BaseEndpoint, Endpoint
+    from pyixapi.core.response import AsyncRecord, Record
+
+
+class BaseBatcher(object):
+    """
+    Shared state of :py:class:`.Batcher` and :py:class:`.AsyncBatcher`, which collect
+    the lookups of single objects by ID and send them in bulk.
+
+    :param window: (float, optional) Seconds to wait for other lookups, None to wait
+        for an explicit flush.
+    :param max_size: (int) Maximum number of IDs in a batch.
+    """
+
+    def __init__(self, window: float | None = 0.005, max_size: int = 500) -> None:
+        if max_size < 1:
+            raise ValueError("Batches must hold at least 1 ID")
+
+        self.window = window
+        self.max_size = max_size
+        self._pending: dict[str, tuple[Any, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _add(self, endpoint: BaseEndpoint, key: Any, future_class: Any) -> tuple[Any, bool]:
+        """
+        Queue a lookup, returning its future and whether its batch is full.
+        """
+        key = str(get_return(key))
+        with self._lock:
+            _, futures = self._pending.setdefault(endpoint.url, (endpoint, {}))
+            if key not in futures:
+                futures[key] = future_class()
+            return futures[key], len(futures) >= self.max_size
+
+    def _take(self, url: str | None = None) -> list[tuple[Any, dict[str, Any]]]:
+        """
+        Remove the pending batches, or only the one of the endpoint at ``url``.
+        """
+        with self._lock:
+            if url is not None:
+                batch = self._pending.pop(url, None)
+                return [batch] if batch is not None else []
+            batches = list(self._pending.values())
+            self._pending.clear()
+            return batches
+
+
+class Batcher(BaseBatcher):
+    """
+    Collect the lookups of single objects by ID and send them in bulk.
+
+    When a batcher is given to an API, :py:meth:`.Endpoint.get()` calls made with an ID
+    wait up to ``window`` seconds for other lookups on the same endpoint, then all the
+    IDs looked up in the meantime are fetched with one
+    :py:meth:`.Endpoint.get_many()` call and each caller receives its own record. An
+    ID looked up several times in a batch is only fetched once.
+
+    With a ``window`` of None, lookups are queued with :py:meth:`.Batcher.load()` until
+    :py:meth:`.Batcher.flush()` is called or a lookup waits for its result. A batch is
+    also sent as soon as it holds ``max_size`` IDs.
+
+    :param window: (float, optional) Seconds to wait for other lookups, None to wait
+        for an explicit flush.
+    :param max_size: (int) Maximum number of IDs in a batch.
+
+    :Example:
+
+    >>> ixapi = pyixapi.api(url, key, secret, batcher=Batcher(window=0.005))
+    >>> with ThreadPoolExecutor() as executor:
+    ...     connections = list(executor.map(ixapi.connections.get, connection_ids))
+    """
+
+    def __init__(self, window: float | None = 0.005, max_size: int = 500) -> None:
+        super().__init__(window=window, max_size=max_size)
+        self._timer: threading.Timer | None = None
+
+    def load(self, endpoint: Endpoint, key: Any) -> Future[Record | None]:
+        """
+        Queue the lookup of the object of ``endpoint`` with the ID ``key``.
+
+        :returns: Future of the record, None if the object does not exist.
+        """
+        future, full = self._add(endpoint, key, Future)
+        if full:
+            self._send(self._take(endpoint.url))
+        elif self.window is not None:
+            with self._lock:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.window, self.flush)
+                    self._timer.name = "pyixapi-batcher"
+                    self._timer.daemon = True
+                    self._timer.start()
+        return future
+
+    def get(self, endpoint: Endpoint, key: Any) -> Record | None:
+        """
+        Look up the object of ``endpoint`` with the ID ``key`` and wait for it.
+        """
+        future = self.load(endpoint, key)
+        if self.window is None:
+            self.flush()
+        return future.result()
+
+    def flush(self) -> None:
+        """
+        Send all the pending lookups now.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self._send(self._take())
+
+    def _send(self, batches: list[tuple[Any, dict[str, Any]]]) -> None:
+        for endpoint, futures in batches:
+            try:
+                records = endpoint.get_many(futures)
+            except Exception as e:
+                for future in futures.values():
+                    future.set_exception(e)
+            else:
+                for key, future in futures.items():
+                    future.set_result(records.get(key))
+
+
+class AsyncBatcher(BaseBatcher):
+    """
+    Asynchronous counterpart of :py:class:`.Batcher`, used by :py:class:`.AsyncAPI`.
+
+    Lookups are collected in the running event loop and batches are sent by a task.
+
+    :Example:
+
+    >>> ixapi = pyixapi.async_api(url, key, secret, batcher=AsyncBatcher())
+    >>> connections = await asyncio.gather(*(ixapi.connections.get(i) for i in connection_ids))
+    """
+
+    def __init__(self, window: float | None = 0.005, max_size: int = 500) -> None:
+        super().__init__(window=window, max_size=max_size)
+        self._task: asyncio.Task[None] | None = None
+
+    def load(self, endpoint: AsyncEndpoint, key: Any) -> asyncio.Future[AsyncRecord | None]:
+        """
+        Queue the lookup of the object of ``endpoint`` with the ID ``key``.
+
+        See :py:meth:`.Batcher.load()`.
+        """
+        loop = asyncio.get_running_loop()
+        future, full = self._add(endpoint, key, loop.create_future)
+        if full:
+            loop.create_task(self._send_async(self._take(endpoint.url)))
+        elif self.window is not None and self._task is None:
+            self._task = loop.create_task(self._flush_later(self.window))
+        return future
+
+    async def get(self, endpoint: AsyncEndpoint, key: Any) -> AsyncRecord | None:
+        """
+        Look up the object of ``endpoint`` with the ID ``key`` and wait for it.
+        """
+        future = self.load(endpoint, key)
+        if self.window is None:
+            await self.flush()
+        return await future
+
+    async def _flush_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._task = None
+        await self._send_async(self._take())
+
+    async def flush(self) -> None:
+        """
+        Send all the pending lookups now.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self._send_async(self._take())
+
+    async def _send_async(self, batches: list[tuple[Any, dict[str, Any]]]) -> None:
+        async def send(endpoint: AsyncEndpoint, futures: dict[str, Any]) -> None:
+            try:
+                records = await endpoint.get_many(futures)
+            except Exception as e:
+                for future in futures.values():
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for key, future in futures.items():
+                    if not future.done():
+                        future.set_result(records.get(key))
+
+        await asyncio.gather(*(send(endpoint, futures) for endpoint, futures in batches))
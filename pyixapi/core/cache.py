@@ -0,0 +1,586 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, ClassVar, NamedTuple
+
+from pyixapi.core.timeseries import Timeseries, format_timestamp, parse_timestamp
+
+if TYPE_CHECKING:
+    from pyixapi.core.response import BaseRecord
+
+# Endpoints describing the catalog of an IXP, which rarely changes, and the number of
+# seconds their responses are kept by default
+CATALOG_TTLS: dict[str, float] = {
+    "facilities": 3600,
+    "pops": 3600,
+    "metro-areas": 3600,
+    "metro-area-networks": 3600,
+    "availability-zones": 3600,
+    "product-offerings": 3600,
+}
+
+
+def cache_scope(key: str | None) -> str:
+    """
+    Return the scope of the cached responses of an API authenticated with the API key
+    ``key``, a digest of the key so that it is not stored in clear.
+    """
+    return hashlib.sha256(key.encode()).hexdigest() if key else ""
+
+
+class ResponseCache(object):
+    """
+    In-memory cache of the responses of GET calls made through endpoints.
+
+    Only the endpoints with a TTL are cached, each response being kept for the TTL of
+    its endpoint. The number of responses is bounded by ``maxsize``, the least recently
+    used ones being evicted first. Cached responses of an endpoint are dropped when an
+    object is created, saved or deleted through it.
+
+    Responses are copied when stored and returned, so records built from a cached
+    response can be modified freely. The :py:attr:`hits` and :py:attr:`misses`
+    counters tell how many calls were saved. Responses are also keyed by a ``scope``
+    derived from the credentials of the API, see :py:func:`cache_scope`, so that APIs
+    authenticated as different accounts can share a cache without seeing each other's
+    responses.
+
+    :param ttls: (dict, optional) Number of seconds the responses of each endpoint,
+        given by name, are kept. Defaults to :py:data:`.CATALOG_TTLS`.
+    :param maxsize: (int) Maximum number of responses kept.
+
+    :Example:
+
+    >>> cache = ResponseCache(ttls={**CATALOG_TTLS, "connections": 60})
+    >>> ixapi = pyixapi.api(url, key, secret, cache=cache)
+    >>> facilities = list(ixapi.facilities.all())
+    >>> facilities = list(ixapi.facilities.all())
+    >>> cache.hits, cache.misses
+    (1, 1)
+    """
+
+    MISSING: ClassVar[object] = object()
+
+    def __init__(self, ttls: dict[str, float] | None = None, maxsize: int = 256) -> None:
+        self.ttls = dict(CATALOG_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str, str, str], tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, name: str) -> float | None:
+        """
+        Number of seconds the responses of the endpoint ``name`` are kept, None if they
+        are not cached.
+        """
+        return self.ttls.get(name)
+
+    def _key(self, name: str, url: str, params: dict[str, Any] | None, scope: str) -> tuple[str, str, str, str]:
+        return (name, scope, url, json.dumps(params or {}, sort_keys=True, default=str))
+
+    def get(self, name: str, url: str, params: dict[str, Any] | None = None, scope: str = "") -> Any:
+        """
+        Return a copy of the cached response of a call, or :py:attr:`MISSING`.
+        """
+        key = self._key(name, url, params, scope)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return self.MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def set(self, name: str, url: str, value: Any, params: dict[str, Any] | None = None, scope: str = "") -> None:
+        """
+        Store the response of a call, if its endpoint is cached.
+        """
+        ttl = self.ttl_for(name)
+        if ttl is None:
+            return
+
+        key = self._key(name, url, params, scope)
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, name: str) -> None:
+        """
+        Drop the cached responses of the endpoint ``name``.
+        """
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == name]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Drop all cached responses and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class SQLiteCache(ResponseCache):
+    """
+    Persistent cache of the responses of GET calls, stored in an SQLite database.
+
+    It behaves like :py:class:`.ResponseCache` but responses outlive the process, so
+    that short-lived programs started repeatedly, such as cron jobs, do not download the
+    catalog again on each start. Several processes and threads can share the same
+    database: it is opened in WAL mode, waiting up to ``timeout`` seconds for the locks
+    held by other writers, with one connection per thread.
+
+    Responses are keyed by URL, which includes the API URL and the endpoint, query
+    parameters and the scope of the credentials of the API. They are stored as JSON and
+    expire after the TTL of their endpoint. As responses hold the data of an account,
+    the database is created readable by its owner only.
+    ``max_age``, when given, bounds the age of the responses used whatever their TTL,
+    e.g. to ignore responses written by a job configured with longer TTLs. At most
+    ``maxsize`` responses are kept, the least recently used ones being evicted first.
+
+    :param path: (str, optional) Path of the database file, defaults to
+        ``pyixapi/responses.sqlite3`` in the user cache directory.
+    :param ttls: (dict, optional) Number of seconds the responses of each endpoint,
+        given by name, are kept. Defaults to :py:data:`.CATALOG_TTLS`.
+    :param maxsize: (int) Maximum number of responses kept.
+    :param max_age: (float, optional) Maximum age, in seconds, of the responses used.
+    :param timeout: (float) Number of seconds to wait for a lock on the database.
+    """
+
+    # Version of the layout of the database, older databases being rebuilt
+    SCHEMA_VERSION: ClassVar[int] = 1
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttls: dict[str, float] | None = None,
+        maxsize: int = 10000,
+        max_age: float | None = None,
+        timeout: float = 5.0,
+    ) -> None:
+        super().__init__(ttls=ttls, maxsize=maxsize)
+        self.path = path or self.default_path()
+        self.max_age = max_age
+        self.timeout = timeout
+        self._local = threading.local()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), mode=0o700, exist_ok=True)
+        # Journals are created by SQLite with the permissions of the database
+        os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600))
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            if connection.execute("PRAGMA user_version").fetchone()[0] < self.SCHEMA_VERSION:
+                # Responses stored without a scope cannot be told apart, drop them
+                connection.execute("DROP TABLE IF EXISTS responses")
+                connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "name TEXT NOT NULL, scope TEXT NOT NULL, url TEXT NOT NULL, params TEXT NOT NULL, "
+                "value TEXT NOT NULL, stored_at REAL NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+                "PRIMARY KEY (name, scope, url, params))"
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def default_path() -> str:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return os.path.join(base, "pyixapi", "responses.sqlite3")
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute(f"PRAGMA busy_timeout = {int(self.timeout * 1000)}")
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, name: str, url: str, params: dict[str, Any] | None = None, scope: str = "") -> Any:
+        """
+        Return the cached response of a call, or :py:attr:`MISSING`.
+        """
+        key = self._key(name, url, params, scope)
+        now = time.time()
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT value, stored_at, expires_at FROM responses "
+            "WHERE name = ? AND scope = ? AND url = ? AND params = ?",
+            key,
+        ).fetchone()
+        if row is None or row[2] < now or (self.max_age is not None and row[1] + self.max_age < now):
+            with self._lock:
+                self.misses += 1
+            return self.MISSING
+
+        connection.execute(
+            "UPDATE responses SET accessed_at = ? WHERE name = ? AND scope = ? AND url = ? AND params = ?", (now, *key)
+        )
+        with self._lock:
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, name: str, url: str, value: Any, params: dict[str, Any] | None = None, scope: str = "") -> None:
+        """
+        Store the response of a call, if its endpoint is cached.
+        """
+        ttl = self.ttl_for(name)
+        if ttl is None:
+            return
+
+        now = time.time()
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (*self._key(name, url, params, scope), json.dumps(value), now, now + ttl, now),
+            )
+            connection.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+            connection.execute(
+                "DELETE FROM responses WHERE rowid IN "
+                "(SELECT rowid FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def invalidate(self, name: str) -> None:
+        """
+        Drop the cached responses of the endpoint ``name``.
+        """
+        self._connection().execute("DELETE FROM responses WHERE name = ?", (name,))
+
+    def clear(self) -> None:
+        """
+        Drop all cached responses and reset the counters.
+        """
+        self._connection().execute("DELETE FROM responses")
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        """
+        Close the database connection of the calling thread.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+class Validated(NamedTuple):
+    """
+    Parsed content of a response along with the validators to revalidate it.
+    """
+
+    etag: str | None
+    last_modified: str | None
+    content: Any
+
+
+class ConditionalCache(object):
+    """
+    Cache of the validators of GET responses, to make conditional calls.
+
+    The ``ETag`` and ``Last-Modified`` headers of GET responses are kept along with
+    their parsed content. The next call to the same URL, with the same parameters,
+    sends them back as ``If-None-Match`` and ``If-Modified-Since`` headers. When the
+    server answers with a ``304 Not Modified``, the kept content is returned without
+    downloading nor decoding it again. At most ``maxsize`` responses are kept, the
+    least recently used ones being evicted first.
+
+    Kept content is handed out without a deep copy: records copy the lists and dicts
+    they build from it, so only the top-level list or dict is copied. Values returned
+    by calls made with a conditional cache must therefore not be changed in place.
+
+    The :py:attr:`hits` counter tells how many calls were answered with a 304 and the
+    :py:attr:`misses` counter how many were sent without validators or with outdated
+    ones. Like in a :py:class:`ResponseCache`, responses are keyed by the ``scope`` of
+    the credentials of the API so that different accounts can share a cache.
+
+    :param maxsize: (int) Maximum number of responses kept.
+
+    :Example:
+
+    >>> ixapi = pyixapi.api(url, key, secret, conditional_cache=ConditionalCache())
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str, str], Validated] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _key(self, url: str, params: dict[str, Any] | None, scope: str) -> tuple[str, str, str]:
+        return (scope, url, json.dumps(params or {}, sort_keys=True, default=str))
+
+    def get(self, url: str, params: dict[str, Any] | None = None, scope: str = "") -> Validated | None:
+        """
+        Return the validators and content kept for a call, if any.
+        """
+        key = self._key(url, params, scope)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, url: str, r: Any, content: Any, params: dict[str, Any] | None = None, scope: str = "") -> None:
+        """
+        Keep the content of a response if it has validators.
+        """
+        headers = getattr(r, "headers", None) or {}
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        key = self._key(url, params, scope)
+        with self._lock:
+            if not etag and not last_modified:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = Validated(etag, last_modified, copy.copy(content))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def headers(self, entry: Validated) -> dict[str, str]:
+        """
+        Build the headers making a call conditional on the validators of ``entry``.
+        """
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def revalidated(self, entry: Validated | None, r: Any) -> Any:
+        """
+        Return a shallow copy of the content of ``entry`` if the response ``r`` tells it
+        has not changed, or :py:attr:`.ResponseCache.MISSING`.
+        """
+        with self._lock:
+            if entry is None or r.status_code != 304:
+                self.misses += 1
+                return ResponseCache.MISSING
+            self.hits += 1
+        return copy.copy(entry.content)
+
+    def clear(self) -> None:
+        """
+        Drop all kept responses and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class TimeseriesCache(object):
+    """
+    Cache of the statistics timeseries of objects, split into buckets of time.
+
+    Past statistics never change: once a bucket is closed, ``settle`` seconds after its
+    end, its samples are kept for good. Typed timeseries calls given a ``start``, such
+    as ``port.statistics_timeseries("5m", typed=True, start=...)``, then only fetch the
+    closed buckets which are not cached yet, and the open trailing window, and merge
+    them with the cached buckets. Buckets are keyed by API URL and account, object, path
+    of the timeseries, which holds the aggregate, and the other query parameters, so
+    that APIs sharing a cache do not see the samples of each other. At most ``maxsize``
+    buckets are kept, the least recently used ones being evicted first.
+
+    The :py:attr:`hits` and :py:attr:`misses` counters tell how many buckets were
+    found in the cache and how many had to be fetched.
+
+    :param bucket: (float) Seconds covered by each bucket, buckets being aligned on the
+        epoch.
+    :param settle: (float) Seconds after the end of a bucket before its samples are
+        considered final.
+    :param maxsize: (int) Maximum number of buckets kept.
+
+    :Example:
+
+    >>> ixapi = pyixapi.api(url, key, secret, timeseries_cache=TimeseriesCache())
+    >>> port = ixapi.ports.get("PORT-001")
+    >>> week = port.statistics_timeseries("5m", typed=True, start="2024-01-01T00:00:00Z")
+    >>> # Only the last hour or so is fetched again
+    >>> week = port.statistics_timeseries("5m", typed=True, start="2024-01-01T00:00:00Z")
+    """
+
+    def __init__(self, bucket: float = 3600, settle: float = 900, maxsize: int = 100000) -> None:
+        if bucket <= 0:
+            raise ValueError(f"Buckets must cover a positive number of seconds, not {bucket}")
+
+        self.bucket = bucket
+        self.settle = settle
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[Any, ...], Timeseries] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, record: BaseRecord, sub_path: str, params: dict[str, Any]) -> tuple[str, ...]:
+        """
+        Return the key of the timeseries at ``sub_path`` of ``record``.
+        """
+        others = {k: v for k, v in params.items() if k not in ("start", "end")}
+        return (
+            record.api.url,
+            record.api.cache_scope,
+            record.endpoint.name,
+            str(record.id),
+            sub_path,
+            json.dumps(others, sort_keys=True, default=str),
+        )
+
+    def plan(
+        self, key: tuple[str, ...], start: float, end: float | None = None, now: float | None = None
+    ) -> tuple[list[Timeseries], list[tuple[float, float | None]]]:
+        """
+        Return the cached buckets of a timeseries from ``start`` to ``end``, and the
+        windows to fetch: consecutive closed buckets which are not cached, then the
+        open window until ``end``, None meaning until now.
+        """
+        now = time.time() if now is None else now
+        closed = now - self.settle
+        until = now if end is None else end
+        cached: list[Timeseries] = []
+        windows: list[tuple[float, float | None]] = []
+        start_of = start - start % self.bucket
+        with self._lock:
+            while start_of < until and start_of + self.bucket <= closed:
+                entry = self._entries.get((*key, start_of))
+                if entry is not None:
+                    self._entries.move_to_end((*key, start_of))
+                    self.hits += 1
+                    cached.append(entry)
+                elif windows and windows[-1][1] == start_of:
+                    self.misses += 1
+                    windows[-1] = (windows[-1][0], start_of + self.bucket)
+                else:
+                    self.misses += 1
+                    windows.append((start_of, start_of + self.bucket))
+                start_of += self.bucket
+        if start_of < until:
+            windows.append((max(start_of, start), end))
+        return cached, windows
+
+    def store(
+        self, key: tuple[str, ...], timeseries: Timeseries, start: float, end: float | None, now: float | None = None
+    ) -> None:
+        """
+        Keep the closed buckets of a timeseries fetched from ``start`` to ``end``.
+        """
+        now = time.time() if now is None else now
+        until = min(now - self.settle, math.inf if end is None else end)
+        start_of = start - start % self.bucket
+        if start_of < start:
+            start_of += self.bucket
+        with self._lock:
+            while start_of + self.bucket <= until:
+                self._entries[(*key, start_of)] = timeseries.window(start_of, start_of + self.bucket)
+                self._entries.move_to_end((*key, start_of))
+                start_of += self.bucket
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _window(self, params: dict[str, Any]) -> tuple[float, float | None]:
+        end = params.get("end")
+        return parse_timestamp(params["start"]), None if end is None else parse_timestamp(end)
+
+    def _params(self, params: dict[str, Any], window: tuple[float, float | None]) -> dict[str, Any]:
+        start, end = window
+        params = {**params, "start": format_timestamp(start)}
+        if end is not None:
+            params["end"] = format_timestamp(end)
+        return params
+
+    def _combine(
+        self,
+        key: tuple[str, ...],
+        cached: list[Timeseries],
+        windows: list[tuple[float, float | None]],
+        fetched: list[Timeseries],
+        start: float,
+        end: float | None,
+    ) -> Timeseries:
+        for (window_start, window_end), timeseries in zip(windows, fetched):
+            self.store(key, timeseries, window_start, window_end)
+        parts = cached + fetched
+        if not parts:
+            return Timeseries([], {})
+        return parts[0].merge(*parts[1:]).window(start, end)
+
+    def fetch(
+        self, key: tuple[str, ...], params: dict[str, Any], fetch: Callable[[dict[str, Any]], Timeseries]
+    ) -> Timeseries:
+        """
+        Return the timeseries asked for with ``params``, calling ``fetch`` with the
+        parameters of each window which is not cached.
+        """
+        start, end = self._window(params)
+        cached, windows = self.plan(key, start, end)
+        fetched = [fetch(self._params(params, window)) for window in windows]
+        return self._combine(key, cached, windows, fetched, start, end)
+
+    async def fetch_async(
+        self,
+        key: tuple[str, ...],
+        params: dict[str, Any],
+        fetch: Callable[[dict[str, Any]], Awaitable[Timeseries]],
+    ) -> Timeseries:
+        """
+        Asynchronous counterpart of :py:meth:`fetch`, the windows being fetched
+        concurrently.
+        """
+        start, end = self._window(params)
+        cached, windows = self.plan(key, start, end)
+        fetched = list(await asyncio.gather(*(fetch(self._params(params, window)) for window in windows)))
+        return self._combine(key, cached, windows, fetched, start, end)
+
+    def clear(self) -> None:
+        """
+        Drop all cached buckets and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,104 @@
+import json
+from typing import Any
+
+
+class JSONCodec(object):
+    """
+    Encode and decode the JSON bodies of calls, with the standard library ``json``
+    module.
+
+    Codecs decode straight from the bytes of response bodies and encode request bodies
+    to bytes, saving the intermediate ``str`` that ``requests`` builds otherwise.
+    Subclasses use faster third-party libraries, see :py:func:`.get_codec()`.
+    """
+
+    name = "json"
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode a JSON document, raising ``ValueError`` if it is invalid.
+        """
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object to a UTF-8 JSON document.
+        """
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    JSON codec using ``orjson``.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+
+class UjsonCodec(JSONCodec):
+    """
+    JSON codec using ``ujson``.
+    """
+
+    name = "ujson"
+
+    def __init__(self) -> None:
+        import ujson
+
+        self._ujson = ujson
+
+    def loads(self, data: bytes) -> Any:
+        return self._ujson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+CODECS: dict[str, type[JSONCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+    JSONCodec.name: JSONCodec,
+}
+
+
+def get_codec(codec: "str | JSONCodec" = "auto") -> JSONCodec:
+    """
+    Return the JSON codec named ``codec``.
+
+    With ``auto``, the fastest codec available is returned: ``orjson`` if installed,
+    then ``ujson``, falling back to the standard library ``json`` module.
+
+    :param codec: (str or JSONCodec) Name of the codec, ``auto``, or a codec instance
+        which is returned as is.
+    :raises: ValueError if the codec is unknown.
+    :raises: ImportError if the library of the codec is not installed.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+
+    if codec == "auto":
+        for codec_class in CODECS.values():
+            try:
+                return codec_class()
+            except ImportError:
+                continue
+
+    if codec not in CODECS:
+        raise ValueError(f"Unknown JSON codec '{codec}', expected one of: auto, {', '.join(CODECS)}")
+    try:
+        return CODECS[codec]()
+    except ImportError as e:
+        raise ImportError(
+            f"{codec} is required to use the '{codec}' JSON codec, install it with: pip install {codec}"
+        ) from e
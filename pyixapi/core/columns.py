@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from itertools import chain
+from operator import itemgetter, methodcaller
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from pyixapi.core.response import BaseRecord
+
+# Fields holding one of a few values in every model
+CATEGORY_FIELDS = ("state", "type")
+
+# Column types, with their Arrow and pandas equivalents
+ARROW_TYPES = {"int": "int64", "float": "float64", "bool": "bool_", "string": "string"}
+PANDAS_TYPES = {"category": "category", "int": "Int64", "float": "Float64", "bool": "boolean", "string": "string"}
+
+
+def column_types(model: type[BaseRecord]) -> dict[str, str]:
+    """
+    Return the types of the columns of the objects of ``model``.
+
+    IDs, references and states are categories, other types being declared in the
+    :py:attr:`.Record.column_types` of the model.
+    """
+    return {
+        "id": "category",
+        **{field: "category" for field in CATEGORY_FIELDS},
+        **{field: "category" for field in model.references},
+        **model.column_types,
+    }
+
+
+def _column(rows: list[dict[str, Any]], key: str) -> list[Any]:
+    try:
+        return list(map(itemgetter(key), rows))
+    except KeyError:
+        # Some objects do not have the field
+        return list(map(methodcaller("get", key), rows))
+
+
+def _add_column(columns: dict[str, list[Any]], name: str, values: list[Any], flatten: bool) -> None:
+    kinds = set(map(type, values))
+    kinds.discard(type(None))
+    if flatten and kinds == {dict}:
+        nested = [v or {} for v in values]
+        keys = dict.fromkeys(chain.from_iterable(nested))
+        for key in keys:
+            _add_column(columns, f"{name}.{key}", _column(nested, key), flatten)
+        if keys:
+            return
+    columns[name] = values
+
+
+def to_columns(
+    rows: Iterable[dict[str, Any]], fields: Iterable[str] = (), flatten: bool = True
+) -> dict[str, list[Any]]:
+    """
+    Turn objects decoded from JSON into columns, one list of values per field.
+
+    Each column is extracted from all the objects at once. Fields missing from some
+    objects hold None for them. With ``flatten``, fields holding dicts are replaced
+    with one column per member, named ``field.member``, e.g. ``vlan_config.vlan``.
+
+    :param fields: (list, optional) Fields to extract, all the fields found otherwise.
+    """
+    rows = rows if isinstance(rows, list) else list(rows)
+    names = dict.fromkeys(fields or chain.from_iterable(rows))
+    columns: dict[str, list[Any]] = {}
+    for name in names:
+        _add_column(columns, name, _column(rows, name), flatten)
+    return columns
+
+
+def to_arrow(columns: dict[str, list[Any]], types: dict[str, str]) -> Any:
+    """
+    Return a ``pyarrow.Table`` of the columns, converted to the given types.
+
+    Categories are dictionary encoded. Columns which cannot be converted to their type,
+    or to an Arrow type at all, are kept as strings.
+    """
+    import pyarrow as pa
+
+    def array(values: list[Any], kind: str | None) -> Any:
+        try:
+            if kind in ARROW_TYPES:
+                return pa.array(values, type=getattr(pa, ARROW_TYPES[kind])())
+            result = pa.array(values)
+            if kind == "category" and pa.types.is_string(result.type):
+                return result.dictionary_encode()
+            return result
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+    return pa.table({name: array(values, types.get(name)) for name, values in columns.items()})
+
+
+def to_pandas(columns: dict[str, list[Any]], types: dict[str, str]) -> Any:
+    """
+    Return a ``pandas.DataFrame`` of the columns, converted to the given types.
+
+    Integers and booleans use the nullable pandas types. Columns which cannot be
+    converted to their type are kept as objects.
+    """
+    import pandas as pd
+
+    def series(values: list[Any], kind: str | None) -> Any:
+        if kind in PANDAS_TYPES:
+            try:
+                return pd.Series(values, dtype=PANDAS_TYPES[kind])
+            except (TypeError, ValueError):
+                pass
+        return pd.Series(values, dtype=object)
+
+    return pd.DataFrame({name: series(values, types.get(name)) for name, values in columns.items()})
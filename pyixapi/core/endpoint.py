@@ -1,25 +1,42 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterable
+from urllib.parse import quote
 
-from pyixapi.core.query import Request, RequestError
-from pyixapi.core.response import Record, RecordSet
+from pyixapi.core.query import AsyncRequest, Request, RequestError
+from pyixapi.core.response import (
+    AsyncRecord,
+    AsyncRecordSet,
+    BaseRecord,
+    Record,
+    RecordMap,
+    RecordSet,
+    async_model,
+    build_record,
+    compact_model,
+    get_return,
+)
 from pyixapi.core.util import cat
 
 if TYPE_CHECKING:
-    from pyixapi.core.api import API
+    from pyixapi.core.api import API, AsyncAPI, BaseAPI
+    from pyixapi.core.pagination import Pagination
 
 
-class Endpoint(object):
+class BaseEndpoint(object):
     """
-    Represent actions available on endpoints in the IX-API.
-
-    Build the correct URL to make queries and the proper :py:class:`.Response`
-    object.
+    URL, model and helpers shared by :py:class:`.Endpoint` and
+    :py:class:`.AsyncEndpoint`.
     """
 
-    def __init__(self, api: API, name: str, model: type[Record] | None = None) -> None:
-        self.return_obj: type[Record] = model if model else Record
+    return_obj: type[BaseRecord]
+
+    def __init__(self, api: BaseAPI, name: str, model: type[BaseRecord] | None = None) -> None:
+        self.return_obj = model if model else Record
+        if api.compact_records:
+            self.return_obj = compact_model(self.return_obj)
         self.api = api
         self.url = cat(api.url, name)
         self.name = name
@@ -27,37 +44,117 @@ class Endpoint(object):
     def __str__(self) -> str:
         return self.url
 
-    def all(self) -> RecordSet:
+    def _invalidate_cache(self) -> None:
+        """
+        Drop the cached responses of this endpoint, after one of its objects changed.
+        """
+        if self.api.cache is not None:
+            self.api.cache.invalidate(self.name)
+
+    def _pagination(self, pagination: Pagination | None, stream: bool = False) -> Pagination | None:
+        """
+        Tell how to page a list call, the API pagination applying unless streaming.
+        """
+        if pagination is None and not stream:
+            return self.api.pagination
+        return pagination
+
+    def _chunk_ids(self, ids: Iterable[Any], max_url_length: int) -> tuple[list[str], list[list[str]]]:
+        """
+        Deduplicate IDs and split them into chunks small enough for the URL of a call
+        filtering on all the IDs of a chunk to stay under ``max_url_length``.
+        """
+        unique = list(dict.fromkeys(str(get_return(i)) for i in ids))
+
+        available = max_url_length - len(self.url) - len("?id=")
+        chunks: list[list[str]] = []
+        length = 0
+        for i in unique:
+            encoded = len(quote(i, safe=""))
+            if chunks and length + len("%2C") + encoded <= available:
+                chunks[-1].append(i)
+                length += len("%2C") + encoded
+            else:
+                chunks.append([i])
+                length = encoded
+        return unique, chunks
+
+    def _record_map(self, ids: list[str], results: list[list[Any]]) -> RecordMap:
+        found = {str(record.id): record for records in results for record in records}
+        records = {i: found[i] for i in ids if i in found}
+        return RecordMap(records, missing=[i for i in ids if i not in found])
+
+
+class Endpoint(BaseEndpoint):
+    """
+    Represent actions available on endpoints in the IX-API.
+
+    Build the correct URL to make queries and the proper :py:class:`.Response`
+    object.
+    """
+
+    api: API
+    return_obj: type[Record]
+
+    def _request(self, **kwargs: Any) -> Request:
+        return self.api._request(
+            self.url, cache=self.api.cache, cache_name=self.name, cache_scope=self.api.cache_scope, **kwargs
+        )
+
+    def all(
+        self, stream: bool = False, pagination: Pagination | None = None, prefetch: Iterable[str] | None = None
+    ) -> RecordSet:
         """
         Return all objects from an endpoint.
+
+        :param stream: (bool) Parse the response while it is received, yielding each
+            object as soon as it is complete instead of loading the whole list first.
+        :param pagination: (Pagination, optional) Fetch the list page by page, instead
+            of the pagination of the API.
+        :param prefetch: (list, optional) Fields whose referenced objects are fetched
+            in bulk, see :py:meth:`.RecordSet.prefetch()`.
         """
-        r = Request(
-            base=self.url,
-            token=self.api.access_token,
-            http_session=self.api.http_session,
-            user_agent=self.api.user_agent,
-            proxies=self.api.proxies,
+        return RecordSet(
+            self,
+            self._request(),
+            stream=stream,
+            pagination=self._pagination(pagination, stream),
+            prefetch=prefetch,
         )
-        return RecordSet(self, r)
 
-    def filter(self, *args: Any, **kwargs: Any) -> RecordSet:
+    def filter(
+        self,
+        *args: Any,
+        stream: bool = False,
+        pagination: Pagination | None = None,
+        prefetch: Iterable[str] | None = None,
+        **kwargs: Any,
+    ) -> RecordSet:
         """
         Query the list of a given endpoint. Also take named arguments that match the
         usable filters on a given endpoint.
+
+        :param stream: (bool) Parse the response while it is received, see
+            :py:meth:`.Endpoint.all()`.
+        :param pagination: (Pagination, optional) Fetch the list page by page, see
+            :py:meth:`.Endpoint.all()`.
+        :param prefetch: (list, optional) Fields whose referenced objects are fetched
+            in bulk, see :py:meth:`.RecordSet.prefetch()`.
         """
-        r = Request(
-            filters=kwargs,
-            base=self.url,
-            token=self.api.access_token,
-            http_session=self.api.http_session,
-            user_agent=self.api.user_agent,
-            proxies=self.api.proxies,
+        return RecordSet(
+            self,
+            self._request(filters=kwargs),
+            stream=stream,
+            pagination=self._pagination(pagination, stream),
+            prefetch=prefetch,
         )
-        return RecordSet(self, r)
 
     def get(self, *args: Any, **kwargs: Any) -> Record | None:
         """
         Return a single object from an endpoint.
+
+        When the API has a :py:class:`.Batcher`, an object looked up by ID is fetched
+        along with the other objects looked up at about the same time.
         """
 
         try:
@@ -65,6 +162,9 @@ class Endpoint(object):
         except IndexError:
             key = None
 
+        if key and not kwargs and self.api.batcher is not None:
+            return self.api.batcher.get(self, key)
+
         if not key:
             response = self.filter(**kwargs)
             value = next(response, None)
@@ -80,14 +180,7 @@ class Endpoint(object):
             except StopIteration:
                 return value
 
-        r = Request(
-            key=key,
-            base=self.url,
-            token=self.api.access_token,
-            http_session=self.api.http_session,
-            user_agent=self.api.user_agent,
-            proxies=self.api.proxies,
-        )
+        r = self._request(key=key)
         try:
             return next(RecordSet(self, r), None)
         except RequestError as e:
@@ -96,6 +189,30 @@ class Endpoint(object):
             else:
                 raise e
 
+    def _get_chunk(self, chunk: list[str]) -> list[Record]:
+        return list(self.filter(id=",".join(chunk)))
+
+    def get_many(self, ids: Iterable[Any], max_url_length: int = 2048, max_workers: int = 4) -> RecordMap:
+        """
+        Return the objects of an endpoint matching a list of IDs.
+
+        IDs are looked up with ``filter(id=...)`` calls, each one given as many IDs as
+        fit in a URL of ``max_url_length`` characters, up to ``max_workers`` calls
+        running concurrently.
+
+        :param ids: (iterable) IDs of the objects, or records.
+        :param max_url_length: (int) Maximum length of the URL of a call.
+        :param max_workers: (int) Maximum number of calls running at the same time.
+        :returns: :py:class:`.RecordMap` of the objects found, keyed by ID.
+        """
+        unique, chunks = self._chunk_ids(ids, max_url_length)
+        if len(chunks) <= 1 or max_workers <= 1:
+            results = [self._get_chunk(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                results = list(executor.map(self._get_chunk, chunks))
+        return self._record_map(unique, results)
+
     def create(self, *args: Any, **kwargs: Any) -> Record:
         """
         Creates an object on an endpoint.
@@ -103,12 +220,113 @@ class Endpoint(object):
         Allows for the creation of new objects on an endpoint. Named arguments are
         converted to JSON properties, and a single object is created.
         """
-        req = Request(
-            base=self.url,
-            token=self.api.access_token,
-            http_session=self.api.http_session,
-            user_agent=self.api.user_agent,
-            proxies=self.api.proxies,
-        ).post(args[0] if args else kwargs)
+        req = self._request().post(args[0] if args else kwargs)
+        self._invalidate_cache()
+
+        return build_record(self, req)
+
+
+class AsyncEndpoint(BaseEndpoint):
+    """
+    Asynchronous counterpart of :py:class:`.Endpoint`, used by :py:class:`.AsyncAPI`.
+
+    :py:meth:`.AsyncEndpoint.all()` and :py:meth:`.AsyncEndpoint.filter()` return an
+    :py:class:`.AsyncRecordSet` to be consumed with ``async for``, other methods are
+    coroutines.
+    """
+
+    api: AsyncAPI
+    return_obj: type[AsyncRecord]
+
+    def __init__(self, api: AsyncAPI, name: str, model: type[Record] | None = None) -> None:
+        super().__init__(api, name, model=async_model(model if model else Record))
+
+    def _request(self, **kwargs: Any) -> AsyncRequest:
+        return self.api._request(
+            self.url, cache=self.api.cache, cache_name=self.name, cache_scope=self.api.cache_scope, **kwargs
+        )
+
+    def all(self, pagination: Pagination | None = None, prefetch: Iterable[str] | None = None) -> AsyncRecordSet:
+        """
+        Return all objects from an endpoint.
+
+        See :py:meth:`.Endpoint.all()`.
+        """
+        return AsyncRecordSet(self, self._request(), pagination=self._pagination(pagination), prefetch=prefetch)
+
+    def filter(
+        self, *args: Any, pagination: Pagination | None = None, prefetch: Iterable[str] | None = None, **kwargs: Any
+    ) -> AsyncRecordSet:
+        """
+        Query the list of a given endpoint. Also take named arguments that match the
+        usable filters on a given endpoint.
+
+        See :py:meth:`.Endpoint.filter()`.
+        """
+        return AsyncRecordSet(
+            self, self._request(filters=kwargs), pagination=self._pagination(pagination), prefetch=prefetch
+        )
+
+    async def get(self, *args: Any, **kwargs: Any) -> AsyncRecord | None:
+        """
+        Return a single object from an endpoint.
+
+        See :py:meth:`.Endpoint.get()`.
+        """
+        try:
+            key = args[0]
+        except IndexError:
+            key = None
+
+        if key and not kwargs and self.api.batcher is not None:
+            return await self.api.batcher.get(self, key)
+
+        if not key:
+            response = self.filter(**kwargs)
+            value = await anext(response, None)
+            if not value:
+                return value
+            try:
+                await anext(response)
+                raise ValueError(
+                    "get() returned more than one result. Check that the kwarg(s) "
+                    "passed are valid for this endpoint or use filter() or all() "
+                    "instead."
+                )
+            except StopAsyncIteration:
+                return value
+
+        r = self._request(key=key)
+        try:
+            return await anext(AsyncRecordSet(self, r), None)
+        except RequestError as e:
+            if e.req.status_code == 404:
+                return None
+            else:
+                raise e
+
+    async def _get_chunk_async(self, chunk: list[str], semaphore: asyncio.Semaphore) -> list[AsyncRecord]:
+        async with semaphore:
+            return [record async for record in self.filter(id=",".join(chunk))]
+
+    async def get_many(self, ids: Iterable[Any], max_url_length: int = 2048, max_workers: int = 4) -> RecordMap:
+        """
+        Return the objects of an endpoint matching a list of IDs.
+
+        See :py:meth:`.Endpoint.get_many()`, calls running as concurrent tasks.
+        """
+        unique, chunks = self._chunk_ids(ids, max_url_length)
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+        results = await asyncio.gather(*(self._get_chunk_async(chunk, semaphore) for chunk in chunks))
+        return self._record_map(unique, list(results))
+
+    async def create(self, *args: Any, **kwargs: Any) -> AsyncRecord:
+        """
+        Creates an object on an endpoint.
+
+        See :py:meth:`.Endpoint.create()`.
+        """
+        req = await self._request().post(args[0] if args else kwargs)
+        self._invalidate_cache()
 
-        return self.return_obj(req, self.api, self)
+        return build_record(self, req)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pyixapi.core.endpoint import BaseEndpoint
+    from pyixapi.core.response import BaseRecord
+
+
+class IdentityMap(object):
+    """
+    Registry of the records built by an API, so that each IX-API object is represented
+    by a single :py:class:`.Record` instance.
+
+    Records are keyed by :py:meth:`.Record.__key__()`, the name of their endpoint and
+    their ID. When an object is fetched again, the existing record is refreshed in place
+    with the new values instead of building another one, so every query returning the
+    object, and every cache or prefetch holding it, shares the same instance. Changes
+    made to a record and not saved yet are overwritten by such a refresh.
+
+    Records are only held weakly: a record nobody references anymore is dropped from
+    the map.
+
+    :Example:
+
+    >>> ixapi = pyixapi.api(url, key, secret, identity_map=IdentityMap())
+    >>> ixapi.connections.get("CONN-001") is next(ixapi.connections.filter(id="CONN-001"))
+    True
+    """
+
+    def __init__(self) -> None:
+        self._records: weakref.WeakValueDictionary[tuple[str, ...], BaseRecord] = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: tuple[str, ...]) -> bool:
+        return key in self._records
+
+    def get(self, key: tuple[str, ...]) -> BaseRecord | None:
+        """
+        Return the record with the given key, None if there is none.
+        """
+        return self._records.get(key)
+
+    def record(self, endpoint: BaseEndpoint, values: dict[str, Any]) -> BaseRecord:
+        """
+        Return the record of an object returned by ``endpoint``, refreshing the existing
+        one with ``values`` if there is one.
+        """
+        if not isinstance(values, dict) or values.get("id") is None:
+            return endpoint.return_obj(values, endpoint.api, endpoint)
+
+        key = (endpoint.name, values["id"])
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None and type(record) is endpoint.return_obj:
+                record._refresh(values)
+                return record
+            record = endpoint.return_obj(values, endpoint.api, endpoint)
+            self._records[key] = record
+            return record
+
+    def discard(self, record: BaseRecord) -> None:
+        """
+        Forget a record, e.g. after its object was deleted.
+        """
+        with self._lock:
+            if self._records.get(record.__key__()) is record:
+                del self._records[record.__key__()]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
@@ -0,0 +1,196 @@
+import asyncio
+import queue
+import threading
+from typing import Any, AsyncIterator, Iterator, TypeVar
+from urllib.parse import urljoin
+
+from requests.utils import parse_header_links
+
+T = TypeVar("T")
+
+# Next page to fetch: its URL and query parameters
+PageTarget = tuple[str, dict[str, Any]]
+
+
+class Pagination(object):
+    """
+    Strategy splitting a list call into several calls returning one page each.
+
+    IX-API lists are returned in a single JSON array but some implementations page
+    them. A pagination makes :py:class:`.RecordSet` go through all the pages
+    transparently, fetching up to ``prefetch`` pages in the background while the
+    records of the current page are being consumed. At most ``prefetch + 2`` pages are
+    held in memory: the pages waiting to be consumed, the page being consumed and the
+    page being fetched.
+
+    Subclasses tell which page to fetch first and which one follows a given page.
+
+    :param page_size: (int) Number of objects asked for each page.
+    :param prefetch: (int) Maximum number of pages fetched ahead of the page being
+        consumed, 0 to fetch pages only when they are needed.
+    """
+
+    def __init__(self, page_size: int = 100, prefetch: int = 1) -> None:
+        if page_size < 1 or prefetch < 0:
+            raise ValueError("Page size must be at least 1 and prefetch cannot be negative")
+
+        self.page_size = page_size
+        self.prefetch = prefetch
+
+    def first_page(self, url: str, params: dict[str, Any]) -> PageTarget:
+        """
+        Return the URL and parameters of the first page of the call to ``url``.
+        """
+        raise NotImplementedError
+
+    def next_page(self, url: str, params: dict[str, Any], items: list[Any], r: Any) -> PageTarget | None:
+        """
+        Return the URL and parameters of the page following the one fetched with
+        ``url`` and ``params``, whose response ``r`` contained ``items``, or None if it
+        was the last one.
+        """
+        raise NotImplementedError
+
+
+class LimitOffsetPagination(Pagination):
+    """
+    Pages selected with ``limit`` and ``offset`` query parameters, the last page being
+    the first one shorter than ``page_size``.
+
+    A page longer than ``page_size`` is also the last one: the server ignored the
+    parameters and returned the whole list, which would otherwise be fetched again
+    for each following offset.
+
+    :param limit_param: (str) Name of the parameter giving the size of a page.
+    :param offset_param: (str) Name of the parameter giving the index of the first
+        object of a page.
+
+    :Example:
+
+    >>> pagination = LimitOffsetPagination(page_size=500, prefetch=2)
+    >>> for ip in ixapi.ips.all(pagination=pagination):
+    ...     print(ip.address)
+    """
+
+    def __init__(
+        self, page_size: int = 100, prefetch: int = 1, limit_param: str = "limit", offset_param: str = "offset"
+    ) -> None:
+        super().__init__(page_size=page_size, prefetch=prefetch)
+        self.limit_param = limit_param
+        self.offset_param = offset_param
+
+    def first_page(self, url: str, params: dict[str, Any]) -> PageTarget:
+        return url, {**params, self.limit_param: self.page_size, self.offset_param: 0}
+
+    def next_page(self, url: str, params: dict[str, Any], items: list[Any], r: Any) -> PageTarget | None:
+        if len(items) != self.page_size:
+            return None
+        return url, {**params, self.offset_param: params[self.offset_param] + len(items)}
+
+
+class CursorPagination(Pagination):
+    """
+    Pages linked with the ``Link`` header of the responses, as described by RFC 8288,
+    the URL of the next page carrying the cursor selecting it.
+
+    :param limit_param: (str) Name of the parameter giving the size of a page.
+
+    :Example:
+
+    >>> ixapi = pyixapi.api(url, key, secret, pagination=CursorPagination(page_size=1000))
+    >>> for ip in ixapi.ips.all():
+    ...     print(ip.address)
+    """
+
+    def __init__(self, page_size: int = 100, prefetch: int = 1, limit_param: str = "limit") -> None:
+        super().__init__(page_size=page_size, prefetch=prefetch)
+        self.limit_param = limit_param
+
+    def first_page(self, url: str, params: dict[str, Any]) -> PageTarget:
+        return url, {**params, self.limit_param: self.page_size}
+
+    def next_page(self, url: str, params: dict[str, Any], items: list[Any], r: Any) -> PageTarget | None:
+        headers = getattr(r, "headers", None)
+        link = headers.get("Link") if headers else None
+        if not link:
+            return None
+        for value in parse_header_links(link):
+            if value.get("rel") == "next" and value.get("url"):
+                # The URL of the next page holds all of its parameters
+                return urljoin(url, value["url"]), {}
+        return None
+
+
+def prefetch(pages: Iterator[T], depth: int) -> Iterator[T]:
+    """
+    Iterate over ``pages`` in a background thread, staying up to ``depth`` pages ahead
+    of the consumer. Exceptions raised while fetching a page are raised to the consumer
+    when it reaches that page, and the thread stops once the iteration is closed.
+    """
+    fetched: queue.Queue[tuple[bool, Any]] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(done: bool, value: Any) -> bool:
+        # Wait for room in the queue unless the consumer is gone
+        while not stop.is_set():
+            try:
+                fetched.put((done, value), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run() -> None:
+        try:
+            for page in pages:
+                if not put(False, page):
+                    return
+        except Exception as e:
+            put(True, e)
+        else:
+            put(True, None)
+        finally:
+            close = getattr(pages, "close", None)
+            if close is not None:
+                close()
+
+    threading.Thread(target=run, name="pyixapi-prefetch", daemon=True).start()
+    try:
+        while True:
+            done, value = fetched.get()
+            if done:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        stop.set()
+
+
+async def prefetch_async(pages: AsyncIterator[T], depth: int) -> AsyncIterator[T]:
+    """
+    Iterate over ``pages`` in a background task, staying up to ``depth`` pages ahead of
+    the consumer. See :py:func:`.prefetch()`.
+    """
+    fetched: asyncio.Queue[tuple[bool, Any]] = asyncio.Queue(maxsize=depth)
+
+    async def run() -> None:
+        try:
+            async for page in pages:
+                await fetched.put((False, page))
+        except Exception as e:
+            await fetched.put((True, e))
+        else:
+            await fetched.put((True, None))
+
+    task = asyncio.get_running_loop().create_task(run())
+    try:
+        while True:
+            done, value = await fetched.get()
+            if done:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        task.cancel()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+MERGE_PATCH = "merge-patch"
+JSON_PATCH = "json-patch"
+
+# Media types of the PATCH bodies of each format
+CONTENT_TYPES = {
+    MERGE_PATCH: "application/merge-patch+json",
+    JSON_PATCH: "application/json-patch+json",
+}
+
+
+def check_patch_format(patch_format: str | None) -> str | None:
+    """
+    Return ``patch_format`` if it is None or a supported format, raise otherwise.
+    """
+    if patch_format is not None and patch_format not in CONTENT_TYPES:
+        raise ValueError(f"Unknown patch format {patch_format!r}, expected one of {', '.join(CONTENT_TYPES)}")
+    return patch_format
+
+
+def make_patch(old: dict[str, Any], new: dict[str, Any], patch_format: str | None = None) -> Any:
+    """
+    Return the body of a PATCH request changing the fields of ``old`` to their value in
+    ``new``, in the given format.
+
+    Without a format, the body holds the new value of each field.
+    """
+    if patch_format == MERGE_PATCH:
+        return merge_patch(old, new)
+    if patch_format == JSON_PATCH:
+        return json_patch(old, new)
+    return new
+
+
+def merge_patch(old: Any, new: Any) -> Any:
+    """
+    Return the RFC 7386 merge patch turning ``old`` into ``new``.
+
+    Nested dicts only hold the members which changed, members which were removed being
+    set to None. Any other value, including lists, is replaced as a whole. As in the
+    RFC, a member set to None cannot be told from a member removed.
+
+    :Example:
+
+    >>> merge_patch({"vlan_config": {"vlan": 10, "vlan_type": "dot1q"}}, {"vlan_config": {"vlan": 20}})
+    {'vlan_config': {'vlan_type': None, 'vlan': 20}}
+    """
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return new
+
+    patch = {k: None for k in old if k not in new}
+    for k, v in new.items():
+        if k not in old:
+            patch[k] = v
+        elif old[k] != v:
+            patch[k] = merge_patch(old[k], v)
+    return patch
+
+
+def _pointer(path: str, token: Any) -> str:
+    """
+    Append a reference token to an RFC 6901 JSON pointer.
+    """
+    return f"{path}/{str(token).replace('~', '~0').replace('/', '~1')}"
+
+
+def _list_patch(old: list[Any], new: list[Any], path: str) -> list[dict[str, Any]]:
+    # Leave out the elements the lists start and end with, then change the elements in
+    # between one by one, inserting or removing the ones in excess
+    start = 0
+    while start < min(len(old), len(new)) and old[start] == new[start]:
+        start += 1
+    end = 0
+    while end < min(len(old), len(new)) - start and old[-1 - end] == new[-1 - end]:
+        end += 1
+    old_middle, new_middle = old[start : len(old) - end], new[start : len(new) - end]
+
+    operations: list[dict[str, Any]] = []
+    for i, (o, n) in enumerate(zip(old_middle, new_middle)):
+        operations.extend(json_patch(o, n, _pointer(path, start + i)))
+    index = start + min(len(old_middle), len(new_middle))
+    for i, n in enumerate(new_middle[len(old_middle) :]):
+        operations.append({"op": "add", "path": _pointer(path, index + i), "value": n})
+    # Each removal shifts the following elements, so the same index is removed again
+    operations.extend({"op": "remove", "path": _pointer(path, index)} for _ in old_middle[len(new_middle) :])
+    return operations
+
+
+def json_patch(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """
+    Return the RFC 6902 JSON patch turning ``old`` into ``new``.
+
+    Dicts are compared member by member and lists element by element, insertions and
+    removals being detected at any position. A list is replaced as a whole when it is
+    shorter than the operations changing it.
+
+    :param path: (str) JSON pointer of the values, prepended to the paths of the
+        operations.
+
+    :Example:
+
+    >>> json_patch({"ips": ["IP-1", "IP-2"]}, {"ips": ["IP-1", "IP-3", "IP-2"]})
+    [{'op': 'add', 'path': '/ips/1', 'value': 'IP-3'}]
+    """
+    if old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        operations = [{"op": "remove", "path": _pointer(path, k)} for k in old if k not in new]
+        for k, v in new.items():
+            if k not in old:
+                operations.append({"op": "add", "path": _pointer(path, k), "value": v})
+            else:
+                operations.extend(json_patch(old[k], v, _pointer(path, k)))
+        return operations
+
+    replace = [{"op": "replace", "path": path, "value": new}]
+    if isinstance(old, list) and isinstance(new, list):
+        operations = _list_patch(old, new, path)
+        if len(json.dumps(operations)) < len(json.dumps(replace)):
+            return operations
+    return replace
@@ -1,9 +1,18 @@
+import asyncio
 import json
-from typing import Any, Generator
+import time
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Generator, Iterator
 
 import requests
 
+from pyixapi.core.cache import ConditionalCache, ResponseCache, Validated
+from pyixapi.core.codec import JSONCodec
+from pyixapi.core.pagination import Pagination, prefetch, prefetch_async
+from pyixapi.core.ratelimit import RateLimiter
+from pyixapi.core.retry import Attempt, Retry
+from pyixapi.core.stream import iter_json_items
 from pyixapi.core.token import Token
+from pyixapi.core.transport import HTTPXTransport, RequestsTransport
 from pyixapi.core.util import cat
 
 
@@ -52,35 +61,229 @@ class ContentError(Exception):
         return self.error
 
 
-class Request(object):
+class BaseRequest(object):
     """
-    Create requests to the IX-API.
+    Shared state and helpers of :py:class:`.Request` and :py:class:`.AsyncRequest`,
+    which make the calls.
 
-    Responsible for building the URL and making the HTTP(S) requests to the API.
+    Responsible for building the URL, headers and query parameters of the calls and
+    for processing their responses.
 
     :param base: (str) Base URL passed in api() instantiation.
     :param filters: (dict, optional) key/value pairs matching the filters an
         endpoint accepts, e.g. {"name": "test"} for /devices?name=test.
+    :param transport: (Transport, optional) Transport sending the HTTP requests,
+        defaults to a :py:class:`.RequestsTransport` over ``http_session``, or an
+        :py:class:`.HTTPXTransport` for asynchronous requests.
+    :param reauth: (callable, optional) Called with the rejected token when a call
+        fails with a 401, it returns a renewed token with which the call is replayed
+        once, or None to give up.
+    :param retry: (Retry, optional) Policy retrying calls which failed with a
+        transient error, every attempt being recorded in :py:attr:`attempts`.
+    :param rate_limiter: (RateLimiter, optional) Limiter to wait for before sending
+        each attempt of a call.
+    :param cache: (ResponseCache, optional) Cache of the responses of GET calls.
+    :param cache_name: (str, optional) Name of the endpoint the calls are made on,
+        telling how long the cache keeps their responses.
+    :param cache_scope: (str, optional) Scope of the credentials the calls are made
+        with, keeping apart the cached responses of different accounts.
+    :param conditional_cache: (ConditionalCache, optional) Cache of the validators of
+        GET responses, used to make conditional calls.
+    :param codec: (JSONCodec, optional) Codec decoding response bodies and encoding
+        request bodies, instead of the JSON handling of the transport.
     """
 
     def __init__(
         self,
         base: str,
-        http_session: requests.Session,
+        http_session: Any,
         filters: dict[str, Any] | None = None,
         key: str | None = None,
         token: Token | None = None,
         user_agent: str | None = None,
         proxies: dict[str, str] | None = None,
+        transport: Any = None,
+        reauth: Callable[[Token | None], Any] | None = None,
+        retry: Retry | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        cache_name: str | None = None,
+        cache_scope: str = "",
+        conditional_cache: ConditionalCache | None = None,
+        codec: JSONCodec | None = None,
     ) -> None:
         self.base = base
         self.filters = filters or None
         self.key = key
         self.token = token
         self.http_session = http_session
+        self.transport = transport if transport is not None else self._default_transport()
         self.url = self.base if not key else cat(self.base, key)
         self.user_agent = user_agent
         self.proxies = proxies
+        self.reauth = reauth
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.cache_name = cache_name
+        self.cache_scope = cache_scope
+        self.conditional_cache = conditional_cache
+        self.codec = codec
+        self.attempts: list[Attempt] = []
+
+    def _default_transport(self) -> Any:
+        raise NotImplementedError
+
+    def _prepare_call(
+        self,
+        verb: str = "get",
+        url_override: str | None = None,
+        add_params: dict[str, Any] | None = None,
+        data: Any = None,
+        content_type: str | None = None,
+    ) -> tuple[str, dict[str, str], dict[str, Any]]:
+        """
+        Build the URL, headers and query parameters of a call.
+        """
+        if verb in ("post", "put") or (verb == "delete" and data):
+            headers: dict[str, str] = {"Content-Type": "application/json;"}
+        else:
+            headers = {"accept": "application/json;"}
+        if content_type:
+            headers["Content-Type"] = content_type
+
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token.encoded}"
+
+        if self.user_agent:
+            headers["User-Agent"] = self.user_agent
+
+        params: dict[str, Any] = {}
+        if not url_override:
+            if self.filters:
+                params.update(self.filters)
+            if add_params:
+                params.update(add_params)
+
+        return url_override or self.url, headers, params
+
+    def _process_response(self, verb: str, r: Any) -> Any:
+        """
+        Turn the response of a call into its JSON content, or raise if it failed.
+        """
+        if verb == "delete":
+            if r.ok:
+                return True
+            else:
+                raise RequestError(r)
+        elif r.ok:
+            try:
+                return self._decode(r)
+            except ValueError:
+                raise ContentError(r)
+        else:
+            raise RequestError(r)
+
+    def _decode(self, r: Any) -> Any:
+        """
+        Decode the JSON content of a response, with the codec if there is one.
+        """
+        if self.codec is not None:
+            return self.codec.loads(r.content)
+        return r.json()
+
+    def _body(self, data: Any, headers: dict[str, str]) -> dict[str, Any]:
+        """
+        Build the arguments giving the body of a call to the transport, encoded with
+        the codec if there is one.
+        """
+        if self.codec is None or data is None:
+            return {"json": data}
+        headers.setdefault("Content-Type", "application/json")
+        return {"content": self.codec.dumps(data)}
+
+    def _cache_get(self, verb: str, url: str, params: dict[str, Any]) -> Any:
+        """
+        Return the cached response of a call, or ``ResponseCache.MISSING``.
+        """
+        if verb != "get" or self.cache is None or self.cache_name is None:
+            return ResponseCache.MISSING
+        if self.cache.ttl_for(self.cache_name) is None:
+            return ResponseCache.MISSING
+        return self.cache.get(self.cache_name, url, params, scope=self.cache_scope)
+
+    def _cache_set(self, verb: str, url: str, params: dict[str, Any], result: Any) -> Any:
+        if verb == "get" and self.cache is not None and self.cache_name is not None:
+            self.cache.set(self.cache_name, url, result, params, scope=self.cache_scope)
+        return result
+
+    def _make_conditional(
+        self, verb: str, url: str, params: dict[str, Any], headers: dict[str, str]
+    ) -> Validated | None:
+        """
+        Add the validators of the previous response of a GET call to its headers.
+        """
+        if verb != "get" or self.conditional_cache is None:
+            return None
+        validated = self.conditional_cache.get(url, params, scope=self.cache_scope)
+        if validated is not None:
+            headers.update(self.conditional_cache.headers(validated))
+        return validated
+
+    def _process_conditional(
+        self, verb: str, url: str, params: dict[str, Any], r: Any, validated: Validated | None
+    ) -> Any:
+        """
+        Process the response of a call, answering a 304 with the content previously
+        received and keeping the validators of GET responses.
+        """
+        if verb != "get" or self.conditional_cache is None:
+            return self._process_response(verb, r)
+
+        result = self.conditional_cache.revalidated(validated, r)
+        if result is ResponseCache.MISSING:
+            result = self._process_response(verb, r)
+            self.conditional_cache.set(url, r, result, params, scope=self.cache_scope)
+        return result
+
+    def _record_attempt(self, number: int, verb: str, url: str, r: Any, elapsed: float) -> float | None:
+        """
+        Record an attempt of a call and return the delay before retrying it, or None
+        if it must not be retried.
+        """
+        if self.retry is None:
+            return None
+
+        delay = self.retry.next_delay(verb, number, r)
+        attempt = Attempt(number, verb, url, r.status_code, elapsed, delay)
+        self.attempts.append(attempt)
+        if self.retry.on_attempt is not None:
+            self.retry.on_attempt(attempt)
+        return delay
+
+    def _set_token(self, headers: dict[str, str], token: Token) -> None:
+        """
+        Use a renewed token for this request and the headers of the call to replay.
+        """
+        self.token = token
+        headers["Authorization"] = f"Bearer {token.encoded}"
+
+
+class Request(BaseRequest):
+    """
+    Create requests to the IX-API.
+
+    Responsible for making the HTTP(S) requests to the API, see
+    :py:class:`.BaseRequest` for the parameters.
+    """
+
+    http_session: requests.Session
+
+    # Size of the chunks in which streamed response bodies are read
+    chunk_size = 65536
+
+    def _default_transport(self) -> Any:
+        return RequestsTransport(self.http_session)
 
     def get_version(self) -> int:
         """
@@ -103,9 +306,9 @@ class Request(object):
         headers: dict[str, str] = {"Content-Type": "application/json;"}
         if self.token:
             headers["Authorization"] = f"Bearer {self.token.encoded}"
-        r = self.http_session.get(cat(self.base, "health"), headers=headers)
+        r = self.transport.request("get", cat(self.base, "health"), headers=headers, proxies=self.proxies)
         if r.ok:
-            return r.json()
+            return self._decode(r)
         else:
             raise RequestError(r)
 
@@ -114,56 +317,136 @@ class Request(object):
         verb: str = "get",
         url_override: str | None = None,
         add_params: dict[str, Any] | None = None,
-        data: dict[str, Any] | None = None,
+        data: Any = None,
+        content_type: str | None = None,
     ) -> Any:
-        if verb in ("post", "put") or (verb == "delete" and data):
-            headers: dict[str, str] = {"Content-Type": "application/json;"}
-        else:
-            headers = {"accept": "application/json;"}
+        url, headers, params = self._prepare_call(verb, url_override, add_params, data, content_type)
 
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token.encoded}"
+        cached = self._cache_get(verb, url, params)
+        if cached is not ResponseCache.MISSING:
+            return cached
+        validated = self._make_conditional(verb, url, params, headers)
 
-        if self.user_agent:
-            headers["User-Agent"] = self.user_agent
+        r = self._call(verb, url, headers, params, data)
 
-        params: dict[str, Any] = {}
-        if not url_override:
-            if self.filters:
-                params.update(self.filters)
-            if add_params:
-                params.update(add_params)
+        return self._cache_set(verb, url, params, self._process_conditional(verb, url, params, r, validated))
 
-        r = getattr(self.http_session, verb)(
-            url_override or self.url,
-            headers=headers,
-            params=params,
-            json=data,
-            proxies=self.proxies,
-        )
+    def _call(
+        self, verb: str, url: str, headers: dict[str, str], params: dict[str, Any], data: Any, stream: bool = False
+    ) -> Any:
+        """
+        Send a call, retrying it according to the retry policy, and return the response.
+        """
+        number = 1
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            start = time.perf_counter()
+            r = self._send(verb, url, headers, params, data, stream=stream)
+            delay = self._record_attempt(number, verb, url, r, time.perf_counter() - start)
+            if delay is None:
+                return r
+            if stream:
+                r.close()
+            time.sleep(delay)
+            number += 1
+
+    def _stream_call(self, add_params: dict[str, Any] | None = None) -> Generator[Any, None, None]:
+        """
+        Make a GET call and yield the items of the JSON array it returns, as they are
+        received. Responses are never cached since they are not read in full.
+        """
+        url, headers, params = self._prepare_call("get", add_params=add_params)
 
-        if verb == "delete":
-            if r.ok:
-                return True
-            else:
-                raise RequestError(r)
-        elif r.ok:
-            try:
-                return r.json()
-            except json.JSONDecodeError:
-                raise ContentError(r)
-        else:
+        r = self._call("get", url, headers, params, None, stream=True)
+        if not r.ok:
             raise RequestError(r)
+        try:
+            yield from iter_json_items(r.iter_content(chunk_size=self.chunk_size))
+        except json.JSONDecodeError:
+            raise ContentError(r)
+        finally:
+            r.close()
 
-    def get(self, add_params: dict[str, Any] | None = None) -> Generator[dict[str, Any], None, None]:
+    def _pages(self, pagination: Pagination, add_params: dict[str, Any] | None = None) -> Iterator[list[Any]]:
+        """
+        Make a GET call for each page of a list and yield the items of each page.
+        Responses are never cached since they only hold a part of the list.
+        """
+        url, headers, params = self._prepare_call("get", add_params=add_params)
+
+        target = pagination.first_page(url, params)
+        while target is not None:
+            page_url, page_params = target
+            r = self._call("get", page_url, headers, page_params, None)
+            items = self._process_response("get", r)
+            if not isinstance(items, list):
+                items = [items]
+            target = pagination.next_page(page_url, page_params, items, r)
+            yield items
+
+    def _send(
+        self, verb: str, url: str, headers: dict[str, str], params: dict[str, Any], data: Any, stream: bool = False
+    ) -> Any:
+        """
+        Send a call, replaying it once with a renewed token if it is unauthorised.
+        """
+        kwargs: dict[str, Any] = {"stream": True} if stream else {}
+        kwargs.update(self._body(data, headers))
+        r = self.transport.request(verb, url, headers=headers, params=params, proxies=self.proxies, **kwargs)
+
+        if r.status_code == 401 and self.reauth is not None:
+            token = self.reauth(self.token)
+            if token is not None:
+                if stream:
+                    r.close()
+                self._set_token(headers, token)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                r = self.transport.request(verb, url, headers=headers, params=params, proxies=self.proxies, **kwargs)
+
+        return r
+
+    def get(
+        self, add_params: dict[str, Any] | None = None, stream: bool = False, pagination: Pagination | None = None
+    ) -> Generator[dict[str, Any], None, None]:
         """
         Make a GET request to IX-API.
 
+        With ``stream``, the response body is parsed while it is received and items are
+        yielded as soon as they are complete, :py:attr:`count` being only set once all
+        of them were yielded.
+
+        With ``pagination``, the list is fetched one page after the other, the next
+        pages being fetched in the background while the items of the current one are
+        yielded. :py:attr:`count` is only set once all of them were yielded.
+
         :raises: RequestError if req.ok returns false.
         :raises: ContentError if response is not JSON.
 
         :Returns: List of `Response` objects returned from the endpoint.
         """
+        if stream and pagination is not None:
+            raise ValueError("Streaming and pagination cannot be combined")
+
+        if stream:
+            count = 0
+            for i in self._stream_call(add_params=add_params):
+                count += 1
+                yield i
+            self.count = count
+            return
+
+        if pagination is not None:
+            pages = self._pages(pagination, add_params=add_params)
+            if pagination.prefetch:
+                pages = prefetch(pages, pagination.prefetch)
+            count = 0
+            for page in pages:
+                count += len(page)
+                yield from page
+            self.count = count
+            return
 
         req = self._make_call(add_params=add_params)
         if isinstance(req, list):
@@ -212,17 +495,19 @@ class Request(object):
         """
         return self._make_call(verb="delete", data=data)
 
-    def patch(self, data: dict[str, Any]) -> dict[str, Any]:
+    def patch(self, data: Any, content_type: str | None = None) -> dict[str, Any]:
         """
         Make a PATCH request to IX-API.
 
         :param data: (dict) Contains a dict that will be turned into a JSON object and
-            sent to the API.
+            sent to the API, or a list of operations for a JSON patch.
+        :param content_type: (str, optional) Media type of the body, such as
+            ``application/merge-patch+json``.
         :raises: RequestError if req.ok returns false.
         :raises: ContentError if response is not JSON.
         :returns: Dict containing the response from IX-API.
         """
-        return self._make_call(verb="patch", data=data)
+        return self._make_call(verb="patch", data=data, content_type=content_type)
 
     def options(self) -> dict[str, Any]:
         """
@@ -234,3 +519,191 @@ class Request(object):
         :returns: Dict containing the response fromIX-API.
         """
         return self._make_call(verb="options")
+
+
+class AsyncRequest(BaseRequest):
+    """
+    Create asynchronous requests to the IX-API.
+
+    Behave like :py:class:`.Request` but every method issuing an HTTP request is a
+    coroutine. The transport must be asynchronous, it defaults to a
+    :py:class:`.HTTPXTransport` over ``http_session`` which is then expected to be an
+    ``httpx.AsyncClient``.
+    """
+
+    def _default_transport(self) -> Any:
+        return HTTPXTransport(self.http_session)
+
+    async def get_version(self) -> int:
+        """
+        Get the API version of IX-API.
+
+        See :py:meth:`.Request.get_version()`.
+        """
+        try:
+            return int((await self.get_health())["version"])
+        except RequestError:
+            return 1
+
+    async def get_health(self) -> dict[str, Any]:
+        """
+        Get the health from /api/health endpoint in IX-API.
+        """
+        headers: dict[str, str] = {"Content-Type": "application/json;"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token.encoded}"
+        r = await self.transport.request("get", cat(self.base, "health"), headers=headers, proxies=self.proxies)
+        if r.ok:
+            return self._decode(r)
+        else:
+            raise RequestError(r)
+
+    async def _make_call(
+        self,
+        verb: str = "get",
+        url_override: str | None = None,
+        add_params: dict[str, Any] | None = None,
+        data: Any = None,
+        content_type: str | None = None,
+    ) -> Any:
+        url, headers, params = self._prepare_call(verb, url_override, add_params, data, content_type)
+
+        cached = self._cache_get(verb, url, params)
+        if cached is not ResponseCache.MISSING:
+            return cached
+        validated = self._make_conditional(verb, url, params, headers)
+
+        r = await self._call(verb, url, headers, params, data)
+
+        return self._cache_set(verb, url, params, self._process_conditional(verb, url, params, r, validated))
+
+    async def _call(
+        self, verb: str, url: str, headers: dict[str, str], params: dict[str, Any], data: Any, stream: bool = False
+    ) -> Any:
+        """
+        Send a call, retrying it according to the retry policy, and return the response.
+
+        See :py:meth:`.Request._call()`, waiting without blocking the event loop. Bodies
+        are always read in full, so there is no stream to release between attempts.
+        """
+        number = 1
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            start = time.perf_counter()
+            r = await self._send(verb, url, headers, params, data, stream=stream)
+            delay = self._record_attempt(number, verb, url, r, time.perf_counter() - start)
+            if delay is None:
+                return r
+            await asyncio.sleep(delay)
+            number += 1
+
+    async def _send(
+        self, verb: str, url: str, headers: dict[str, str], params: dict[str, Any], data: Any, stream: bool = False
+    ) -> Any:
+        """
+        Send a call, replaying it once with a renewed token if it is unauthorised.
+        """
+        kwargs: dict[str, Any] = {"stream": True} if stream else {}
+        kwargs.update(self._body(data, headers))
+        r = await self.transport.request(verb, url, headers=headers, params=params, proxies=self.proxies, **kwargs)
+
+        if r.status_code == 401 and self.reauth is not None:
+            token = await self.reauth(self.token)
+            if token is not None:
+                self._set_token(headers, token)
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async()
+                r = await self.transport.request(
+                    verb, url, headers=headers, params=params, proxies=self.proxies, **kwargs
+                )
+
+        return r
+
+    async def _pages(
+        self, pagination: Pagination, add_params: dict[str, Any] | None = None
+    ) -> AsyncIterator[list[Any]]:
+        """
+        Make a GET call for each page of a list and yield the items of each page.
+        """
+        url, headers, params = self._prepare_call("get", add_params=add_params)
+
+        target = pagination.first_page(url, params)
+        while target is not None:
+            page_url, page_params = target
+            r = await self._call("get", page_url, headers, page_params, None)
+            items = self._process_response("get", r)
+            if not isinstance(items, list):
+                items = [items]
+            target = pagination.next_page(page_url, page_params, items, r)
+            yield items
+
+    async def get(
+        self, add_params: dict[str, Any] | None = None, pagination: Pagination | None = None
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Make a GET request to IX-API.
+
+        See :py:meth:`.Request.get()`, the next pages being fetched in a background
+        task.
+        """
+        if pagination is not None:
+            pages = self._pages(pagination, add_params=add_params)
+            if pagination.prefetch:
+                pages = prefetch_async(pages, pagination.prefetch)
+            count = 0
+            async for page in pages:
+                count += len(page)
+                for i in page:
+                    yield i
+            self.count = count
+            return
+
+        req = await self._make_call(add_params=add_params)
+        if isinstance(req, list):
+            self.count = len(req)
+            for i in req:
+                yield i
+        else:
+            self.count = 1
+            yield req
+
+    async def put(self, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Make a PUT request to IX-API.
+
+        See :py:meth:`.Request.put()`.
+        """
+        return await self._make_call(verb="put", data=data)
+
+    async def post(self, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Make a POST request to IX-API.
+
+        See :py:meth:`.Request.post()`.
+        """
+        return await self._make_call(verb="post", data=data)
+
+    async def delete(self, data: dict[str, Any] | None = None) -> bool:
+        """
+        Make a DELETE request to IX-API.
+
+        See :py:meth:`.Request.delete()`.
+        """
+        return await self._make_call(verb="delete", data=data)
+
+    async def patch(self, data: Any, content_type: str | None = None) -> dict[str, Any]:
+        """
+        Make a PATCH request to IX-API.
+
+        See :py:meth:`.Request.patch()`.
+        """
+        return await self._make_call(verb="patch", data=data, content_type=content_type)
+
+    async def options(self) -> dict[str, Any]:
+        """
+        Make an OPTIONS request to IX-API.
+
+        See :py:meth:`.Request.options()`.
+        """
+        return await self._make_call(verb="options")
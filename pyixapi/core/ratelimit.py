@@ -0,0 +1,80 @@
+import asyncio
+import threading
+import time
+from typing import ClassVar
+from urllib.parse import urlsplit
+
+
+class RateLimiter(object):
+    """
+    Token bucket limiting the rate at which calls are sent.
+
+    The bucket holds up to ``burst`` tokens and is refilled at ``rate`` tokens per
+    second, each call taking one token. When the bucket is empty, a call reserves the
+    next token to be refilled and waits for it, so that callers are served in order and
+    the sustained rate never exceeds ``rate``.
+
+    A limiter is safe to use from several threads and event loops. It can be given to a
+    single API or shared by all the APIs pointing to the same host with
+    :py:meth:`.RateLimiter.for_host()`.
+
+    :param rate: (float) Sustained number of calls per second.
+    :param burst: (int) Number of calls which can be sent at once after being idle.
+
+    :Example:
+
+    >>> limiter = RateLimiter.for_host("https://api.de-cix.net/api/v2/", rate=5, burst=10)
+    >>> ixapi = pyixapi.api(url, key, secret, rate_limiter=limiter)
+    """
+
+    _shared: ClassVar[dict[str, "RateLimiter"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("Rate must be positive and burst at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_host(cls, url: str, rate: float, burst: int = 1) -> "RateLimiter":
+        """
+        Get the limiter shared by every caller of the host of ``url``, creating it with
+        ``rate`` and ``burst`` if there is none yet.
+        """
+        host = urlsplit(url).netloc
+        with cls._shared_lock:
+            if host not in cls._shared:
+                cls._shared[host] = cls(rate, burst=burst)
+            return cls._shared[host]
+
+    def reserve(self) -> float:
+        """
+        Take a token and return the number of seconds to wait before it is available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        """
+        Wait until a call can be sent.
+        """
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """
+        Wait until a call can be sent, without blocking the event loop.
+        """
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterable
+
+from pyixapi.core.timeseries import NAN, Timeseries
+
+if TYPE_CHECKING:
+    from pyixapi.core.response import AsyncRecord, BaseRecord, Record
+
+# Fields of the IX-API statistics holding the traffic in both directions
+TRAFFIC_FIELDS = ("average_bps_in", "average_bps_out")
+
+
+class Utilisation(object):
+    """
+    Traffic statistics of one object over the period of a report.
+
+    Each statistic is keyed by field, e.g. ``average_bps_in``. The object is ranked
+    by its busiest direction: :py:attr:`peak` is the highest percentile of its fields
+    and :py:attr:`utilisation` is that percentile as a fraction of its capacity.
+
+    :param record: (Record) Object the statistics are about.
+    :param capacity: (float) Capacity of the object in bits per second, NaN if unknown.
+    :param percentile: (dict) Percentile of the values of each field.
+    :param max: (dict) Highest value of each field.
+    :param mean: (dict) Mean value of each field.
+    :param time_above: (dict) Seconds during which each field was above the threshold
+        of the report, NaN if the capacity is unknown.
+    :param samples: (int) Number of samples.
+    """
+
+    def __init__(
+        self,
+        record: BaseRecord,
+        capacity: float,
+        percentile: dict[str, float],
+        max: dict[str, float],
+        mean: dict[str, float],
+        time_above: dict[str, float],
+        samples: int,
+    ) -> None:
+        self.record = record
+        self.capacity = capacity
+        self.percentile = percentile
+        self.max = max
+        self.mean = mean
+        self.time_above = time_above
+        self.samples = samples
+
+    def __repr__(self) -> str:
+        return f"<Utilisation {self.record}: {self.utilisation:.1%}>"
+
+    @property
+    def peak(self) -> float:
+        return max(self.percentile.values(), default=NAN)
+
+    @property
+    def utilisation(self) -> float:
+        if not self.capacity:
+            return NAN
+        return self.peak / self.capacity
+
+
+def capacity(record: BaseRecord) -> float:
+    """
+    Return the capacity of a port or connection in bits per second, from its ``speed``
+    in Mbit/s, NaN if it has none.
+    """
+    speed = getattr(record, "speed", None)
+    return speed * 1e6 if speed else NAN
+
+
+class BaseUtilisationReport(object):
+    """
+    Settings and computations shared by :py:class:`UtilisationReport` and
+    :py:class:`AsyncUtilisationReport`.
+    """
+
+    def __init__(
+        self,
+        aggregate: str = "5m",
+        fields: Iterable[str] = TRAFFIC_FIELDS,
+        percentile: float = 95,
+        threshold: float = 0.8,
+        max_workers: int = 8,
+        **params: Any,
+    ) -> None:
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, not {percentile}")
+
+        self.aggregate = aggregate
+        self.fields = tuple(fields)
+        self.percentile = percentile
+        self.threshold = threshold
+        self.max_workers = max_workers
+        self.params = params
+
+    def utilisation(self, record: BaseRecord, timeseries: Timeseries) -> Utilisation:
+        """
+        Return the utilisation of an object from its timeseries.
+        """
+        fields = [field for field in self.fields if field in timeseries.values]
+        limit = capacity(record) * self.threshold
+        return Utilisation(
+            record,
+            capacity(record),
+            {field: timeseries.percentile(self.percentile, field) for field in fields},
+            {field: timeseries.max(field) for field in fields},
+            {field: timeseries.mean(field) for field in fields},
+            {field: NAN if math.isnan(limit) else timeseries.time_above(field, limit) for field in fields},
+            len(timeseries),
+        )
+
+    @staticmethod
+    def rank(results: Iterable[Utilisation], top: int | None = None) -> list[Utilisation]:
+        """
+        Return the utilisations from the most utilised object to the least, objects
+        whose capacity is unknown coming last.
+
+        :param top: (int, optional) Number of objects to keep.
+        """
+        ranked = sorted(results, key=lambda u: -math.inf if math.isnan(u.utilisation) else u.utilisation, reverse=True)
+        return ranked[:top] if top is not None else ranked
+
+
+class UtilisationReport(BaseUtilisationReport):
+    """
+    Compute the utilisation of ports, connections or any object having statistics
+    timeseries, typically for 95th percentile billing and capacity planning.
+
+    The timeseries of the objects are fetched concurrently, up to ``max_workers`` at
+    the same time, then each one gives a :py:class:`Utilisation` with the percentile,
+    the highest and the mean value of each field, and the time spent above
+    ``threshold`` of the capacity of the object, computed over whole columns.
+
+    :param aggregate: (str) Aggregate of the timeseries, e.g. ``5m``.
+    :param fields: (list) Fields of the timeseries to compute statistics of.
+    :param percentile: (float) Percentile to compute, between 0 and 100.
+    :param threshold: (float) Fraction of the capacity above which an object is
+        considered busy.
+    :param max_workers: (int) Maximum number of timeseries fetched at the same time.
+    :param params: Query parameters of the timeseries calls, such as ``start`` and
+        ``end``.
+
+    :Example:
+
+    >>> report = UtilisationReport("5m", start="2024-01-01T00:00:00Z", end="2024-02-01T00:00:00Z")
+    >>> results = report.run(ixapi.ports.all())
+    >>> for result in UtilisationReport.rank(results, top=10):
+    ...     print(result.record, f"{result.utilisation:.1%}", result.percentile)
+    """
+
+    def _fetch(self, record: Record) -> Utilisation:
+        timeseries = record.statistics_timeseries(self.aggregate, typed=True, **self.params)
+        return self.utilisation(record, timeseries)
+
+    def run(self, records: Iterable[Record]) -> list[Utilisation]:
+        """
+        Fetch the timeseries of the objects and return their utilisation, in the order
+        of the objects.
+
+        :raises: RequestError if a timeseries cannot be fetched.
+        """
+        records = list(records)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(records) or 1))) as executor:
+            return list(executor.map(self._fetch, records))
+
+
+class AsyncUtilisationReport(BaseUtilisationReport):
+    """
+    Asynchronous counterpart of :py:class:`UtilisationReport`, the timeseries being
+    fetched as concurrent tasks.
+
+    :Example:
+
+    >>> results = await AsyncUtilisationReport("5m", max_workers=32).run(ixapi.ports.all())
+    """
+
+    async def _fetch_async(self, record: AsyncRecord, semaphore: asyncio.Semaphore) -> Utilisation:
+        async with semaphore:
+            timeseries = await record.statistics_timeseries(self.aggregate, typed=True, **self.params)
+        return self.utilisation(record, timeseries)
+
+    async def run(self, records: Any) -> list[Utilisation]:
+        """
+        Fetch the timeseries of the objects, given as an iterable or an asynchronous
+        iterable, and return their utilisation in the order of the objects.
+        """
+        if hasattr(records, "__aiter__"):
+            records = [record async for record in records]
+        semaphore = asyncio.Semaphore(max(1, self.max_workers))
+        return list(await asyncio.gather(*(self._fetch_async(record, semaphore) for record in records)))
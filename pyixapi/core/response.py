@@ -1,13 +1,48 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Iterator
+import asyncio
+import functools
+from typing import TYPE_CHECKING, Any, AsyncIterator, ClassVar, Iterable, Iterator, Sequence, overload
 
-from pyixapi.core.query import Request
-from pyixapi.core.util import Hashabledict, cat
+from pyixapi.core import columns
+from pyixapi.core.patch import CONTENT_TYPES, JSON_PATCH, check_patch_format, make_patch
+from pyixapi.core.timeseries import Timeseries
+from pyixapi.core.util import cat
 
 if TYPE_CHECKING:
-    from pyixapi.core.api import API
-    from pyixapi.core.endpoint import Endpoint
+    from pyixapi.core.api import API, AsyncAPI, BaseAPI
+    from pyixapi.core.endpoint import AsyncEndpoint, BaseEndpoint, Endpoint
+    from pyixapi.core.pagination import Pagination
+    from pyixapi.core.query import AsyncRequest, Request
+
+
+@functools.cache
+def _class_attributes(cls: type) -> frozenset[str]:
+    return frozenset(dir(cls))
+
+
+def _copy(value: Any) -> Any:
+    """
+    Copy the lists and dicts of a decoded JSON value, so that changing them in place
+    leaves the response untouched.
+    """
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
+
+
+def _serialize(value: Any) -> Any:
+    """
+    Return the JSON representation of an attribute value, records being replaced with
+    their ID.
+    """
+    if isinstance(value, BaseRecord):
+        value = value.serialize(nested=True)
+    if isinstance(value, list):
+        value = [v.id if isinstance(v, BaseRecord) else v for v in value]
+    return value
 
 
 def get_return(lookup: Any) -> Any:
@@ -17,12 +52,66 @@ def get_return(lookup: Any) -> Any:
     Used to return a "simple" representation of objects and collections sent to it via
     lookup. We check if it's a :py:class:`.Record`, if so simply return its ID.
     """
-    if isinstance(lookup, Record):
+    if isinstance(lookup, BaseRecord):
         return getattr(lookup, "id")
     else:
         return lookup
 
 
+@overload
+def build_record(endpoint: AsyncEndpoint, values: dict[str, Any]) -> AsyncRecord: ...
+
+
+@overload
+def build_record(endpoint: Endpoint, values: dict[str, Any]) -> Record: ...
+
+
+def build_record(endpoint: BaseEndpoint, values: dict[str, Any]) -> BaseRecord:
+    """
+    Build the record of an object returned by ``endpoint``, shared through the
+    :py:class:`.IdentityMap` of the API if it has one.
+    """
+    identity_map = endpoint.api.identity_map
+    if identity_map is None:
+        return endpoint.return_obj(values, endpoint.api, endpoint)
+    return identity_map.record(endpoint, values)
+
+
+def _check_references(model: type[BaseRecord], fields: Iterable[str]) -> None:
+    unknown = [field for field in fields if field not in model.references]
+    if unknown:
+        raise ValueError(f"{model.__name__} has no reference named {', '.join(unknown)}")
+
+
+def _reference_ids(records: Sequence[BaseRecord], fields: list[str]) -> dict[str, list[str]]:
+    """
+    Collect the IDs held by ``fields`` of ``records``, grouped by the name of the API
+    attribute giving the endpoint they belong to.
+    """
+    ids: dict[str, list[str]] = {}
+    for record in records:
+        for field in fields:
+            value = getattr(record, field, None)
+            values = value if isinstance(value, list) else [value]
+            ids.setdefault(record.references[field], []).extend(v for v in values if isinstance(v, str))
+    return ids
+
+
+def _attach_references(records: Sequence[BaseRecord], fields: list[str], resolved: dict[str, RecordMap]) -> None:
+    """
+    Replace the IDs held by ``fields`` of ``records`` with the resolved records, IDs
+    which were not found being kept as they are.
+    """
+    for record in records:
+        for field in fields:
+            found = resolved.get(record.references[field], {})
+            value = getattr(record, field, None)
+            if isinstance(value, list):
+                setattr(record, field, [found.get(v, v) if isinstance(v, str) else v for v in value])
+            elif isinstance(value, str):
+                setattr(record, field, found.get(value, value))
+
+
 class RecordSet(object):
     """
     Iterator containing :py:class:`.Record` objects.
@@ -58,23 +147,146 @@ class RecordSet(object):
     DXDB:PAS:000010
     DXDB:PAS:000011
     >>>
+
+    Streaming large lists, records being built as soon as their JSON is received,
+    which keeps memory usage flat whatever the size of the list:
+
+    >>> for ip in ixapi.ips.all(stream=True):
+    ...     print(ip.address)
+    ...
+
+    Going through the pages of a list, the next page being fetched while the records of
+    the current one are consumed:
+
+    >>> for ip in ixapi.ips.all(pagination=LimitOffsetPagination(page_size=500)):
+    ...     print(ip.address)
+    ...
+
+    Resolving the objects referenced by the records with one bulk call per endpoint,
+    instead of one call per reference:
+
+    >>> for config in ixapi.network_service_configs.all().prefetch("connection", "ips"):
+    ...     print(config.connection.name, [str(ip) for ip in config.ips])
+    ...
     """
 
-    def __init__(self, endpoint: Endpoint, request: Request, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        endpoint: Endpoint,
+        request: Request,
+        stream: bool = False,
+        pagination: Pagination | None = None,
+        prefetch: Iterable[str] | None = None,
+        **kwargs: Any,
+    ) -> None:
         self.endpoint = endpoint
         self.request = request
-        self.response = self.request.get()
+        self.stream = stream
+        self.pagination = pagination
+        self.prefetch_fields: list[str] = []
+        self._prefetched: Iterator[Record] | None = None
+        if prefetch:
+            self.prefetch(*prefetch)
+        if pagination is not None:
+            self.response = self.request.get(stream=stream, pagination=pagination)
+        else:
+            self.response = self.request.get(stream=True) if stream else self.request.get()
         self._response_cache: list[dict[str, Any]] = []
 
     def __iter__(self) -> Iterator[Record]:
         return self
 
+    def prefetch(self, *fields: str) -> RecordSet:
+        """
+        Resolve the objects referenced by ``fields`` of the records, declared in the
+        :py:attr:`.Record.references` of the model.
+
+        When the iteration starts, all the records are read and the IDs they reference
+        are fetched with one :py:meth:`.Endpoint.get_many()` call per endpoint. The IDs
+        are then replaced by the records, or kept when the object was not found.
+
+        :raises: ValueError if a field is not a reference.
+        :returns: This record set.
+        """
+        _check_references(self.endpoint.return_obj, fields)
+        self.prefetch_fields.extend(field for field in fields if field not in self.prefetch_fields)
+        return self
+
     def __next__(self) -> Record:
+        if self.prefetch_fields and self._prefetched is None:
+            records = []
+            while True:
+                try:
+                    records.append(self._next_record())
+                except StopIteration:
+                    break
+            ids = _reference_ids(records, self.prefetch_fields)
+            resolved = {name: getattr(self.endpoint.api, name).get_many(i) for name, i in ids.items()}
+            _attach_references(records, self.prefetch_fields, resolved)
+            self._prefetched = iter(records)
+        if self._prefetched is not None:
+            return next(self._prefetched)
+        return self._next_record()
+
+    def _next_record(self) -> Record:
         if self._response_cache:
-            return self.endpoint.return_obj(self._response_cache.pop(), self.endpoint.api, self.endpoint)
-        return self.endpoint.return_obj(next(self.response), self.endpoint.api, self.endpoint)
+            return build_record(self.endpoint, self._response_cache.pop())
+        return build_record(self.endpoint, next(self.response))
+
+    def _rows(self) -> list[dict[str, Any]]:
+        rows = self._response_cache + list(self.response)
+        self._response_cache = []
+        return rows
+
+    def to_columns(self, *fields: str, flatten: bool = True) -> dict[str, list[Any]]:
+        """
+        Return the fields of the objects as columns, one list of values per field.
+
+        The columns are built straight from the decoded JSON, with one bulk extraction
+        per field, without building any record; references are therefore left as IDs
+        and :py:meth:`.RecordSet.prefetch()` is ignored. Nested dicts are flattened into
+        one column per member, named ``field.member``. This consumes the record set.
+
+        :param fields: (str, optional) Fields to export, all of them otherwise.
+        :param flatten: (bool) Whether to flatten nested dicts.
+
+        :Example:
+
+        >>> columns = ixapi.ips.all().to_columns("address", "prefix_length")
+        >>> columns["prefix_length"][:3]
+        [24, 64, 64]
+        """
+        return columns.to_columns(self._rows(), fields, flatten=flatten)
+
+    def to_arrow(self, *fields: str, flatten: bool = True) -> Any:
+        """
+        Return the fields of the objects as a ``pyarrow.Table``, requiring the
+        ``arrow`` extra.
+
+        Columns are typed from the model, see :py:func:`.column_types()`: IDs,
+        references and states are dictionary encoded, and speeds, VLANs and other
+        integers are ``int64``. See :py:meth:`.RecordSet.to_columns()`.
+        """
+        data = self.to_columns(*fields, flatten=flatten)
+        return columns.to_arrow(data, columns.column_types(self.endpoint.return_obj))
+
+    def to_pandas(self, *fields: str, flatten: bool = True) -> Any:
+        """
+        Return the fields of the objects as a ``pandas.DataFrame``, requiring the
+        ``pandas`` extra.
+
+        Columns are typed from the model, see :py:func:`.column_types()`: IDs,
+        references and states are categoricals, and speeds, VLANs and other integers
+        are nullable ``Int64``. See :py:meth:`.RecordSet.to_columns()`.
+        """
+        data = self.to_columns(*fields, flatten=flatten)
+        return columns.to_pandas(data, columns.column_types(self.endpoint.return_obj))
 
     def __len__(self) -> int:
+        if self.stream:
+            raise TypeError("len() is not available on streamed record sets")
+        if self.pagination is not None:
+            raise TypeError("len() is not available on paginated record sets")
         try:
             return self.request.count
         except AttributeError:
@@ -85,83 +297,81 @@ class RecordSet(object):
             return self.request.count
 
 
-class Record(object):
+class RecordMap(dict):
     """
-    Create Python objects from IX-API responses.
+    Dictionary of :py:class:`.Record` objects keyed by ID.
 
-    Nested dicts that represent other endpoints are also turned into
-    :py:class:`.Record` objects (when the corresponding model declares them as a
-    class attribute). All fields are then assigned to the object's attributes.
+    Returned by :py:meth:`.Endpoint.get_many()`, the IDs which were asked for but not
+    found being listed in :py:attr:`missing`, in the order they were given.
 
-    Only the fields present in the response are set as attributes; accessing a
-    field that was not returned raises :py:exc:`AttributeError`.
+    :Example:
 
-    :examples:
-    Default representation of the object is usually its ID and/or name:
-    >>> x = ixapi.network_service_configs.get("DXDB:PAS:000001")
-    >>> x
-    DXDB:PAS:000001
-    >>>
+    >>> ips = ixapi.ips.get_many(["IP-001", "IP-002", "IP-404"])
+    >>> ips["IP-001"].address
+    '2001:db8::1'
+    >>> ips.missing
+    ['IP-404']
+    """
 
-    Querying a string field:
-    >>> x = ixapi.network_service_configs.get("DXDB:PAS:000001")
-    >>> x.type
-    'exchange_lan'
-    >>>
+    def __init__(self, records: Any = (), missing: list[str] | None = None) -> None:
+        super().__init__(records)
+        self.missing = missing or []
 
-    Casting the object as a dictionary:
-    >>> from pprint import pprint
-    >>> pprint(dict(x))
-    {'asns': [64500],
-     'capacity': 2500,
-     'connection': 'DXDB:NAS:000001',
-     'consuming_customer': 'DXDB:CUST:0001',
-     'contacts': [],
-     'contract_ref': None,
-     'external_ref': None,
-     'id': 'DXDB:PAS:000001',
-     'inner_vlan': 10,
-     'ips': ['DXDB:IPV6:00001', 'DXDB:IPV4:00001'],
-     'macs': ['DXDB:MAC:00001'],
-     'managing_customer': 'DXDB:CUST:0001',
-     'network_feature_configs': ['DXDB:RSAS:000001',
-                                 'DXDB:RSAS:000002',
-                                 'DXDB:RSAS:000003',
-                                 'DXDB:RSAS:000004'],
-     'network_service': 'DXDB:PS:00001',
-     'outer_vlan': 20,
-     'purchase_order': '',
-     'state': 'production',
-     'status': [],
-     'type': 'exchange_lan'}
-    >>>
 
-    Iterating over a :py:class:`.Record` object:
-    >>> for i in x:
-    ...  print(i)
-    ...
-    ('asns', [64500])
-    ('capacity', 200000)
-    ('connection', 'DXDB:NAS:00001')
-    >>>
+class BaseRecord(object):
+    """
+    Fields and change tracking shared by :py:class:`.Record` and
+    :py:class:`.AsyncRecord`, which make the calls.
     """
 
+    api: BaseAPI
+    endpoint: BaseEndpoint
+    # Model of the nested records which are not declared by the model
+    default_ret: type[BaseRecord]
     url: str | None = None
-
-    def __init__(self, values: dict[str, Any], api: API, endpoint: Endpoint) -> None:
-        self._init_cache: list[tuple[str, Any]] = []
-        self.api = api
-        self.default_ret: type[Record] = Record
-        self.endpoint = endpoint
+    # Fields holding the IDs of other objects, with the API attribute of their endpoint
+    references: ClassVar[dict[str, str]] = {}
+    # Types of the columns exported by RecordSet.to_columns(), besides IDs, references
+    # and states which are categories; nested fields are named "field.member"
+    column_types: ClassVar[dict[str, str]] = {}
+    # Fields of the response, mapped to their value
+    _fields: dict[str, Any] = {}
+    # Fields which were assigned, and fields holding a list or dict which may have been
+    # changed in place
+    _assigned: set[str] | None = None
+    _mutable: tuple[str, ...] = ()
+
+    def __init__(self, values: dict[str, Any], api: BaseAPI, endpoint: BaseEndpoint) -> None:
+        # Set directly, internal attributes not being fields whose changes are tracked
+        vars(self).update(api=api, endpoint=endpoint)
         if values:
-            self._parse_values(values)
+            self._load(values)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when no attribute is found: build the field from the response
+        fields = self._fields
+        if name.startswith("_") or name not in fields:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = fields[name]
+        if isinstance(value, (dict, list)):
+            return self._build(name, value)
+        vars(self)[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in self._fields:
+            if self._assigned is None:
+                self._assigned = {name}
+            else:
+                self._assigned.add(name)
 
     def __iter__(self) -> Iterator[tuple[str, Any]]:
-        for i in dict(self._init_cache):
+        for i in self._fields:
             a = getattr(self, i)
-            if isinstance(a, Record):
+            if isinstance(a, BaseRecord):
                 yield i, dict(a)
-            elif isinstance(a, list) and all(isinstance(i, Record) for i in a):
+            elif isinstance(a, list) and all(isinstance(i, BaseRecord) for i in a):
                 yield i, [dict(x) for x in a]
             else:
                 yield i, a
@@ -188,17 +398,35 @@ class Record(object):
         return hash(self.__key__())
 
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, Record):
+        if isinstance(other, BaseRecord):
             return self.__key__() == other.__key__()
         return NotImplemented
 
-    def _add_cache(self, item: tuple[str, Any]) -> None:
-        key, value = item
-        self._init_cache.append((key, get_return(value)))
+    def _load(self, values: dict[str, Any]) -> None:
+        """
+        Set the object attributes from the values of a response, or keep the values to
+        build the attributes on first access in lazy mode.
+        """
+        vars(self)["_fields"] = values
+        if not self.api.lazy_records:
+            self._parse_values(values)
+            return
 
-    def _parse_values(self, values: dict[str, Any]) -> None:
+        # Fields shadowed by a class attribute, such as nested models, would never
+        # reach __getattr__
+        for k in _class_attributes(type(self)).intersection(values):
+            self._build(k, values[k])
+
+    def _response_value(self, key: str) -> Any:
         """
-        Parse values dict at init and sets object attributes with the values within.
+        Return the value of a field in the response the record was built from.
+        """
+        return self._fields[key]
+
+    def _parse_value(self, key: str, value: Any) -> Any:
+        """
+        Turn the value of a field into its attribute value, nested dicts becoming
+        records.
         """
 
         def list_parser(key_name: str, list_item: Any) -> Any:
@@ -210,21 +438,61 @@ class Record(object):
                 else:
                     model = lookup[0]
                     return model(list_item, self.api, self.endpoint)
+            if isinstance(list_item, list):
+                return _copy(list_item)
             return list_item
 
+        if isinstance(value, dict):
+            lookup = getattr(self.__class__, key, None)
+            if lookup:
+                return lookup(value, self.api, self.endpoint)
+            return _copy(value)
+        elif isinstance(value, list):
+            return [list_parser(key, i) for i in value]
+        return value
+
+    def _build(self, key: str, value: Any) -> Any:
+        """
+        Set the attribute of a field from its value in the response, without counting
+        it as a change.
+        """
+        value = self._parse_value(key, value)
+        vars(self)[key] = value
+        if isinstance(value, (list, dict)):
+            self._mutable += (key,)
+        return value
+
+    def _parse_values(self, values: dict[str, Any]) -> None:
+        """
+        Parse values dict at init and sets object attributes with the values within.
+        """
+        attributes = vars(self)
+        mutable = []
         for k, v in values.items():
-            if isinstance(v, dict):
-                lookup = getattr(self.__class__, k, None)
-                if lookup:
-                    v = lookup(v, self.api, self.endpoint)
-                self._add_cache((k, v))
-            elif isinstance(v, list):
-                v = [list_parser(k, i) for i in v]
-                to_cache = list(v)
-                self._add_cache((k, to_cache))
-            else:
-                self._add_cache((k, v))
-            setattr(self, k, v)
+            v = attributes[k] = self._parse_value(k, v)
+            if isinstance(v, (list, dict)):
+                mutable.append(k)
+        if mutable:
+            self._mutable = tuple(mutable)
+
+    def _initial_value(self, key: str) -> Any:
+        """
+        Return the serialized value a field had when the record was built, computed
+        again from the response instead of being kept aside.
+
+        Nested records are serialized to their ID, read from the response without
+        building the records again.
+        """
+        value = self._response_value(key)
+        if isinstance(value, dict) and getattr(self.__class__, key, None):
+            if "id" in value:
+                return value["id"]
+        elif isinstance(value, list):
+            if all("id" in i for i in value if isinstance(i, dict)):
+                return [i["id"] if isinstance(i, dict) else i for i in value]
+        else:
+            return value
+        return _serialize(self._parse_value(key, value))
 
     def serialize(self, nested: bool = False, init: bool = False) -> Any:
         """
@@ -237,80 +505,191 @@ class Record(object):
         if nested:
             return get_return(self)
 
-        if init:
-            init_vals = dict(self._init_cache)
+        return {i: self._initial_value(i) if init else _serialize(getattr(self, i)) for i in self._fields}
 
-        r: dict[str, Any] = {}
-        for i in dict(self):
-            current_val = getattr(self, i) if not init else init_vals.get(i)
-            if isinstance(current_val, Record):
-                current_val = getattr(current_val, "serialize")(nested=True)
-            if isinstance(current_val, list):
-                current_val = [v.id if isinstance(v, Record) else v for v in current_val]
-            r[i] = current_val
-        return r
+    def _changes(self) -> dict[str, tuple[Any, Any]]:
+        """
+        Return the serialized initial and current values of the fields which changed.
+        """
+        # Only the fields which were assigned, or may have been changed in place, can
+        # differ from the response
+        candidates = set(self._mutable)
+        if self._assigned:
+            candidates.update(self._assigned)
+
+        changes = {}
+        for k in candidates:
+            if k in self._fields:
+                initial, current = self._initial_value(k), _serialize(getattr(self, k))
+                if initial != current:
+                    changes[k] = (initial, current)
+        return changes
 
     def _diff(self) -> set[str]:
-        def make_hashable(v: Any) -> Any:
-            # Hashable, structure-preserving form for set comparison. Lists become
-            # tuples, not a joined string (which would collide).
-            if isinstance(v, dict):
-                return Hashabledict({k: make_hashable(val) for k, val in v.items()})
-            if isinstance(v, list):
-                return tuple(make_hashable(i) for i in v)
-            return v
-
-        current = {k: make_hashable(v) for k, v in self.serialize().items()}
-        init = {k: make_hashable(v) for k, v in self.serialize(init=True).items()}
-        return {key for key, _ in set(current.items()) ^ set(init.items())}
+        return set(self._changes())
 
-    def updates(self) -> dict[str, Any]:
+    def updates(self, patch_format: str | None = None) -> Any:
         """
         Compile changes for an existing object into a dict.
 
         Take a diff between the objects current state and its state at init and return
         them as a dict, which will be empty if no changes.
+
+        :param patch_format: (str, optional) Return the changes as an RFC 7386
+            ``merge-patch``, in which nested dicts only hold the members which changed,
+            or as an RFC 6902 ``json-patch``, a list of operations which also change
+            lists element by element.
         """
+        check_patch_format(patch_format)
         if self.id:
-            diff = self._diff()
-            if diff:
-                serialized = self.serialize()
-                return {i: serialized[i] for i in diff}
-        return {}
+            changes = self._changes()
+            if changes:
+                return make_patch(
+                    {k: initial for k, (initial, _) in changes.items()},
+                    {k: current for k, (_, current) in changes.items()},
+                    patch_format,
+                )
+        return [] if patch_format == JSON_PATCH else {}
+
+    def _patch(self) -> tuple[Any, str | None]:
+        """
+        Return the body of the PATCH request saving the changes, in the patch format of
+        the API, along with its media type.
+        """
+        patch_format = self.api.patch_format
+        return self.updates(patch_format), CONTENT_TYPES[patch_format] if patch_format else None
+
+    def _refresh(self, result: Any) -> bool:
+        if result:
+            # Refresh the record from the server response
+            if isinstance(result, dict):
+                attributes = vars(self)
+                # Fields missing from the result are kept as attributes, the others
+                # are built again from the result
+                for k in self._fields:
+                    if k not in result and k not in attributes:
+                        attributes[k] = getattr(self, k)
+                for k in result:
+                    attributes.pop(k, None)
+                self._assigned = None
+                self._mutable = ()
+                self._load(result)
+            return True
+        return False
+
+    def _invalidate_cache(self) -> None:
+        if self.api.cache is not None:
+            self.api.cache.invalidate(self.endpoint.name)
+
+    def _discard_identity(self) -> None:
+        if self.api.identity_map is not None:
+            self.api.identity_map.discard(self)
+
+
+class Record(BaseRecord):
+    """
+    Create Python objects from IX-API responses.
+
+    Nested dicts that represent other endpoints are also turned into
+    :py:class:`.Record` objects (when the corresponding model declares them as a
+    class attribute). All fields are then assigned to the object's attributes.
+
+    Only the fields present in the response are set as attributes; accessing a
+    field that was not returned raises :py:exc:`AttributeError`.
+
+    When the API is created with ``lazy_records=True``, the response is kept as it is
+    and each field is turned into an attribute, and nested records are built, the
+    first time it is read. Reading every field, casting the record as a dict or
+    serializing it builds all the remaining fields.
+
+    Changes are tracked as fields are assigned: :py:meth:`.Record.updates()` only
+    compares the fields which were assigned, and the lists and dicts which may have
+    been changed in place, with the response the record was built from.
+
+    :examples:
+    Default representation of the object is usually its ID and/or name:
+    >>> x = ixapi.network_service_configs.get("DXDB:PAS:000001")
+    >>> x
+    DXDB:PAS:000001
+    >>>
+
+    Querying a string field:
+    >>> x = ixapi.network_service_configs.get("DXDB:PAS:000001")
+    >>> x.type
+    'exchange_lan'
+    >>>
+
+    Casting the object as a dictionary:
+    >>> from pprint import pprint
+    >>> pprint(dict(x))
+    {'asns': [64500],
+     'capacity': 2500,
+     'connection': 'DXDB:NAS:000001',
+     'consuming_customer': 'DXDB:CUST:0001',
+     'contacts': [],
+     'contract_ref': None,
+     'external_ref': None,
+     'id': 'DXDB:PAS:000001',
+     'inner_vlan': 10,
+     'ips': ['DXDB:IPV6:00001', 'DXDB:IPV4:00001'],
+     'macs': ['DXDB:MAC:00001'],
+     'managing_customer': 'DXDB:CUST:0001',
+     'network_feature_configs': ['DXDB:RSAS:000001',
+                                 'DXDB:RSAS:000002',
+                                 'DXDB:RSAS:000003',
+                                 'DXDB:RSAS:000004'],
+     'network_service': 'DXDB:PS:00001',
+     'outer_vlan': 20,
+     'purchase_order': '',
+     'state': 'production',
+     'status': [],
+     'type': 'exchange_lan'}
+    >>>
+
+    Iterating over a :py:class:`.Record` object:
+    >>> for i in x:
+    ...  print(i)
+    ...
+    ('asns', [64500])
+    ('capacity', 200000)
+    ('connection', 'DXDB:NAS:00001')
+    >>>
+    """
+
+    api: API
+    endpoint: Endpoint
+
+    def _request(self, base: str, **kwargs: Any) -> Request:
+        return self.api._request(base, **kwargs)
 
     def _make_request(self, sub_path: str) -> Request:
-        return Request(
-            base=cat(self.endpoint.url, self.id, sub_path),
-            token=self.api.access_token,
-            http_session=self.api.http_session,
-            user_agent=self.api.user_agent,
-            proxies=self.api.proxies,
-        )
+        return self._request(cat(self.endpoint.url, self.id, sub_path))
+
+    def _timeseries(self, sub_path: str, typed: bool, params: dict[str, Any]) -> Any:
+        cache = self.api.timeseries_cache
+        if typed and cache is not None and params.get("start") is not None:
+
+            def fetch(window: dict[str, Any]) -> Timeseries:
+                return Timeseries.from_response(self._make_request(sub_path)._make_call(add_params=window))
+
+            return cache.fetch(cache.key(self, sub_path, params), params, fetch)
+
+        result = self._make_request(sub_path)._make_call(add_params=params or None)
+        return Timeseries.from_response(result) if typed else result
 
     def save(self) -> bool:
         """
         Save changes to an existing object.
 
         Take a diff between the objects current state and its state at init and sends
-        them as a dict to :py:meth:`Request.patch()`.
+        them as a dict to :py:meth:`Request.patch()`, or as a patch document in the
+        ``patch_format`` of the API.
         """
-        updates = self.updates()
+        updates, content_type = self._patch()
         if updates:
-            r = Request(
-                key=self.id,
-                base=self.endpoint.url,
-                token=self.api.access_token,
-                http_session=self.api.http_session,
-                user_agent=self.api.user_agent,
-                proxies=self.api.proxies,
-            )
-            result = r.patch(updates)
-            if result:
-                # Refresh the record from the server response
-                if isinstance(result, dict):
-                    self._init_cache = []
-                    self._parse_values(result)
-                return True
+            result = self._request(self.endpoint.url, key=self.id).patch(updates, content_type=content_type)
+            self._invalidate_cache()
+            return self._refresh(result)
         return False
 
     def update(self, data: dict[str, Any]) -> bool:
@@ -329,12 +708,265 @@ class Record(object):
         """
         Delete an existing object.
         """
-        r = Request(
-            key=self.id,
-            base=self.endpoint.url,
-            token=self.api.access_token,
-            http_session=self.api.http_session,
-            user_agent=self.api.user_agent,
-            proxies=self.api.proxies,
-        )
-        return r.delete()
+        deleted = self._request(self.endpoint.url, key=self.id).delete()
+        self._invalidate_cache()
+        self._discard_identity()
+        return deleted
+
+
+# Nested records are plain records unless declared by the model
+setattr(Record, "default_ret", Record)
+
+
+class AsyncRecordSet(object):
+    """
+    Asynchronous iterator containing :py:class:`.AsyncRecord` objects.
+
+    Returned by :py:meth:`.AsyncEndpoint.all()` and :py:meth:`.AsyncEndpoint.filter()`
+    methods. No request is issued until the iteration starts.
+
+    :Examples:
+
+    >>> async for config in ixapi.network_service_configs.all():
+    ...     print(config.id)
+    ...
+    DXDB:PAS:000001
+    DXDB:PAS:000002
+    >>>
+    """
+
+    def __init__(
+        self,
+        endpoint: AsyncEndpoint,
+        request: AsyncRequest,
+        pagination: Pagination | None = None,
+        prefetch: Iterable[str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.endpoint = endpoint
+        self.request = request
+        self.pagination = pagination
+        self.response = self.request.get(pagination=pagination) if pagination is not None else self.request.get()
+        self.prefetch_fields: list[str] = []
+        self._prefetched: Iterator[AsyncRecord] | None = None
+        if prefetch:
+            self.prefetch(*prefetch)
+
+    def __aiter__(self) -> AsyncIterator[AsyncRecord]:
+        return self
+
+    def prefetch(self, *fields: str) -> AsyncRecordSet:
+        """
+        Resolve the objects referenced by ``fields`` of the records.
+
+        See :py:meth:`.RecordSet.prefetch()`.
+        """
+        _check_references(self.endpoint.return_obj, fields)
+        self.prefetch_fields.extend(field for field in fields if field not in self.prefetch_fields)
+        return self
+
+    async def __anext__(self) -> AsyncRecord:
+        if self.prefetch_fields and self._prefetched is None:
+            records = [build_record(self.endpoint, i) async for i in self.response]
+            ids = _reference_ids(records, self.prefetch_fields)
+            maps = await asyncio.gather(*(getattr(self.endpoint.api, name).get_many(i) for name, i in ids.items()))
+            _attach_references(records, self.prefetch_fields, dict(zip(ids, maps)))
+            self._prefetched = iter(records)
+        if self._prefetched is not None:
+            try:
+                return next(self._prefetched)
+            except StopIteration:
+                raise StopAsyncIteration
+        return build_record(self.endpoint, await anext(self.response))
+
+    async def to_columns(self, *fields: str, flatten: bool = True) -> dict[str, list[Any]]:
+        """
+        Return the fields of the objects as columns.
+
+        See :py:meth:`.RecordSet.to_columns()`.
+        """
+        return columns.to_columns([i async for i in self.response], fields, flatten=flatten)
+
+    async def to_arrow(self, *fields: str, flatten: bool = True) -> Any:
+        """
+        Return the fields of the objects as a ``pyarrow.Table``.
+
+        See :py:meth:`.RecordSet.to_arrow()`.
+        """
+        data = await self.to_columns(*fields, flatten=flatten)
+        return columns.to_arrow(data, columns.column_types(self.endpoint.return_obj))
+
+    async def to_pandas(self, *fields: str, flatten: bool = True) -> Any:
+        """
+        Return the fields of the objects as a ``pandas.DataFrame``.
+
+        See :py:meth:`.RecordSet.to_pandas()`.
+        """
+        data = await self.to_columns(*fields, flatten=flatten)
+        return columns.to_pandas(data, columns.column_types(self.endpoint.return_obj))
+
+
+class AsyncRecord(BaseRecord):
+    """
+    Asynchronous counterpart of :py:class:`.Record`.
+
+    Methods issuing HTTP requests, including the sub-resource calls of the models such
+    as :py:meth:`.Connection.statistics()`, return coroutines that must be awaited.
+    Models are turned into asynchronous ones with :py:func:`.async_model()`.
+    """
+
+    api: AsyncAPI
+    endpoint: AsyncEndpoint
+
+    def _request(self, base: str, **kwargs: Any) -> AsyncRequest:
+        return self.api._request(base, **kwargs)
+
+    def _make_request(self, sub_path: str) -> AsyncRequest:
+        return self._request(cat(self.endpoint.url, self.id, sub_path))
+
+    async def save(self) -> bool:
+        """
+        Save changes to an existing object.
+
+        See :py:meth:`.Record.save()`.
+        """
+        updates, content_type = self._patch()
+        if updates:
+            result = await self._request(self.endpoint.url, key=self.id).patch(updates, content_type=content_type)
+            self._invalidate_cache()
+            return self._refresh(result)
+        return False
+
+    async def update(self, data: dict[str, Any]) -> bool:
+        """
+        Update an object with a dictionary.
+
+        See :py:meth:`.Record.update()`.
+        """
+        for k, v in data.items():
+            setattr(self, k, v)
+        return await self.save()
+
+    async def delete(self) -> bool:
+        """
+        Delete an existing object.
+        """
+        deleted = await self._request(self.endpoint.url, key=self.id).delete()
+        self._invalidate_cache()
+        self._discard_identity()
+        return deleted
+
+    async def _timeseries(self, sub_path: str, typed: bool, params: dict[str, Any]) -> Any:
+        cache = self.api.timeseries_cache
+        if typed and cache is not None and params.get("start") is not None:
+
+            async def fetch(window: dict[str, Any]) -> Timeseries:
+                return Timeseries.from_response(await self._make_request(sub_path)._make_call(add_params=window))
+
+            return await cache.fetch_async(cache.key(self, sub_path, params), params, fetch)
+
+        result = await self._make_request(sub_path)._make_call(add_params=params or None)
+        return Timeseries.from_response(result) if typed else result
+
+
+@functools.cache
+def async_model(model: type[Record]) -> type[AsyncRecord]:
+    """
+    Return the asynchronous variant of a model.
+
+    The variant is a subclass of both :py:class:`.AsyncRecord` and the given model, so
+    ``isinstance()`` checks against the model keep working.
+    """
+    if issubclass(model, AsyncRecord):
+        return model
+    return type(f"Async{model.__name__}", (AsyncRecord, model), {"__module__": model.__module__})
+
+
+# Nested records of asynchronous records are asynchronous as well
+setattr(AsyncRecord, "default_ret", async_model(Record))
+
+
+@functools.lru_cache(maxsize=1024)
+def _schema(fields: tuple[str, ...]) -> dict[str, int]:
+    """
+    Return the position of each field, shared by all the records with these fields.
+    """
+    return {field: i for i, field in enumerate(fields)}
+
+
+class CompactRecord(Record):
+    """
+    Memory efficient layout of :py:class:`.Record`, for large result sets.
+
+    The fields of the response are kept in a tuple, along with a schema telling the
+    position of each field which is shared by all the records having the same fields.
+    Internal attributes are stored in slots, leaving the instance dict empty until a
+    field is changed or a nested record is read: nested records and lists are only
+    built on first access. Values at build time are not copied, they are recomputed
+    from the response to serialize the record or tell what changed.
+
+    Records behave like the other ones. Models are turned into compact ones with
+    :py:func:`.compact_model()`.
+    """
+
+    __slots__ = ("api", "endpoint", "_fields", "_values")
+
+    def __init__(self, values: dict[str, Any], api: API, endpoint: Endpoint) -> None:
+        self._fields: dict[str, int] = {}
+        self._values: tuple[Any, ...] = ()
+        self.api = api
+        self.endpoint = endpoint
+        if values:
+            self._load(values)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name not in self._fields:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = self._values[self._fields[name]]
+        if isinstance(value, (dict, list)):
+            # Build nested records and copy lists once, changes being kept as attributes
+            return self._build(name, value)
+        return value
+
+    def _load(self, values: dict[str, Any]) -> None:
+        self._fields = _schema(tuple(values))
+        self._values = tuple(values.values())
+        # Fields shadowed by a class attribute, such as nested models, would never
+        # reach __getattr__
+        for k in _class_attributes(type(self)).intersection(values):
+            self._build(k, values[k])
+
+    def _response_value(self, key: str) -> Any:
+        return self._values[self._fields[key]]
+
+    def __setstate__(self, state: tuple[dict[str, Any] | None, dict[str, Any]]) -> None:
+        # Set without __setattr__, which needs the schema of the fields, for copy.copy()
+        # and pickle
+        values, slots = state
+        for name, value in slots.items():
+            object.__setattr__(self, name, value)
+        vars(self).update(values or {})
+
+
+# Nested records of compact records are compact as well
+setattr(CompactRecord, "default_ret", CompactRecord)
+
+
+@functools.cache
+def compact_model(model: type[Record]) -> type[CompactRecord]:
+    """
+    Return the compact variant of a model, see :py:class:`.CompactRecord`.
+
+    The variant is a subclass of both :py:class:`.CompactRecord` and the given model,
+    so ``isinstance()`` checks against the model keep working. Nested records are built
+    with the compact variant of the default model.
+    """
+    if issubclass(model, CompactRecord):
+        return model
+    if model is Record:
+        return CompactRecord
+    default = async_model(Record) if issubclass(model, AsyncRecord) else Record
+    namespace = {"__module__": model.__module__}
+    compact = type(f"Compact{model.__name__}", (CompactRecord, model), namespace)
+    setattr(compact, "default_ret", compact if model is default else compact_model(default))
+    return compact
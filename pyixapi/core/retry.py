@@ -0,0 +1,123 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, NamedTuple
+
+
+class Attempt(NamedTuple):
+    """
+    Outcome and timing of one attempt of a call.
+
+    :param number: (int) Attempt number, starting at 1.
+    :param verb: (str) HTTP verb of the call.
+    :param url: (str) URL of the call.
+    :param status_code: (int) Status code of the response.
+    :param elapsed: (float) Seconds spent waiting for the response.
+    :param delay: (float, optional) Seconds waited before the next attempt, None if
+        the call is not retried.
+    """
+
+    number: int
+    verb: str
+    url: str
+    status_code: int
+    elapsed: float
+    delay: float | None
+
+
+class Retry(object):
+    """
+    Policy telling which failed calls are retried and how long to wait in between.
+
+    A call is retried when its verb is in ``allowed_methods`` and the response status
+    code is in ``status_forcelist``, up to ``total`` times. The wait before retry ``n``
+    is ``backoff_factor * 2 ** (n - 1)`` seconds, capped to ``backoff_max`` and
+    randomly shortened by up to ``jitter`` (a fraction of the wait) so that clients
+    failing together do not retry together. The ``Retry-After`` header of the response,
+    given in seconds or as an HTTP date, takes precedence when present; a call asked to
+    wait longer than ``retry_after_max`` is not retried.
+
+    :param total: (int) Maximum number of retries, the first attempt not included.
+    :param status_forcelist: (tuple) Status codes of the responses to retry.
+    :param allowed_methods: (tuple) Verbs of the calls which can be retried, only the
+        idempotent ones by default.
+    :param backoff_factor: (float) Base wait, in seconds.
+    :param backoff_max: (float) Maximum computed wait, in seconds.
+    :param jitter: (float) Fraction, between 0 and 1, by which waits are randomised.
+    :param respect_retry_after: (bool) Whether to honour the ``Retry-After`` header.
+    :param retry_after_max: (float, optional) Longest ``Retry-After`` wait, in seconds,
+        ``backoff_max`` by default.
+    :param on_attempt: (callable, optional) Called with an :py:class:`.Attempt` after
+        each attempt, e.g. to collect timings.
+
+    :Example:
+
+    >>> retry = Retry(total=5, backoff_factor=1, on_attempt=print)
+    >>> ixapi = pyixapi.api(url, key, secret, retry=retry)
+    """
+
+    def __init__(
+        self,
+        total: int = 3,
+        status_forcelist: tuple[int, ...] = (429, 502, 503, 504),
+        allowed_methods: tuple[str, ...] = ("get", "options", "delete"),
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: float = 0.2,
+        respect_retry_after: bool = True,
+        retry_after_max: float | None = None,
+        on_attempt: Callable[[Attempt], Any] | None = None,
+    ) -> None:
+        self.total = total
+        self.status_forcelist = status_forcelist
+        self.allowed_methods = allowed_methods
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.retry_after_max = backoff_max if retry_after_max is None else retry_after_max
+        self.on_attempt = on_attempt
+
+    def is_retryable(self, verb: str, status_code: int) -> bool:
+        return verb in self.allowed_methods and status_code in self.status_forcelist
+
+    def backoff(self, retry_number: int) -> float:
+        """
+        Compute the wait, in seconds, before the retry numbered ``retry_number``.
+        """
+        delay = min(self.backoff_max, self.backoff_factor * 2 ** (retry_number - 1))
+        return delay * (1 - random.uniform(0, self.jitter))
+
+    def retry_after(self, r: Any) -> float | None:
+        """
+        Read the ``Retry-After`` header of a response, in seconds.
+        """
+        headers = getattr(r, "headers", None)
+        value = headers.get("Retry-After") if headers else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+    def next_delay(self, verb: str, attempt_number: int, r: Any) -> float | None:
+        """
+        Tell how long to wait before attempting again a call whose attempt numbered
+        ``attempt_number`` received the response ``r``, or None to give up.
+        """
+        if attempt_number > self.total or not self.is_retryable(verb, r.status_code):
+            return None
+        if self.respect_retry_after:
+            delay = self.retry_after(r)
+            if delay is not None:
+                # Waiting less than asked would only be rejected again
+                return delay if delay <= self.retry_after_max else None
+        return self.backoff(attempt_number)
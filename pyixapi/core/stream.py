@@ -0,0 +1,98 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_decoder = json.JSONDecoder()
+_whitespace = " \t\n\r"
+_delimiters = _whitespace + ",]}"
+
+
+def iter_json_items(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Parse a JSON document received in chunks, yielding the items of a top-level array
+    as soon as each of them is complete.
+
+    Only the part of the document which has not been parsed yet is kept in memory, so a
+    large list can be processed with a memory footprint bounded by the size of its
+    items instead of the size of the whole document. A document which is not an array,
+    e.g. a single object, is yielded as is once complete.
+
+    :param chunks: (iterable) Chunks of the UTF-8 encoded JSON document.
+    :raises: json.JSONDecodeError if the document is not valid JSON.
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    position = 0
+    eof = False
+
+    def fill() -> bool:
+        # Drop what was already parsed and append the next chunk, False at the end
+        nonlocal buffer, position, eof
+        if eof:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            buffer = buffer[position:] + utf8.decode(b"", final=True)
+        else:
+            buffer = buffer[position:] + utf8.decode(chunk)
+        position = 0
+        return True
+
+    def skip(characters: str) -> str:
+        # Move past the given characters and return the next one, "" at the end
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in characters:
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not fill():
+                return ""
+
+    def decode() -> Any:
+        # Decode the value starting at the current position, reading more chunks while
+        # it is incomplete; a number not followed by a delimiter may be truncated
+        nonlocal position
+        while True:
+            try:
+                value, end = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if not fill():
+                    raise
+                continue
+            if (end == len(buffer) or buffer[end] not in _delimiters) and fill():
+                continue
+            position = end
+            return value
+
+    if skip(_whitespace) != "[":
+        document = decode()
+        if skip(_whitespace):
+            raise json.JSONDecodeError("Extra data", buffer, position)
+        yield document
+        return
+
+    position += 1
+    after_item = False
+    first = True
+    while True:
+        character = skip(_whitespace)
+        if character == "":
+            raise json.JSONDecodeError("Unterminated array", buffer, position)
+        if character == "]" and (first or after_item):
+            position += 1
+            break
+        if after_item:
+            if character != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position)
+            position += 1
+            after_item = False
+            continue
+        yield decode()
+        after_item = True
+        first = False
+
+    if skip(_whitespace):
+        raise json.JSONDecodeError("Extra data", buffer, position)
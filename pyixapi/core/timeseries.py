@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timezone
+from itertools import chain, filterfalse
+from operator import attrgetter, itemgetter, le, lt, sub
+from typing import Any, Callable, Iterable, Mapping
+
+TIMESTAMP = "timestamp"
+
+NAN = float("nan")
+
+
+def parse_timestamp(value: Any) -> float:
+    """
+    Return the POSIX timestamp of an IX-API date-time, assumed to be UTC when it has
+    no timezone.
+    """
+    if value is None:
+        return NAN
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return (value if value.tzinfo else value.replace(tzinfo=timezone.utc)).timestamp()
+    if value.endswith("Z"):
+        value = f"{value[:-1]}+00:00"
+    d = datetime.fromisoformat(value)
+    if d.tzinfo is None:
+        d = d.replace(tzinfo=timezone.utc)
+    return d.timestamp()
+
+
+def format_timestamp(timestamp: float) -> str:
+    """
+    Return the IX-API date-time of a POSIX timestamp, in UTC.
+    """
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def parse_timestamps(values: Iterable[Any]) -> list[float]:
+    """
+    Return the POSIX timestamps of IX-API date-times, see :py:func:`parse_timestamp`.
+    """
+    values = list(values)
+    try:
+        dates = list(map(datetime.fromisoformat, values))
+    except (TypeError, ValueError):
+        # Older versions of Python do not parse the "Z" suffix
+        return list(map(parse_timestamp, values))
+    if None in map(attrgetter("tzinfo"), dates):
+        return list(map(parse_timestamp, values))
+    return list(map(datetime.timestamp, dates))
+
+
+def _array(values: Iterable[Any]) -> array:
+    values = values if isinstance(values, (array, list, tuple)) else list(values)
+    try:
+        return array("d", values)
+    except TypeError:
+        # Samples without a value
+        return array("d", [NAN if v is None else v for v in values])
+
+
+def _present(values: Iterable[float]) -> list[float]:
+    return list(filterfalse(math.isnan, values))
+
+
+def _rate(new: float, old: float, interval: float) -> float:
+    if interval <= 0:
+        return NAN
+    # A counter lower than the previous one was reset in between
+    return (new - old if new >= old else new) / interval
+
+
+def _mean(values: list[float]) -> float:
+    return math.fsum(values) / len(values)
+
+
+AGGREGATES: dict[str, Callable[[list[float]], float]] = {
+    "mean": _mean,
+    "min": min,
+    "max": max,
+    "sum": math.fsum,
+    "first": itemgetter(0),
+    "last": itemgetter(-1),
+}
+
+
+class Timeseries(object):
+    """
+    Samples of an IX-API statistics timeseries, kept in typed arrays.
+
+    Timestamps are POSIX timestamps and each field is a column of floats, samples
+    without a value holding NaN. Samples are kept ordered by timestamp. Operations
+    work on whole columns and return new timeseries.
+
+    Returned by the ``statistics_timeseries()`` and ``peer_statistics_timeseries()``
+    methods of the models when called with ``typed=True``.
+
+    :param timestamps: (list) POSIX timestamps of the samples.
+    :param values: (dict) Values of the samples, keyed by field.
+    :param precision: (int, optional) Seconds between two samples.
+    :param meta: (dict, optional) Other members of the IX-API response, such as
+        ``title`` or ``next_update_at``.
+
+    :Example:
+
+    >>> ts = ixapi.ports.get("PORT-001").statistics_timeseries("5m", typed=True)
+    >>> ts.fields
+    ['average_pps_in', 'average_pps_out', 'average_bps_in', 'average_bps_out', ...]
+    >>> ts.percentile(95, "average_bps_in")
+    8421337.6
+    >>> ts.resample(3600, "max")["max_bps_out"]
+    array('d', [...])
+    """
+
+    def __init__(
+        self,
+        timestamps: Iterable[float],
+        values: Mapping[str, Iterable[Any]],
+        precision: int | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> None:
+        self.timestamps = _array(timestamps)
+        self.values = {name: _array(column) for name, column in values.items()}
+        self.precision = precision
+        self.meta = meta or {}
+        for name, column in self.values.items():
+            if len(column) != len(self.timestamps):
+                raise ValueError(f"{name} has {len(column)} values for {len(self.timestamps)} timestamps")
+        if not all(map(le, self.timestamps, self.timestamps[1:])):
+            self._take(sorted(range(len(self.timestamps)), key=self.timestamps.__getitem__))
+
+    @classmethod
+    def from_response(cls, data: dict[str, Any]) -> Timeseries:
+        """
+        Build a timeseries from an IX-API timeseries response, whose ``samples`` are
+        lists of values in the order of its ``fields``.
+        """
+        fields = list(data["fields"])
+        samples = data.get("samples") or []
+        columns = dict(zip(fields, zip(*samples))) if samples else dict.fromkeys(fields, ())
+        timestamps = parse_timestamps(columns.pop(TIMESTAMP, ()))
+        meta = {k: v for k, v in data.items() if k not in ("fields", "samples", "precision")}
+        return cls(timestamps, columns, precision=data.get("precision"), meta=meta)
+
+    def _take(self, indexes: list[int]) -> None:
+        self.timestamps = array("d", map(self.timestamps.__getitem__, indexes))
+        self.values = {name: array("d", map(column.__getitem__, indexes)) for name, column in self.values.items()}
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, field: str) -> array:
+        if field == TIMESTAMP:
+            return self.timestamps
+        return self.values[field]
+
+    def __repr__(self) -> str:
+        return f"<Timeseries {len(self)} samples of {', '.join(self.fields)}>"
+
+    @property
+    def fields(self) -> list[str]:
+        return list(self.values)
+
+    def _fields(self, fields: tuple[str, ...]) -> list[str]:
+        for field in fields:
+            if field not in self.values:
+                raise KeyError(field)
+        return list(fields) or self.fields
+
+    def rate(self, *fields: str) -> Timeseries:
+        """
+        Return the per-second rate of change of counters, between each sample and the
+        previous one.
+
+        The rates are timestamped with the later sample, so the result has one sample
+        less. A counter lower than its previous value is taken as reset in between.
+
+        :param fields: (str, optional) Fields to compute the rate of, all otherwise.
+        """
+        intervals = list(map(sub, self.timestamps[1:], self.timestamps[:-1]))
+        values = {
+            name: map(_rate, self.values[name][1:], self.values[name][:-1], intervals) for name in self._fields(fields)
+        }
+        return Timeseries(self.timestamps[1:], values, precision=self.precision, meta=self.meta)
+
+    def percentile(self, q: float, field: str) -> float:
+        """
+        Return the ``q``-th percentile of the values of a field, interpolating
+        linearly between the closest values. Samples without a value are left out.
+
+        :param q: (float) Percentile, between 0 and 100.
+        :returns: The percentile, NaN if the field has no value.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, not {q}")
+        values = sorted(_present(self[field]))
+        if not values:
+            return NAN
+        position = (len(values) - 1) * q / 100
+        low = math.floor(position)
+        high = min(low + 1, len(values) - 1)
+        return values[low] + (values[high] - values[low]) * (position - low)
+
+    def mean(self, field: str) -> float:
+        """
+        Return the mean of the values of a field, NaN if it has no value.
+        """
+        values = _present(self[field])
+        return _mean(values) if values else NAN
+
+    def max(self, field: str) -> float:
+        """
+        Return the highest value of a field, NaN if it has no value.
+        """
+        return max(_present(self[field]), default=NAN)
+
+    @property
+    def interval(self) -> float:
+        """
+        Seconds covered by each sample: the precision of the timeseries, or the
+        shortest time between two samples.
+        """
+        if self.precision:
+            return float(self.precision)
+        return min(filter(None, map(sub, self.timestamps[1:], self.timestamps[:-1])), default=0.0)
+
+    def time_above(self, field: str, threshold: float) -> float:
+        """
+        Return the number of seconds during which a field was above ``threshold``, each
+        sample covering :py:attr:`interval` seconds.
+        """
+        return sum(map(float(threshold).__lt__, self[field])) * self.interval
+
+    def resample(self, interval: float, how: str = "mean") -> Timeseries:
+        """
+        Return the timeseries aggregated over buckets of ``interval`` seconds, aligned
+        on the epoch, each bucket being timestamped with its start.
+
+        Samples without a value are left out; buckets with no value hold NaN.
+
+        :param interval: (float) Seconds covered by each bucket.
+        :param how: (str) Aggregate of the values of a bucket: ``mean``, ``min``,
+            ``max``, ``sum``, ``first`` or ``last``.
+        """
+        if interval <= 0:
+            raise ValueError(f"Interval must be positive, not {interval}")
+        try:
+            aggregate = AGGREGATES[how]
+        except KeyError:
+            raise ValueError(f"Unknown aggregate {how!r}, expected one of {', '.join(AGGREGATES)}")
+
+        buckets = [t - t % interval for t in self.timestamps]
+        starts = [i for i in range(len(buckets)) if not i or buckets[i] != buckets[i - 1]]
+        bounds = list(zip(starts, starts[1:] + [len(buckets)]))
+
+        def bucket(column: array, start: int, end: int) -> float:
+            values = _present(column[start:end])
+            return aggregate(values) if values else NAN
+
+        values = {name: [bucket(column, *b) for b in bounds] for name, column in self.values.items()}
+        return Timeseries(map(buckets.__getitem__, starts), values, precision=int(interval), meta=self.meta)
+
+    def window(self, start: float | None = None, end: float | None = None) -> Timeseries:
+        """
+        Return the samples from ``start``, included, to ``end``, excluded.
+
+        :param start: (float, optional) POSIX timestamp, from the first sample otherwise.
+        :param end: (float, optional) POSIX timestamp, to the last sample otherwise.
+        """
+        low = 0 if start is None else bisect_left(self.timestamps, start)
+        high = len(self) if end is None else bisect_left(self.timestamps, end)
+        return Timeseries(
+            self.timestamps[low:high],
+            {name: column[low:high] for name, column in self.values.items()},
+            precision=self.precision,
+            meta=self.meta,
+        )
+
+    def merge(self, *others: Timeseries) -> Timeseries:
+        """
+        Return the samples of all the timeseries, the samples of the last ones replacing
+        the ones with the same timestamp. Fields missing from some of them hold NaN for
+        their samples.
+        """
+        parts = (self, *others)
+
+        def column(ts: Timeseries, name: str) -> array:
+            return ts.values[name] if name in ts.values else array("d", [NAN]) * len(ts)
+
+        names = dict.fromkeys(name for ts in parts for name in ts.values)
+        merged = Timeseries(
+            array("d", chain.from_iterable(ts.timestamps for ts in parts)),
+            {name: array("d", chain.from_iterable(column(ts, name) for ts in parts)) for name in names},
+            precision=next((ts.precision for ts in parts if ts.precision), None),
+            meta={k: v for ts in parts for k, v in ts.meta.items()},
+        )
+        # Sorting is stable, so the last sample of each timestamp is the one of the last
+        # timeseries holding it
+        ts = merged.timestamps
+        if not all(map(lt, ts, ts[1:])):
+            merged._take([i for i in range(len(ts)) if i == len(ts) - 1 or ts[i] != ts[i + 1]])
+        return merged
+
+    def to_numpy(self, field: str = TIMESTAMP) -> Any:
+        """
+        Return the values of a field, or the timestamps, as a ``numpy.ndarray`` of
+        float64 sharing the memory of the timeseries, without any copy.
+        """
+        import numpy as np
+
+        return np.frombuffer(self[field], dtype=np.float64)
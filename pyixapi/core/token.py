@@ -1,8 +1,16 @@
+from __future__ import annotations
+
+import asyncio
+import threading
 import warnings
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
 
 import jwt
 
+if TYPE_CHECKING:
+    from pyixapi.core.api import API, AsyncAPI, BaseAPI
+
 
 class TokenException(Exception):
     pass
@@ -56,7 +64,7 @@ class Token:
         return self.ttl == 0
 
     @classmethod
-    def from_jwt(cls, token: str) -> "Token":
+    def from_jwt(cls, token: str) -> Token:
         """
         Create a new token from a JWT, decoding it and caching its expiration time.
 
@@ -75,3 +83,172 @@ class Token:
             )
         except Exception as e:
             raise InvalidTokenException(e)
+
+
+class BaseTokenManager(object):
+    """
+    Shared state of :py:class:`.TokenManager` and :py:class:`.AsyncTokenManager`, which
+    renew the tokens pair of an API before the access token expires.
+
+    :param api: (API) API whose tokens must be kept valid.
+    :param margin: (int) Number of seconds before expiry at which tokens are renewed.
+    :param retry_interval: (float) Number of seconds to wait after a failed renewal.
+    """
+
+    def __init__(self, api: BaseAPI, margin: int = 60, retry_interval: float = 10.0) -> None:
+        self.api = api
+        self.margin = margin
+        self.retry_interval = retry_interval
+        self.last_error: Exception | None = None
+
+    @property
+    def running(self) -> bool:
+        raise NotImplementedError
+
+    def next_renewal(self) -> float:
+        """
+        Number of seconds, from now, before the tokens must be renewed.
+        """
+        token = self.api.access_token
+        if token is None:
+            return 0
+        return max(0, token.ttl - self.margin)
+
+    def start(self) -> None:
+        """
+        Start renewing the tokens pair, if not already doing so.
+        """
+        raise NotImplementedError
+
+    def stop(self) -> None:
+        """
+        Stop renewing the tokens pair.
+        """
+        raise NotImplementedError
+
+
+class TokenManager(BaseTokenManager):
+    """
+    Renew the tokens pair of an API in a background thread, before the access token
+    expires.
+
+    The access token is renewed once its TTL falls below ``margin`` seconds, by
+    refreshing the pair or, if the refresh token is expired or rejected, by
+    authenticating again with the API key and secret. Requests therefore never wait
+    for an authentication round trip. If a renewal fails, it is retried every
+    ``retry_interval`` seconds and the error is kept in :py:attr:`last_error`.
+
+    :param api: (API) API whose tokens must be kept valid.
+    :param margin: (int) Number of seconds before expiry at which tokens are renewed.
+    :param retry_interval: (float) Number of seconds to wait after a failed renewal.
+    """
+
+    api: API
+
+    def __init__(self, api: API, margin: int = 60, retry_interval: float = 10.0) -> None:
+        super().__init__(api, margin=margin, retry_interval=retry_interval)
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def renew(self) -> None:
+        """
+        Renew the tokens pair, refreshing it when possible.
+        """
+        self.api._renew_tokens()
+
+    def start(self) -> None:
+        """
+        Start the renewal thread, if not already running.
+        """
+        if self.running:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="pyixapi-token-manager", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the renewal thread.
+        """
+        self._stopped.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.next_renewal()):
+            # Tokens may have been renewed by someone else while waiting
+            if self.next_renewal() > 0:
+                continue
+            try:
+                self.renew()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+            # Do not spin when renewed tokens are already within the margin
+            if self.next_renewal() == 0 and self._stopped.wait(self.retry_interval):
+                return
+
+
+class AsyncTokenManager(BaseTokenManager):
+    """
+    Renew the tokens pair of an :py:class:`.AsyncAPI` in an asyncio task, before the
+    access token expires.
+
+    See :py:class:`.TokenManager`. The task is created in the running event loop, so
+    an API given tokens when built outside of a loop starts renewing them once used as
+    an asynchronous context manager or once authenticated.
+    """
+
+    api: AsyncAPI
+
+    def __init__(self, api: AsyncAPI, margin: int = 60, retry_interval: float = 10.0) -> None:
+        super().__init__(api, margin=margin, retry_interval=retry_interval)
+        self._task: asyncio.Task[Any] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def renew(self) -> None:
+        """
+        Renew the tokens pair, refreshing it when possible.
+
+        Calls rejected with a 401 renew the pair under the same lock, so that a single
+        renewal happens at a time.
+        """
+        async with self.api._async_auth_lock:
+            await self.api._renew_tokens()
+
+    def start(self) -> None:
+        """
+        Start the renewal task, if not already running.
+        """
+        if self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run_async())
+
+    def stop(self) -> None:
+        """
+        Cancel the renewal task.
+        """
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+        self._task = None
+
+    async def _run_async(self) -> None:
+        while True:
+            await asyncio.sleep(self.next_renewal())
+            if self.next_renewal() > 0:
+                continue
+            try:
+                await self.renew()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+            if self.next_renewal() == 0:
+                await asyncio.sleep(self.retry_interval)
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, NamedTuple
+from urllib.parse import urlencode, urlsplit
+
+from requests.structures import CaseInsensitiveDict
+
+if TYPE_CHECKING:
+    import requests
+    import urllib3
+
+
+class TransportResponse(object):
+    """
+    HTTP response returned by transports which are not based on ``requests``.
+
+    Provide the subset of the ``requests.Response`` interface used by pyixapi, so that
+    responses can be handled the same way whatever the transport. The body is either
+    given as ``content`` or as an iterable of chunks, ``stream``, read on demand.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        content: bytes = b"",
+        headers: Any = None,
+        url: str = "",
+        reason: str = "",
+        stream: Iterable[bytes] | None = None,
+        release: Callable[[], Any] | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self._content = content
+        self._stream = stream
+        self._release = release
+        self.headers: CaseInsensitiveDict[str] = CaseInsensitiveDict(headers or {})
+        self.url = url
+        self.reason = reason
+
+    @property
+    def content(self) -> bytes:
+        if self._stream is not None:
+            self._content = b"".join(self._stream)
+            self._stream = None
+            self.close()
+        return self._content
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        Iterate over the body in chunks, reading it from the stream if not read yet.
+        """
+        if self._stream is not None:
+            stream, self._stream = self._stream, None
+            try:
+                yield from stream
+            finally:
+                self.close()
+        else:
+            for i in range(0, len(self._content), chunk_size):
+                yield self._content[i : i + chunk_size]
+
+    def close(self) -> None:
+        """
+        Release the connection the body was streamed from.
+        """
+        if self._release is not None:
+            release, self._release = self._release, None
+            release()
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class Transport(object):
+    """
+    Send HTTP requests on behalf of :py:class:`.Request`.
+
+    A transport receives the verb, URL, headers, query parameters and JSON body of a
+    call and returns a response object providing the ``status_code``, ``ok``,
+    ``reason``, ``url``, ``headers``, ``content`` and ``text`` attributes as well as
+    ``json()``, ``iter_content()`` and ``close()`` methods, like ``requests.Response``
+    and :py:class:`.TransportResponse` do. When ``stream`` is true, the body should not
+    be read before ``iter_content()`` is called. A body already encoded to JSON is given
+    as ``content`` instead of ``json``.
+    """
+
+    def request(
+        self,
+        verb: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        proxies: dict[str, str] | None = None,
+        stream: bool = False,
+        content: bytes | None = None,
+    ) -> Any:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Release the resources held by the transport.
+        """
+
+
+class RequestsTransport(Transport):
+    """
+    Transport sending requests with a ``requests.Session``, the default one.
+
+    :param session: (requests.Session) Session used to send requests.
+    """
+
+    def __init__(self, session: requests.Session) -> None:
+        self.session = session
+
+    def request(
+        self,
+        verb: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        proxies: dict[str, str] | None = None,
+        stream: bool = False,
+        content: bytes | None = None,
+    ) -> Any:
+        kwargs: dict[str, Any] = {"stream": True} if stream else {}
+        if content is not None:
+            kwargs["data"] = content
+        return getattr(self.session, verb)(url, headers=headers, params=params, json=json, proxies=proxies, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class Urllib3Transport(Transport):
+    """
+    Transport sending requests straight through a ``urllib3`` connection pool.
+
+    It skips the session, hooks and cookie handling layers of ``requests`` and is
+    therefore cheaper per call. Proxies are honoured by keeping one
+    ``urllib3.ProxyManager`` per proxy URL.
+
+    :param pool_manager: (urllib3.PoolManager, optional) Pool to send requests with.
+    :param pool_kwargs: Arguments used to build the pool manager when none is given,
+        e.g. ``maxsize=32`` or ``timeout=urllib3.Timeout(10)``.
+    """
+
+    def __init__(self, pool_manager: urllib3.PoolManager | None = None, **pool_kwargs: Any) -> None:
+        import urllib3
+
+        self.pool_kwargs = pool_kwargs
+        self.pool_manager = pool_manager or urllib3.PoolManager(**pool_kwargs)
+        self._proxy_managers: dict[str, urllib3.ProxyManager] = {}
+
+    def _pool_for(self, url: str, proxies: dict[str, str] | None) -> urllib3.PoolManager:
+        proxy = (proxies or {}).get(urlsplit(url).scheme)
+        if not proxy:
+            return self.pool_manager
+        if proxy not in self._proxy_managers:
+            import urllib3
+
+            self._proxy_managers[proxy] = urllib3.ProxyManager(proxy, **self.pool_kwargs)
+        return self._proxy_managers[proxy]
+
+    def request(
+        self,
+        verb: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        proxies: dict[str, str] | None = None,
+        stream: bool = False,
+        content: bytes | None = None,
+    ) -> TransportResponse:
+        # Like requests, leave out the parameters set to None instead of sending "None"
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        if params:
+            url = f"{url}?{urlencode(params, doseq=True)}"
+        body = content
+        if content is None and json is not None:
+            body = _dumps(json)
+            headers = {**headers}
+            headers.setdefault("Content-Type", "application/json")
+
+        r = self._pool_for(url, proxies).request(
+            verb.upper(), url, body=body, headers=headers, preload_content=not stream
+        )
+
+        if stream:
+            return TransportResponse(
+                r.status, headers=r.headers, url=url, reason=r.reason or "", stream=r.stream(), release=r.release_conn
+            )
+        return TransportResponse(r.status, r.data, r.headers, url=url, reason=r.reason or "")
+
+    def close(self) -> None:
+        self.pool_manager.clear()
+        for manager in self._proxy_managers.values():
+            manager.clear()
+
+
+class LocalRequest(NamedTuple):
+    """
+    Request received by a :py:class:`.LocalTransport`.
+    """
+
+    verb: str
+    url: str
+    headers: dict[str, str]
+    params: dict[str, Any]
+    json: Any
+
+
+class LocalTransport(Transport):
+    """
+    In-process transport answering requests from registered routes, without any
+    network I/O. Meant for tests and for measuring the overhead of pyixapi itself.
+
+    Routes are matched against the path of the requested URL, the most recently added
+    route first. A route returns either static JSON content or the result of a
+    handler called with the :py:class:`.LocalRequest`. Requests matching no route are
+    answered with a 404. Every request is recorded in :py:attr:`requests`.
+
+    :Example:
+
+    >>> transport = LocalTransport()
+    >>> transport.add("get", "/connections", [{"id": "CONN-001"}])
+    >>> ixapi = pyixapi.api(url, key, secret, transport=transport)
+    >>> [c.id for c in ixapi.connections.all()]
+    ['CONN-001']
+    """
+
+    def __init__(self) -> None:
+        self.routes: list[tuple[str, str, Callable[[LocalRequest], TransportResponse]]] = []
+        self.requests: list[LocalRequest] = []
+
+    def add(
+        self,
+        verb: str,
+        path: str,
+        content: Any = None,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        handler: Callable[[LocalRequest], TransportResponse] | None = None,
+    ) -> None:
+        """
+        Register a route answering ``verb`` requests whose URL path ends with ``path``.
+        """
+        if handler is None:
+            body = b"" if content is None else _dumps(content)
+
+            def handler(request: LocalRequest) -> TransportResponse:
+                return TransportResponse(status_code, body, dict(headers or {}), url=request.url)
+
+        self.routes.insert(0, (verb.lower(), path.rstrip("/"), handler))
+
+    def request(
+        self,
+        verb: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        proxies: dict[str, str] | None = None,
+        stream: bool = False,
+        content: bytes | None = None,
+    ) -> TransportResponse:
+        if content is not None:
+            json = _loads(content)
+        request = LocalRequest(verb, url, dict(headers), dict(params or {}), json)
+        self.requests.append(request)
+
+        path = urlsplit(url).path.rstrip("/")
+        for route_verb, route_path, handler in self.routes:
+            if route_verb == verb and path.endswith(route_path):
+                return handler(request)
+        return TransportResponse(404, url=url, reason="Not Found")
+
+
+class HTTPXTransport(object):
+    """
+    Asynchronous transport sending requests with an ``httpx.AsyncClient``, the default
+    one of :py:class:`.AsyncAPI`.
+
+    Asynchronous transports expose the same ``request()`` method as
+    :py:class:`.Transport` but as a coroutine. Proxies are a property of the client
+    and are not sent along with each request. Bodies are always read in full.
+    """
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    async def request(
+        self,
+        verb: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        proxies: dict[str, str] | None = None,
+        stream: bool = False,
+        content: bytes | None = None,
+    ) -> TransportResponse:
+        if content is not None:
+            r = await self.client.request(verb.upper(), url, headers=headers, params=params, content=content)
+        else:
+            r = await self.client.request(verb.upper(), url, headers=headers, params=params, json=json)
+        return TransportResponse(r.status_code, r.content, r.headers, url=str(r.url), reason=r.reason_phrase)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+def _dumps(data: Any) -> bytes:
+    return json.dumps(data).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    return json.loads(data)
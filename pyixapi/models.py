@@ -2,6 +2,17 @@ import ipaddress
 from typing import Any
 
 from pyixapi.core.response import Record
+from pyixapi.core.timeseries import Timeseries
+
+# Fields referencing accounts, named customers in IX-API v1
+ACCOUNT_REFERENCES = {
+    "managing_account": "accounts",
+    "consuming_account": "accounts",
+    "billing_account": "accounts",
+    "managing_customer": "accounts",
+    "consuming_customer": "accounts",
+    "billing_customer": "accounts",
+}
 
 # Version 1 and up
 
@@ -13,6 +24,8 @@ class Account(Record):
     It is also referenced as "customer" in IX-API v1.
     """
 
+    references = ACCOUNT_REFERENCES
+
     def __str__(self) -> str:
         return f"{self.id}: {self.name}"
 
@@ -22,6 +35,15 @@ class Connection(Record):
     A Connection is a group of physical ports collected together into a LAG.
     """
 
+    references = {
+        **ACCOUNT_REFERENCES,
+        "pop": "pops",
+        "product_offering": "product_offerings",
+        "role_assignments": "role_assignments",
+        "ports": "ports",
+    }
+    column_types = {"speed": "int", "port_quantity": "int"}
+
     def __str__(self) -> str:
         return f"{self.id}: {self.name}"
 
@@ -37,8 +59,8 @@ class Connection(Record):
     def statistics(self, **kwargs: Any) -> dict[str, Any]:
         return self._make_request("statistics")._make_call(add_params=kwargs or None)
 
-    def statistics_timeseries(self, aggregate: str, **kwargs: Any) -> dict[str, Any]:
-        return self._make_request(f"statistics/{aggregate}/timeseries")._make_call(add_params=kwargs or None)
+    def statistics_timeseries(self, aggregate: str, typed: bool = False, **kwargs: Any) -> dict[str, Any] | Timeseries:
+        return self._timeseries(f"statistics/{aggregate}/timeseries", typed, kwargs)
 
 
 class Contact(Record):
@@ -46,6 +68,8 @@ class Contact(Record):
     A Contact is a role undertaking a specific responsibility within an account.
     """
 
+    references = ACCOUNT_REFERENCES
+
     def __str__(self) -> str:
         r = []
 
@@ -67,6 +91,13 @@ class Demarc(Record):
     eg a physical port / socket, generally with a specified bandwidth.
     """
 
+    references = {
+        **ACCOUNT_REFERENCES,
+        "connection": "connections",
+        "pop": "pops",
+    }
+    column_types = {"speed": "int"}
+
     def __str__(self) -> str:
         return self.id
 
@@ -77,6 +108,11 @@ class Device(Record):
     specified facility and inside a PoP.
     """
 
+    references = {
+        "pop": "pops",
+        "facility": "facilities",
+    }
+
     def __str__(self) -> str:
         return self.name
 
@@ -87,6 +123,11 @@ class Facility(Record):
     defined set of PoPs can be accessed.
     """
 
+    references = {
+        "metro_area": "metro_areas",
+        "pops": "pops",
+    }
+
     def __str__(self) -> str:
         return self.name
 
@@ -96,6 +137,14 @@ class IP(Record):
     An IP is an IPv4 or IPv6 address, with a given validity period.
     """
 
+    references = {
+        **ACCOUNT_REFERENCES,
+        "network_service": "network_services",
+        "network_service_config": "network_service_configs",
+        "network_feature": "network_features",
+    }
+    column_types = {"version": "int", "prefix_length": "int"}
+
     @property
     def cidr(self) -> ipaddress.IPv4Interface | ipaddress.IPv6Interface:
         return ipaddress.ip_interface(f"{self.address}/{self.prefix_length}")
@@ -117,6 +166,8 @@ class MAC(Record):
     A MAC is a MAC address with a given validity period.
     """
 
+    references = ACCOUNT_REFERENCES
+
     def __str__(self) -> str:
         return self.address.lower()
 
@@ -126,6 +177,14 @@ class NetworkFeatureConfig(Record):
     A NetworkFeatureConfig is a customer's configuration to use a NetworkFeature.
     """
 
+    references = {
+        **ACCOUNT_REFERENCES,
+        "network_feature": "network_features",
+        "network_service_config": "network_service_configs",
+        "role_assignments": "role_assignments",
+        "ip": "ips",
+    }
+
     def __str__(self) -> str:
         return self.id
 
@@ -136,6 +195,12 @@ class NetworkFeature(Record):
     NetworkService.
     """
 
+    references = {
+        **ACCOUNT_REFERENCES,
+        "network_service": "network_services",
+        "ips": "ips",
+    }
+
     def __str__(self) -> str:
         return self.id
 
@@ -146,6 +211,23 @@ class NetworkServiceConfig(Record):
     the configuration of a (subset of a) connection for that customer's traffic.
     """
 
+    references = {
+        **ACCOUNT_REFERENCES,
+        "connection": "connections",
+        "network_service": "network_services",
+        "product_offering": "product_offerings",
+        "role_assignments": "role_assignments",
+        "ips": "ips",
+        "macs": "macs",
+        "network_feature_configs": "network_feature_configs",
+    }
+    column_types = {
+        "capacity": "int",
+        "vlan_config.vlan": "int",
+        "vlan_config.inner_vlan": "int",
+        "vlan_config.outer_vlan": "int",
+    }
+
     def __str__(self) -> str:
         return self.id
 
@@ -155,14 +237,16 @@ class NetworkServiceConfig(Record):
     def peer_statistics(self, **kwargs: Any) -> dict[str, Any]:
         return self._make_request("peer-statistics")._make_call(add_params=kwargs or None)
 
-    def peer_statistics_timeseries(self, aggregate: str, **kwargs: Any) -> dict[str, Any]:
-        return self._make_request(f"peer-statistics/{aggregate}/timeseries")._make_call(add_params=kwargs or None)
+    def peer_statistics_timeseries(
+        self, aggregate: str, typed: bool = False, **kwargs: Any
+    ) -> dict[str, Any] | Timeseries:
+        return self._timeseries(f"peer-statistics/{aggregate}/timeseries", typed, kwargs)
 
     def statistics(self, **kwargs: Any) -> dict[str, Any]:
         return self._make_request("statistics")._make_call(add_params=kwargs or None)
 
-    def statistics_timeseries(self, aggregate: str, **kwargs: Any) -> dict[str, Any]:
-        return self._make_request(f"statistics/{aggregate}/timeseries")._make_call(add_params=kwargs or None)
+    def statistics_timeseries(self, aggregate: str, typed: bool = False, **kwargs: Any) -> dict[str, Any] | Timeseries:
+        return self._timeseries(f"statistics/{aggregate}/timeseries", typed, kwargs)
 
 
 class NetworkService(Record):
@@ -171,6 +255,13 @@ class NetworkService(Record):
     depending on the type of product.
     """
 
+    references = {
+        **ACCOUNT_REFERENCES,
+        "product_offering": "product_offerings",
+        "network_features": "network_features",
+        "metro_area_network": "metro_area_networks",
+    }
+
     def __str__(self) -> str:
         return self.id
 
@@ -192,8 +283,8 @@ class NetworkService(Record):
     def statistics(self, **kwargs: Any) -> dict[str, Any]:
         return self._make_request("statistics")._make_call(add_params=kwargs or None)
 
-    def statistics_timeseries(self, aggregate: str, **kwargs: Any) -> dict[str, Any]:
-        return self._make_request(f"statistics/{aggregate}/timeseries")._make_call(add_params=kwargs or None)
+    def statistics_timeseries(self, aggregate: str, typed: bool = False, **kwargs: Any) -> dict[str, Any] | Timeseries:
+        return self._timeseries(f"statistics/{aggregate}/timeseries", typed, kwargs)
 
 
 class PoP(Record):
@@ -202,6 +293,12 @@ class PoP(Record):
     infrastructure and has defined reachability of other facilities.
     """
 
+    references = {
+        "facility": "facilities",
+        "metro_area_network": "metro_area_networks",
+        "devices": "devices",
+    }
+
     def __str__(self) -> str:
         return self.name
 
@@ -213,6 +310,8 @@ class ProductOffering(Record):
     It is also referenced as "product" in IX-API v1.
     """
 
+    column_types = {"physical_port_speed": "int", "bandwidth_min": "int", "bandwidth_max": "int"}
+
     def __str__(self) -> str:
         return self.name
 
@@ -238,6 +337,12 @@ class MemberJoiningRule(Record):
     listed in an allow rule.
     """
 
+    references = {
+        **ACCOUNT_REFERENCES,
+        "network_service": "network_services",
+    }
+    column_types = {"capacity_min": "int", "capacity_max": "int"}
+
     def __str__(self) -> str:
         return self.id
 
@@ -247,6 +352,11 @@ class MetroArea(Record):
     A MetroArea exists if a MetroAreaNetwork or Facility is present in it.
     """
 
+    references = {
+        "metro_area_networks": "metro_area_networks",
+        "facilities": "facilities",
+    }
+
     def __str__(self) -> str:
         return self.display_name
 
@@ -260,6 +370,10 @@ class MetroAreaNetwork(Record):
     list of IDs.
     """
 
+    references = {
+        "metro_area": "metro_areas",
+    }
+
     def __str__(self) -> str:
         return self.name
 
@@ -270,14 +384,23 @@ class Port(Record):
     associated with a device and pop, has a speed and a media_type.
     """
 
+    references = {
+        **ACCOUNT_REFERENCES,
+        "device": "devices",
+        "pop": "pops",
+        "connection": "connections",
+        "role_assignments": "role_assignments",
+    }
+    column_types = {"speed": "int"}
+
     def __str__(self) -> str:
         return self.name
 
     def statistics(self, **kwargs: Any) -> dict[str, Any]:
         return self._make_request("statistics")._make_call(add_params=kwargs or None)
 
-    def statistics_timeseries(self, aggregate: str, **kwargs: Any) -> dict[str, Any]:
-        return self._make_request(f"statistics/{aggregate}/timeseries")._make_call(add_params=kwargs or None)
+    def statistics_timeseries(self, aggregate: str, typed: bool = False, **kwargs: Any) -> dict[str, Any] | Timeseries:
+        return self._timeseries(f"statistics/{aggregate}/timeseries", typed, kwargs)
 
 
 class PortReservation(Record):
@@ -290,6 +413,13 @@ class PortReservation(Record):
     Please note that individual cancellation policies might apply.
     """
 
+    references = {
+        **ACCOUNT_REFERENCES,
+        "connection": "connections",
+        "port": "ports",
+        "role_assignments": "role_assignments",
+    }
+
     def __str__(self) -> str:
         return self.id
 
@@ -309,6 +439,12 @@ class RoutingFunction(Record):
     network service.
     """
 
+    references = {
+        **ACCOUNT_REFERENCES,
+        "role_assignments": "role_assignments",
+    }
+    column_types = {"asn": "int"}
+
     def __str__(self) -> str:
         return self.id
 
@@ -330,5 +466,14 @@ class RoleAssignment(Record):
     A Contact can be assigned to many Roles.
     """
 
+    references = {
+        "role": "roles",
+        "contact": "contacts",
+        "connection": "connections",
+        "network_service_config": "network_service_configs",
+        "network_feature_config": "network_feature_configs",
+        "port": "ports",
+    }
+
     def __str__(self) -> str:
         return self.id
@@ -1,9 +1,14 @@
+import json
+import threading
+import time
 import unittest
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import pyixapi
 from pyixapi.core.token import Token
+from pyixapi.core.transport import LocalRequest, LocalTransport, TransportResponse
 
 from .util import Response, auth_response, def_args, host, make_jwt
 
@@ -39,6 +44,12 @@ class ApiInitTestCase(unittest.TestCase):
         api = pyixapi.api(host, *def_args)
         self.assertEqual(api.user_agent, f"pyixapi/{pyixapi.__version__}")
 
+    def test_connection_pool_size(self) -> None:
+        api = pyixapi.api(host, *def_args, pool_connections=4, pool_maxsize=32)
+        adapter = api.http_session.get_adapter(host)
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 32)
+
 
 class ApiTestCase(unittest.TestCase):
     @patch("requests.sessions.Session.post", return_value=auth_response())
@@ -261,3 +272,100 @@ class ApiHealthTestCase(unittest.TestCase):
             api = pyixapi.api(host, *def_args)
             result = api.health()
             self.assertEqual(result, {})
+
+
+class ApiThreadSafetyTestCase(unittest.TestCase):
+    threads = 32
+
+    def slow_route(self, content: dict) -> tuple:
+        calls: list[LocalRequest] = []
+        lock = threading.Lock()
+
+        def handler(request: LocalRequest) -> TransportResponse:
+            with lock:
+                calls.append(request)
+            time.sleep(0.05)
+            return TransportResponse(200, json.dumps(content).encode(), url=request.url)
+
+        return handler, calls
+
+    def run_concurrently(self, func) -> list:
+        barrier = threading.Barrier(self.threads)
+
+        def call(_):
+            barrier.wait()
+            return func()
+
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            return list(executor.map(call, range(self.threads)))
+
+    def test_concurrent_authenticate_is_single_flight(self) -> None:
+        transport = LocalTransport()
+        handler, calls = self.slow_route({"access_token": make_jwt(3600), "refresh_token": make_jwt(86400)})
+        transport.add("post", "/auth/token", handler=handler)
+        api = pyixapi.api(host, *def_args, transport=transport)
+
+        results = self.run_concurrently(api.authenticate)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len([r for r in results if r is not None]), 1)
+        self.assertFalse(api.access_token.is_expired)
+
+    def test_concurrent_refresh_is_single_flight(self) -> None:
+        transport = LocalTransport()
+        handler, calls = self.slow_route({"access_token": make_jwt(3600), "refresh_token": make_jwt(86400)})
+        transport.add("post", "/auth/refresh", handler=handler)
+        api = pyixapi.api(host, *def_args, refresh_token=make_jwt(3600), transport=transport)
+
+        results = self.run_concurrently(api.refresh_authentication)
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(r is results[0] for r in results))
+
+    def test_concurrent_version_probe_is_single_flight(self) -> None:
+        transport = LocalTransport()
+        handler, calls = self.slow_route({"status": "pass", "version": 2})
+        transport.add("get", "/health", handler=handler)
+        api = pyixapi.api(host, *def_args, transport=transport)
+
+        self.assertEqual(set(self.run_concurrently(lambda: api.version)), {2})
+        self.assertEqual(len(calls), 1)
+
+    def test_concurrent_unauthorized_calls_share_one_renewal(self) -> None:
+        transport = LocalTransport()
+        handler, renewals = self.slow_route({"access_token": make_jwt(3600), "refresh_token": make_jwt(86400)})
+        transport.add("post", "/auth/refresh", handler=handler)
+        api = pyixapi.api(
+            host, *def_args, access_token=make_jwt(1800), refresh_token=make_jwt(86400), transport=transport
+        )
+        revoked = api.access_token
+
+        def connections(request: LocalRequest) -> TransportResponse:
+            if request.headers["Authorization"] == f"Bearer {revoked.encoded}":
+                return TransportResponse(401, url=request.url)
+            return TransportResponse(200, b'[{"id": "CONN-001"}]', url=request.url)
+
+        transport.add("get", "/connections", handler=connections)
+
+        results = self.run_concurrently(lambda: [c.id for c in api.connections.all()])
+
+        self.assertEqual(results, [["CONN-001"]] * self.threads)
+        self.assertEqual(len(renewals), 1)
+        self.assertIsNot(api.access_token, revoked)
+
+    def test_unauthorized_refresh_falls_back_to_authentication(self) -> None:
+        transport = LocalTransport()
+        transport.add("post", "/auth/refresh", status_code=401)
+        transport.add("post", "/auth/token", {"access_token": make_jwt(3600), "refresh_token": make_jwt(86400)})
+        transport.add(
+            "get",
+            "/connections",
+            handler=lambda r: TransportResponse(401 if len(transport.requests) == 1 else 200, b"[]"),
+        )
+        api = pyixapi.api(
+            host, *def_args, access_token=make_jwt(3600), refresh_token=make_jwt(86400), transport=transport
+        )
+
+        self.assertEqual(list(api.connections.all()), [])
+        paths = [r.url.rsplit("/", 1)[-1] for r in transport.requests]
+        self.assertEqual(paths, ["connections", "refresh", "token", "connections"])
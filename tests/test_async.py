@@ -0,0 +1,357 @@
+import asyncio
+import json
+import unittest
+import warnings
+from unittest.mock import patch
+
+import httpx
+
+import pyixapi
+from pyixapi.core.api import AsyncAPI
+from pyixapi.core.query import AsyncRequest, ContentError, RequestError
+from pyixapi.core.response import AsyncRecord, CompactRecord, Record, async_model
+from pyixapi.core.token import Token
+from pyixapi.core.transport import HTTPXTransport
+from pyixapi.models import Connection, NetworkService
+
+from .util import def_args, host, make_jwt
+
+
+class MockServer(object):
+    """
+    Route httpx requests to canned responses, recording every request seen.
+    """
+
+    def __init__(self, routes: dict) -> None:
+        self.routes = routes
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        for (method, suffix), (status, content) in self.routes.items():
+            if request.method == method and request.url.path.endswith(suffix):
+                if content is None:
+                    return httpx.Response(status)
+                return httpx.Response(status, json=content)
+        return httpx.Response(404, text="Not Found")
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self))
+
+
+def auth_content() -> dict:
+    return {"access_token": make_jwt(3600), "refresh_token": make_jwt(86400)}
+
+
+class AsyncModelTestCase(unittest.TestCase):
+    def test_async_model_keeps_model_behaviour(self) -> None:
+        model = async_model(Connection)
+        self.assertTrue(issubclass(model, AsyncRecord))
+        self.assertTrue(issubclass(model, Connection))
+        self.assertIs(async_model(Connection), model)
+        self.assertIs(async_model(model), model)
+
+
+class AsyncRequestTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_get_yields_list_items(self) -> None:
+        server = MockServer({("GET", "/items"): (200, [{"id": "1"}, {"id": "2"}])})
+        async with server.client() as client:
+            request = AsyncRequest(base="https://api.example.net/v2/items", http_session=client)
+            items = [i async for i in request.get()]
+        self.assertEqual(items, [{"id": "1"}, {"id": "2"}])
+        self.assertEqual(request.count, 2)
+
+    async def test_filters_and_headers(self) -> None:
+        server = MockServer({("GET", "/items"): (200, [])})
+        async with server.client() as client:
+            request = AsyncRequest(
+                base="https://api.example.net/v2/items",
+                filters={"state": "production"},
+                user_agent="TestAgent/1.0",
+                http_session=client,
+            )
+            await request._make_call()
+        sent = server.requests[0]
+        self.assertEqual(sent.url.params["state"], "production")
+        self.assertEqual(sent.headers["User-Agent"], "TestAgent/1.0")
+
+    async def test_failure_raises_request_error(self) -> None:
+        server = MockServer({("POST", "/items"): (400, {"detail": "invalid"})})
+        async with server.client() as client:
+            request = AsyncRequest(base="https://api.example.net/v2/items", http_session=client)
+            with self.assertRaises(RequestError) as ctx:
+                await request.post({"name": "x"})
+        self.assertIn("400 Bad Request", str(ctx.exception))
+        self.assertEqual(json.loads(server.requests[0].content), {"name": "x"})
+
+    async def test_non_json_raises_content_error(self) -> None:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text="<html></html>")
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            request = AsyncRequest(base="https://api.example.net/v2/items", http_session=client)
+            with self.assertRaises(ContentError):
+                await request._make_call()
+
+    async def test_version_falls_back_to_1(self) -> None:
+        server = MockServer({})
+        async with server.client() as client:
+            request = AsyncRequest(base="https://api.example.net/v1", http_session=client)
+            self.assertEqual(await request.get_version(), 1)
+
+
+class AsyncAPITestCase(unittest.IsolatedAsyncioTestCase):
+    def make_api(self, routes: dict) -> tuple[AsyncAPI, MockServer]:
+        server = MockServer(routes)
+        return pyixapi.async_api(host, *def_args, http_session=server.client()), server
+
+    async def test_authenticate(self) -> None:
+        api, server = self.make_api({("POST", "/auth/token"): (200, auth_content())})
+        async with api:
+            self.assertIsNotNone(await api.authenticate())
+            self.assertIsNone(await api.authenticate())
+        self.assertFalse(api.access_token.is_expired)
+        self.assertEqual(len(server.requests), 1)
+
+    async def test_version_must_be_resolved(self) -> None:
+        api, _ = self.make_api({("GET", "/health"): (200, {"status": "pass", "version": 2})})
+        async with api:
+            with self.assertRaises(RuntimeError):
+                api.version
+            self.assertEqual(await api.get_version(), 2)
+            self.assertIn("accounts", api.accounts.url)
+            self.assertEqual((await api.health())["status"], "pass")
+
+    async def test_version_1_is_deprecated(self) -> None:
+        api, _ = self.make_api({})
+        async with api:
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                self.assertEqual(await api.get_version(), 1)
+                self.assertEqual(await api.health(), {})
+            self.assertTrue(issubclass(w[0].category, DeprecationWarning))
+
+    async def test_get_many(self) -> None:
+        api, server = self.make_api({("GET", "/ips"): (200, [{"id": "IP-1"}, {"id": "IP-2"}])})
+        async with api:
+            result = await api.ips.get_many(["IP-1", "IP-2", "IP-3"], max_url_length=len(api.ips.url) + 12)
+        self.assertEqual(sorted(result), ["IP-1", "IP-2"])
+        self.assertEqual(result.missing, ["IP-3"])
+        self.assertEqual(sorted(r.url.params["id"] for r in server.requests), ["IP-1", "IP-2", "IP-3"])
+
+    async def test_prefetch(self) -> None:
+        api, server = self.make_api(
+            {
+                ("GET", "/network-service-configs"): (
+                    200,
+                    [{"id": "NSC-1", "connection": "CONN-1", "macs": ["MAC-1"]}],
+                ),
+                ("GET", "/connections"): (200, [{"id": "CONN-1", "name": "C1"}]),
+                ("GET", "/macs"): (200, [{"id": "MAC-1", "address": "00:00:5E:00:53:01"}]),
+            }
+        )
+        async with api:
+            configs = [c async for c in api.network_service_configs.all().prefetch("connection", "macs")]
+        self.assertEqual(configs[0].connection.name, "C1")
+        self.assertEqual(str(configs[0].macs[0]), "00:00:5e:00:53:01")
+        self.assertEqual(len(server.requests), 3)
+
+    async def test_lazy_records(self) -> None:
+        api, _ = self.make_api(
+            {("GET", "/connections"): (200, [{"id": "CONN-001", "name": "C1", "ports": [{"id": "PORT-1"}]}])}
+        )
+        api.lazy_records = True
+        async with api:
+            records = [c async for c in api.connections.all()]
+        self.assertNotIn("ports", vars(records[0]))
+        self.assertIsInstance(records[0].ports[0], AsyncRecord)
+        self.assertEqual(dict(records[0]), {"id": "CONN-001", "name": "C1", "ports": [{"id": "PORT-1"}]})
+
+    async def test_compact_records(self) -> None:
+        server = MockServer({("GET", "/connections"): (200, [{"id": "CONN-001", "ports": [{"id": "PORT-1"}]}])})
+        api = pyixapi.async_api(host, *def_args, http_session=server.client(), compact_records=True)
+        async with api:
+            records = [c async for c in api.connections.all()]
+        self.assertIsInstance(records[0], Connection)
+        self.assertIsInstance(records[0], CompactRecord)
+        self.assertIsInstance(records[0].ports[0], AsyncRecord)
+        self.assertIsInstance(records[0].ports[0], CompactRecord)
+
+    async def test_all_and_filter(self) -> None:
+        api, server = self.make_api(
+            {("GET", "/connections"): (200, [{"id": "CONN-001", "name": "C1"}, {"id": "CONN-002", "name": "C2"}])}
+        )
+        async with api:
+            records = [c async for c in api.connections.all()]
+            filtered = [c async for c in api.connections.filter(state="production")]
+        self.assertEqual([c.id for c in records], ["CONN-001", "CONN-002"])
+        self.assertIsInstance(records[0], Connection)
+        self.assertEqual(len(filtered), 2)
+        self.assertEqual(server.requests[1].url.params["state"], "production")
+
+    async def test_get(self) -> None:
+        api, _ = self.make_api({("GET", "/connections/CONN-001"): (200, {"id": "CONN-001", "name": "C1"})})
+        async with api:
+            connection = await api.connections.get("CONN-001")
+            missing = await api.connections.get("CONN-404")
+        self.assertEqual(str(connection), "CONN-001: C1")
+        self.assertIsNone(missing)
+
+    async def test_get_by_filter_with_multiple_results_raises(self) -> None:
+        api, _ = self.make_api({("GET", "/connections"): (200, [{"id": "CONN-001"}, {"id": "CONN-002"}])})
+        async with api:
+            with self.assertRaises(ValueError):
+                await api.connections.get(state="production")
+
+    async def test_get_500_raises(self) -> None:
+        api, _ = self.make_api({("GET", "/connections/CONN-001"): (500, {"detail": "boom"})})
+        async with api:
+            with self.assertRaises(RequestError):
+                await api.connections.get("CONN-001")
+
+    async def test_create_save_and_delete(self) -> None:
+        api, server = self.make_api(
+            {
+                ("POST", "/connections"): (201, {"id": "CONN-001", "name": "C1"}),
+                ("PATCH", "/connections/CONN-001"): (200, {"id": "CONN-001", "name": "C2"}),
+                ("DELETE", "/connections/CONN-001"): (204, None),
+            }
+        )
+        async with api:
+            connection = await api.connections.create(name="C1")
+            self.assertTrue(await connection.update({"name": "C2"}))
+            self.assertEqual(connection.name, "C2")
+            self.assertFalse(await connection.save())
+            self.assertTrue(await connection.delete())
+        self.assertEqual(json.loads(server.requests[1].content), {"name": "C2"})
+
+    async def test_save_with_patch_format(self) -> None:
+        config = {"id": "NSC-001", "ips": ["IP-1", "IP-2", "IP-3", "IP-4"]}
+        server = MockServer(
+            {
+                ("GET", "/network-service-configs/NSC-001"): (200, config),
+                ("PATCH", "/network-service-configs/NSC-001"): (200, config),
+            }
+        )
+        api = pyixapi.async_api(host, *def_args, http_session=server.client(), patch_format="json-patch")
+        async with api:
+            nsc = await api.network_service_configs.get("NSC-001")
+            nsc.ips.remove("IP-2")
+            self.assertTrue(await nsc.save())
+        self.assertEqual(server.requests[1].headers["Content-Type"], "application/json-patch+json")
+        self.assertEqual(json.loads(server.requests[1].content), [{"op": "remove", "path": "/ips/1"}])
+
+    async def test_model_sub_resources_are_awaitable(self) -> None:
+        api, server = self.make_api(
+            {
+                ("GET", "/network-services/NS-001"): (200, {"id": "NS-001"}),
+                ("GET", "/network-services/NS-001/change-request"): (200, {"capacity": 1000}),
+                ("GET", "/statistics"): (200, {"average_in": 10}),
+            }
+        )
+        async with api:
+            service = await api.network_services.get("NS-001")
+            self.assertIsInstance(service, NetworkService)
+            self.assertEqual(await service.change_request(), {"capacity": 1000})
+            self.assertEqual(await service.statistics(start="2024-01-01"), {"average_in": 10})
+        self.assertEqual(server.requests[-1].url.params["start"], "2024-01-01")
+
+    async def test_nested_records_are_async(self) -> None:
+        api, _ = self.make_api({("GET", "/connections/CONN-001"): (200, {"id": "CONN-001", "ports": [{"id": "P"}]})})
+        async with api:
+            connection = await api.connections.get("CONN-001")
+        self.assertIsInstance(connection.ports[0], AsyncRecord)
+        self.assertNotIsInstance(Record({"id": "P"}, api, api.ports), AsyncRecord)
+
+    async def test_account(self) -> None:
+        api, _ = self.make_api({("GET", "/account"): (200, {"id": "ACCT-001", "name": "Mine"})})
+        async with api:
+            api._version = 2
+            account = await api.account()
+        self.assertEqual(str(account), "ACCT-001: Mine")
+
+    async def test_extensions_and_implementation(self) -> None:
+        api, _ = self.make_api(
+            {
+                ("GET", "/extensions"): (200, [{"name": "ext1"}]),
+                ("GET", "/implementation"): (200, {"name": "Test IXP"}),
+            }
+        )
+        async with api:
+            self.assertEqual((await api.extensions())[0]["name"], "ext1")
+            self.assertEqual((await api.implementation())["name"], "Test IXP")
+
+    async def test_refresh_authentication(self) -> None:
+        api, server = self.make_api({("POST", "/auth/refresh"): (200, auth_content())})
+        async with api:
+            with self.assertRaises(ValueError):
+                await api.refresh_authentication()
+            api.refresh_token = Token.from_jwt(make_jwt(3600))
+            await api.authenticate()
+        self.assertTrue(server.requests[0].url.path.endswith("/auth/refresh"))
+
+    def slow_api(self, **kwargs) -> tuple[AsyncAPI, list[httpx.Request]]:
+        requests: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=auth_content())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return pyixapi.async_api(host, *def_args, http_session=client, **kwargs), requests
+
+    async def test_concurrent_authenticate_is_single_flight(self) -> None:
+        api, requests = self.slow_api()
+        async with api:
+            results = await asyncio.gather(*(api.authenticate() for _ in range(20)))
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(len([r for r in results if r is not None]), 1)
+        self.assertFalse(api.access_token.is_expired)
+
+    async def test_concurrent_refresh_is_single_flight(self) -> None:
+        api, requests = self.slow_api(refresh_token=make_jwt(3600))
+        async with api:
+            results = await asyncio.gather(*(api.refresh_authentication() for _ in range(20)))
+        self.assertEqual(len(requests), 1)
+        self.assertTrue(requests[0].url.path.endswith("/auth/refresh"))
+        self.assertTrue(all(r is results[0] for r in results))
+
+    def test_default_client_uses_proxies(self) -> None:
+        api = pyixapi.async_api(host, *def_args, proxies={"https": "http://proxy:8080"})
+        self.assertIsInstance(api.http_session, httpx.AsyncClient)
+
+    async def test_transport_replaces_the_client(self) -> None:
+        client = MockServer({("GET", "/extensions"): (200, [])}).client()
+        with patch("requests.Session") as session:
+            api = pyixapi.async_api(host, *def_args, transport=HTTPXTransport(client))
+        session.assert_not_called()
+        self.assertIsNone(api.http_session)
+        async with api:
+            self.assertEqual(await api.extensions(), [])
+        self.assertTrue(client.is_closed)
+
+    async def test_unauthorized_calls_share_one_renewal(self) -> None:
+        revoked = make_jwt(1800)
+        refreshed = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/auth/refresh"):
+                refreshed.append(request)
+                return httpx.Response(200, json=auth_content())
+            if request.headers["Authorization"] == f"Bearer {revoked}":
+                return httpx.Response(401)
+            return httpx.Response(200, json=[{"id": "CONN-001"}])
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with pyixapi.async_api(
+            host, *def_args, access_token=revoked, refresh_token=make_jwt(86400), http_session=client
+        ) as api:
+
+            async def ids() -> list[str]:
+                return [c.id async for c in api.connections.all()]
+
+            results = await asyncio.gather(*(ids() for _ in range(8)))
+
+        self.assertEqual(results, [["CONN-001"]] * 8)
+        self.assertEqual(len(refreshed), 1)
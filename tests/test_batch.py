@@ -0,0 +1,136 @@
+import asyncio
+import json
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+import pyixapi
+from pyixapi.core.batch import AsyncBatcher, Batcher
+from pyixapi.core.query import RequestError
+from pyixapi.core.transport import LocalRequest, LocalTransport, TransportResponse
+
+from .util import def_args, host
+
+CONNECTIONS = {f"CONN-{i}": {"id": f"CONN-{i}", "name": f"Connection {i}"} for i in range(10)}
+
+
+def filter_by_id(request: LocalRequest) -> TransportResponse:
+    ids = request.params["id"].split(",")
+    content = [CONNECTIONS[i] for i in ids if i in CONNECTIONS]
+    return TransportResponse(200, json.dumps(content).encode(), url=request.url)
+
+
+class BatcherTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transport = LocalTransport()
+        self.transport.add("get", "/connections", handler=filter_by_id)
+        self.transport.add("get", "/macs", [{"id": "MAC-1"}])
+
+    def make_api(self, batcher: Batcher) -> pyixapi.api:
+        return pyixapi.api(host, *def_args, transport=self.transport, batcher=batcher)
+
+    def test_concurrent_lookups_are_batched(self) -> None:
+        api = self.make_api(Batcher(window=0.1))
+        keys = [f"CONN-{i % 5}" for i in range(20)] + ["CONN-404"]
+        barrier = threading.Barrier(len(keys))
+
+        def lookup(key: str):
+            barrier.wait()
+            return api.connections.get(key)
+
+        with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+            records = list(executor.map(lookup, keys))
+
+        self.assertEqual([r.id for r in records[:-1]], keys[:-1])
+        self.assertIsNone(records[-1])
+        self.assertIs(records[0], records[5])
+        self.assertEqual(len(self.transport.requests), 1)
+        self.assertEqual(sorted(self.transport.requests[0].params["id"].split(",")), sorted(set(keys)))
+
+    def test_explicit_flush(self) -> None:
+        batcher = Batcher(window=None)
+        api = self.make_api(batcher)
+
+        futures = [batcher.load(api.connections, f"CONN-{i}") for i in range(3)]
+        mac = batcher.load(api.macs, "MAC-1")
+        self.assertEqual(self.transport.requests, [])
+
+        batcher.flush()
+        self.assertEqual([f.result().name for f in futures], ["Connection 0", "Connection 1", "Connection 2"])
+        self.assertEqual(mac.result().id, "MAC-1")
+        self.assertEqual(len(self.transport.requests), 2)
+
+    def test_get_sends_the_pending_lookups(self) -> None:
+        batcher = Batcher(window=None)
+        api = self.make_api(batcher)
+
+        future = batcher.load(api.connections, "CONN-1")
+        self.assertEqual(api.connections.get("CONN-2").id, "CONN-2")
+        self.assertTrue(future.done())
+        self.assertEqual(len(self.transport.requests), 1)
+
+    def test_full_batches_are_sent(self) -> None:
+        batcher = Batcher(window=None, max_size=2)
+        api = self.make_api(batcher)
+
+        first = batcher.load(api.connections, "CONN-1")
+        batcher.load(api.connections, "CONN-1")
+        self.assertFalse(first.done())
+        batcher.load(api.connections, "CONN-2")
+        self.assertEqual(first.result().id, "CONN-1")
+        self.assertEqual(len(self.transport.requests), 1)
+
+    def test_errors_reach_every_caller(self) -> None:
+        self.transport.add("get", "/connections", status_code=500, content={"detail": "boom"})
+        batcher = Batcher(window=None)
+        api = self.make_api(batcher)
+
+        futures = [batcher.load(api.connections, f"CONN-{i}") for i in range(2)]
+        batcher.flush()
+        for future in futures:
+            self.assertIsInstance(future.exception(), RequestError)
+
+    def test_lookups_by_filter_are_not_batched(self) -> None:
+        self.transport.add("get", "/connections", [CONNECTIONS["CONN-1"]])
+        api = self.make_api(Batcher(window=None))
+        self.assertEqual(api.connections.get(name="Connection 1").id, "CONN-1")
+        self.assertEqual(self.transport.requests[0].params, {"name": "Connection 1"})
+
+    def test_invalid_size(self) -> None:
+        with self.assertRaises(ValueError):
+            Batcher(max_size=0)
+
+
+class AsyncBatcherTestCase(unittest.IsolatedAsyncioTestCase):
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        ids = request.url.params["id"].split(",")
+        return httpx.Response(200, json=[CONNECTIONS[i] for i in ids if i in CONNECTIONS])
+
+    async def asyncSetUp(self) -> None:
+        self.requests: list[httpx.Request] = []
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+    async def asyncTearDown(self) -> None:
+        await self.client.aclose()
+
+    async def test_concurrent_lookups_are_batched(self) -> None:
+        api = pyixapi.async_api(host, *def_args, http_session=self.client, batcher=AsyncBatcher())
+        keys = ["CONN-1", "CONN-2", "CONN-1", "CONN-404"]
+
+        records = await asyncio.gather(*(api.connections.get(key) for key in keys))
+
+        self.assertEqual([r.id if r else None for r in records], ["CONN-1", "CONN-2", "CONN-1", None])
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_explicit_flush(self) -> None:
+        batcher = AsyncBatcher(window=None)
+        api = pyixapi.async_api(host, *def_args, http_session=self.client, batcher=batcher)
+
+        futures = [batcher.load(api.connections, f"CONN-{i}") for i in range(3)]
+        self.assertEqual(self.requests, [])
+        await batcher.flush()
+        self.assertEqual([(await f).id for f in futures], ["CONN-0", "CONN-1", "CONN-2"])
+        self.assertEqual(len(self.requests), 1)
@@ -0,0 +1,529 @@
+import json
+import os
+import sqlite3
+import stat
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+import pyixapi
+from pyixapi.core.cache import (
+    CATALOG_TTLS,
+    ConditionalCache,
+    ResponseCache,
+    SQLiteCache,
+    TimeseriesCache,
+    cache_scope,
+)
+from pyixapi.core.timeseries import Timeseries, format_timestamp, parse_timestamp
+from pyixapi.core.transport import LocalRequest, LocalTransport, TransportResponse
+
+from .util import def_args, host
+
+
+class ResponseCacheTestCase(unittest.TestCase):
+    def test_only_endpoints_with_ttl_are_cached(self) -> None:
+        cache = ResponseCache()
+        self.assertEqual(cache.ttl_for("facilities"), CATALOG_TTLS["facilities"])
+        self.assertIsNone(cache.ttl_for("connections"))
+        cache.set("connections", f"{host}connections", [])
+        self.assertEqual(len(cache), 0)
+
+    def test_hits_and_misses(self) -> None:
+        cache = ResponseCache()
+        self.assertIs(cache.get("pops", f"{host}pops"), ResponseCache.MISSING)
+        cache.set("pops", f"{host}pops", [{"id": "POP-1"}], {"b": 1, "a": [1, 2]})
+        self.assertIs(cache.get("pops", f"{host}pops"), ResponseCache.MISSING)
+        self.assertEqual(cache.get("pops", f"{host}pops", {"a": [1, 2], "b": 1}), [{"id": "POP-1"}])
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_values_are_copied(self) -> None:
+        cache = ResponseCache()
+        value = [{"id": "POP-1", "facilities": []}]
+        cache.set("pops", f"{host}pops", value)
+        value[0]["facilities"].append("F")
+        cached = cache.get("pops", f"{host}pops")
+        cached[0]["facilities"].append("G")
+        self.assertEqual(cache.get("pops", f"{host}pops"), [{"id": "POP-1", "facilities": []}])
+
+    def test_entries_expire(self) -> None:
+        cache = ResponseCache(ttls={"pops": 10})
+        with patch("pyixapi.core.cache.time.monotonic", return_value=100):
+            cache.set("pops", f"{host}pops", [])
+        with patch("pyixapi.core.cache.time.monotonic", return_value=105):
+            self.assertEqual(cache.get("pops", f"{host}pops"), [])
+        with patch("pyixapi.core.cache.time.monotonic", return_value=111):
+            self.assertIs(cache.get("pops", f"{host}pops"), ResponseCache.MISSING)
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_are_evicted(self) -> None:
+        cache = ResponseCache(maxsize=2)
+        cache.set("pops", "1", 1)
+        cache.set("pops", "2", 2)
+        cache.get("pops", "1")
+        cache.set("pops", "3", 3)
+        self.assertIs(cache.get("pops", "2"), ResponseCache.MISSING)
+        self.assertEqual(cache.get("pops", "1"), 1)
+
+    def test_invalidate_and_clear(self) -> None:
+        cache = ResponseCache()
+        cache.set("pops", "1", 1)
+        cache.set("facilities", "2", 2)
+        cache.invalidate("pops")
+        self.assertEqual(len(cache), 1)
+        cache.get("facilities", "2")
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+
+class CachedEndpointTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transport = LocalTransport()
+        self.transport.add("get", "/facilities", [{"id": "FAC-1", "name": "F1"}])
+        self.transport.add("get", "/facilities/FAC-1", {"id": "FAC-1", "name": "F1"})
+        self.transport.add("get", "/connections", [])
+        self.cache = ResponseCache()
+        self.api = pyixapi.api(host, *def_args, transport=self.transport, cache=self.cache)
+
+    def test_catalog_endpoints_are_fetched_once(self) -> None:
+        first = list(self.api.facilities.all())
+        first[0].name = "changed"
+        second = list(self.api.facilities.all())
+        self.api.facilities.get("FAC-1")
+        self.api.facilities.get("FAC-1")
+
+        self.assertEqual(second[0].name, "F1")
+        self.assertEqual(len(self.transport.requests), 2)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 2))
+
+    def test_filters_are_part_of_the_key(self) -> None:
+        list(self.api.facilities.filter(metro_area="MA-1"))
+        list(self.api.facilities.filter(metro_area="MA-2"))
+        self.assertEqual(len(self.transport.requests), 2)
+
+    def test_credentials_are_part_of_the_key(self) -> None:
+        list(self.api.facilities.all())
+        other = pyixapi.api(host, "other-key", "other-secret", transport=self.transport, cache=self.cache)
+        list(other.facilities.all())
+        self.assertEqual(len(self.transport.requests), 2)
+        self.assertEqual(other.cache_scope, cache_scope("other-key"))
+        self.assertNotIn("other-key", other.cache_scope)
+
+    def test_other_endpoints_are_not_cached(self) -> None:
+        list(self.api.connections.all())
+        list(self.api.connections.all())
+        self.assertEqual(len(self.transport.requests), 2)
+        self.assertEqual(self.cache.misses, 0)
+
+    def test_writes_invalidate_the_endpoint(self) -> None:
+        self.transport.add("post", "/facilities", {"id": "FAC-2"})
+        self.transport.add("patch", "/facilities/FAC-1", {"id": "FAC-1", "name": "F2"})
+        self.transport.add("delete", "/facilities/FAC-1", status_code=204)
+
+        facility = next(self.api.facilities.all())
+        self.api.facilities.create(name="F2")
+        self.assertEqual(len(self.cache), 0)
+
+        list(self.api.facilities.all())
+        facility.name = "F2"
+        facility.save()
+        self.assertEqual(len(self.cache), 0)
+
+        list(self.api.facilities.all())
+        facility.delete()
+        self.assertEqual(len(self.cache), 0)
+
+
+class SQLiteCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache", "responses.sqlite3")
+
+    def make_cache(self, **kwargs) -> SQLiteCache:
+        cache = SQLiteCache(self.path, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_default_path_is_in_user_cache_directory(self) -> None:
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": "/var/cache/user"}):
+            self.assertEqual(SQLiteCache.default_path(), "/var/cache/user/pyixapi/responses.sqlite3")
+
+    def test_responses_outlive_the_instance(self) -> None:
+        cache = self.make_cache()
+        cache.set("pops", f"{host}pops", [{"id": "POP-1"}], {"metro_area": "MA-1"})
+        cache.set("connections", f"{host}connections", [])
+        cache.close()
+
+        other = self.make_cache()
+        self.assertEqual(len(other), 1)
+        self.assertEqual(other.get("pops", f"{host}pops", {"metro_area": "MA-1"}), [{"id": "POP-1"}])
+        self.assertIs(other.get("pops", f"{host}pops"), ResponseCache.MISSING)
+        self.assertEqual((other.hits, other.misses), (1, 1))
+
+    def test_staleness_bounds(self) -> None:
+        cache = self.make_cache(ttls={"pops": 100})
+        with patch("pyixapi.core.cache.time.time", return_value=1000):
+            cache.set("pops", f"{host}pops", [])
+        with patch("pyixapi.core.cache.time.time", return_value=1050):
+            self.assertEqual(cache.get("pops", f"{host}pops"), [])
+            self.assertIs(self.make_cache(max_age=30).get("pops", f"{host}pops"), ResponseCache.MISSING)
+        with patch("pyixapi.core.cache.time.time", return_value=1101):
+            self.assertIs(cache.get("pops", f"{host}pops"), ResponseCache.MISSING)
+
+    def test_least_recently_used_are_evicted(self) -> None:
+        cache = self.make_cache(maxsize=2)
+        clock = iter(range(1000, 1010))
+        with patch("pyixapi.core.cache.time.time", side_effect=lambda: next(clock)):
+            cache.set("pops", "1", 1)
+            cache.set("pops", "2", 2)
+            cache.get("pops", "1")
+            cache.set("pops", "3", 3)
+            self.assertIs(cache.get("pops", "2"), ResponseCache.MISSING)
+            self.assertEqual(cache.get("pops", "1"), 1)
+
+    def test_invalidate_and_clear(self) -> None:
+        cache = self.make_cache()
+        cache.set("pops", "1", 1)
+        cache.set("facilities", "2", 2)
+        cache.invalidate("pops")
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_concurrent_writers(self) -> None:
+        errors: list[Exception] = []
+
+        def write(n: int) -> None:
+            cache = SQLiteCache(self.path)
+            try:
+                for i in range(20):
+                    cache.set("pops", f"{n}-{i}", i)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                cache.close()
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.make_cache()), 160)
+
+    def test_used_by_endpoints(self) -> None:
+        transport = LocalTransport()
+        transport.add("get", "/facilities", [{"id": "FAC-1"}])
+        for _ in range(2):
+            api = pyixapi.api(host, *def_args, transport=transport, cache=self.make_cache())
+            self.assertEqual([f.id for f in api.facilities.all()], ["FAC-1"])
+        self.assertEqual(len(transport.requests), 1)
+
+        # Another account does not see the responses of the first one
+        api = pyixapi.api(host, "other-key", "other-secret", transport=transport, cache=self.make_cache())
+        list(api.facilities.all())
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_scopes(self) -> None:
+        cache = self.make_cache()
+        cache.set("pops", f"{host}pops", [1], scope="a")
+        self.assertEqual(cache.get("pops", f"{host}pops", scope="a"), [1])
+        self.assertIs(cache.get("pops", f"{host}pops", scope="b"), ResponseCache.MISSING)
+        self.assertIs(cache.get("pops", f"{host}pops"), ResponseCache.MISSING)
+
+    @unittest.skipIf(os.name != "posix", "file modes are POSIX only")
+    def test_database_is_private(self) -> None:
+        cache = self.make_cache()
+        cache.set("pops", f"{host}pops", [])
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.dirname(self.path)).st_mode) & 0o077, 0)
+
+    def test_older_databases_are_rebuilt(self) -> None:
+        os.makedirs(os.path.dirname(self.path))
+        connection = sqlite3.connect(self.path)
+        connection.execute(
+            "CREATE TABLE responses (name TEXT, url TEXT, params TEXT, value TEXT, "
+            "stored_at REAL, expires_at REAL, accessed_at REAL, PRIMARY KEY (name, url, params))"
+        )
+        connection.execute("INSERT INTO responses VALUES ('pops', 'u', '{}', '[]', 0, 1e12, 0)")
+        connection.commit()
+        connection.close()
+
+        cache = self.make_cache()
+        self.assertEqual(len(cache), 0)
+        cache.set("pops", "u", [1])
+        self.assertEqual(cache.get("pops", "u"), [1])
+
+
+class ConditionalCacheTestCase(unittest.TestCase):
+    def test_keeps_responses_with_validators_only(self) -> None:
+        cache = ConditionalCache()
+        cache.set(f"{host}ips", TransportResponse(200), [])
+        self.assertIsNone(cache.get(f"{host}ips"))
+
+        cache.set(f"{host}ips", TransportResponse(200, headers={"ETag": '"v1"'}), [{"id": "IP-1"}], {"a": 1})
+        entry = cache.get(f"{host}ips", {"a": 1})
+        assert entry is not None
+        self.assertEqual(cache.headers(entry), {"If-None-Match": '"v1"'})
+
+        # A response without validators forgets the previous one
+        cache.set(f"{host}ips", TransportResponse(200), [], {"a": 1})
+        self.assertIsNone(cache.get(f"{host}ips", {"a": 1}))
+
+    def test_revalidated(self) -> None:
+        cache = ConditionalCache()
+        headers = {"Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"}
+        cache.set(f"{host}ips", TransportResponse(200, headers=headers), [{"id": "IP-1"}])
+        entry = cache.get(f"{host}ips")
+        assert entry is not None
+        self.assertEqual(cache.headers(entry), {"If-Modified-Since": headers["Last-Modified"]})
+
+        content = cache.revalidated(entry, TransportResponse(304))
+        content.append("x")
+        self.assertEqual(cache.revalidated(entry, TransportResponse(304)), [{"id": "IP-1"}])
+        # Items are not copied, records copying what they build from them
+        self.assertIs(cache.revalidated(entry, TransportResponse(304))[0], content[0])
+        self.assertIs(cache.revalidated(entry, TransportResponse(200)), ResponseCache.MISSING)
+        self.assertIs(cache.revalidated(None, TransportResponse(200)), ResponseCache.MISSING)
+        self.assertEqual((cache.hits, cache.misses), (3, 2))
+
+    def test_least_recently_used_are_evicted(self) -> None:
+        cache = ConditionalCache(maxsize=1)
+        cache.set("1", TransportResponse(200, headers={"ETag": "1"}), 1)
+        cache.set("2", TransportResponse(200, headers={"ETag": "2"}), 2)
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get("1"))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class ConditionalRequestTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.etag = '"v1"'
+        self.transport = LocalTransport()
+        self.transport.add("get", "/network-service-configs", handler=self.handler)
+        self.cache = ConditionalCache()
+        self.api = pyixapi.api(host, *def_args, transport=self.transport, conditional_cache=self.cache)
+
+    def handler(self, request: LocalRequest) -> TransportResponse:
+        if request.headers.get("If-None-Match") == self.etag:
+            return TransportResponse(304, headers={"ETag": self.etag}, url=request.url)
+        body = b'[{"id": "NSC-1", "asns": [64500]}]' if self.etag == '"v1"' else b"[]"
+        return TransportResponse(200, body, headers={"ETag": self.etag}, url=request.url)
+
+    def test_not_modified_returns_previous_content(self) -> None:
+        first = list(self.api.network_service_configs.all())
+        first[0].asns.append(64501)
+        second = list(self.api.network_service_configs.all())
+
+        self.assertNotIn("If-None-Match", self.transport.requests[0].headers)
+        self.assertEqual(self.transport.requests[1].headers["If-None-Match"], '"v1"')
+        self.assertEqual(second[0].asns, [64500])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_modified_content_replaces_previous_one(self) -> None:
+        list(self.api.network_service_configs.all())
+        self.etag = '"v2"'
+        self.assertEqual(list(self.api.network_service_configs.all()), [])
+        entry = self.cache.get(f"{self.api.url}/network-service-configs", scope=self.api.cache_scope)
+        self.assertEqual(entry.etag, '"v2"')
+
+    def test_filters_are_revalidated_separately(self) -> None:
+        list(self.api.network_service_configs.all())
+        list(self.api.network_service_configs.filter(state="production"))
+        self.assertNotIn("If-None-Match", self.transport.requests[1].headers)
+
+    def test_apis_sharing_the_cache_are_kept_apart(self) -> None:
+        other = pyixapi.api(host, "another-key", def_args[1], transport=self.transport, conditional_cache=self.cache)
+        list(self.api.network_service_configs.all())
+        list(other.network_service_configs.all())
+        self.assertNotIn("If-None-Match", self.transport.requests[1].headers)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_record_sub_resources(self) -> None:
+        self.transport.add("get", "/ports", [{"id": "PORT-1"}])
+        self.transport.add("get", "/ports/PORT-1/statistics", {"average_in": 1}, headers={"ETag": '"s"'})
+        port = next(self.api.ports.all())
+        port.statistics()
+        port.statistics()
+        self.assertEqual(self.transport.requests[-1].headers["If-None-Match"], '"s"')
+
+
+class AsyncCachedEndpointTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_catalog_endpoints_are_fetched_once(self) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=[{"id": "POP-1"}])
+
+        cache = ResponseCache()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with pyixapi.async_api(host, *def_args, http_session=client, cache=cache) as api:
+            for _ in range(3):
+                self.assertEqual([p.id async for p in api.pops.all()], ["POP-1"])
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(cache.hits, 2)
+
+
+# 2024-01-01T00:00:00Z
+START = 1704067200
+NOW = START + 2 * 86400 + 1800
+
+
+def timeseries_response(params: dict, now: float) -> dict:
+    """
+    5 minute samples from start to end, or to now, the value being the timestamp.
+    """
+    start = int(parse_timestamp(params["start"])) if "start" in params else int(now) - 86400
+    end = parse_timestamp(params["end"]) if "end" in params else now
+    start += -start % 300
+    return {
+        "precision": 300,
+        "fields": ["timestamp", "average_bps_in"],
+        "samples": [[format_timestamp(t), t] for t in range(start, int(end), 300) if t < now],
+    }
+
+
+class TimeseriesCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = float(NOW)
+        self.windows: list[dict] = []
+
+        def handler(request: LocalRequest) -> TransportResponse:
+            self.windows.append(request.params)
+            body = json.dumps(timeseries_response(request.params, self.now)).encode()
+            return TransportResponse(200, body, {}, url=request.url)
+
+        self.transport = LocalTransport()
+        self.transport.add("get", "/ports/PORT-1", {"id": "PORT-1", "name": "eth1"})
+        self.transport.add("get", "/statistics/5m/timeseries", handler=handler)
+        self.cache = TimeseriesCache(bucket=3600, settle=900)
+        self.api = pyixapi.api(host, *def_args, transport=self.transport, timeseries_cache=self.cache)
+        self.port = self.api.ports.get("PORT-1")
+
+    def fetch(self, **params: str) -> Timeseries:
+        self.windows.clear()
+        with patch("pyixapi.core.cache.time.time", return_value=self.now):
+            return self.port.statistics_timeseries("5m", typed=True, **params)
+
+    def test_only_the_open_window_is_fetched_again(self) -> None:
+        first = self.fetch(start=format_timestamp(START))
+        self.assertEqual(list(first["timestamp"]), list(range(START, int(NOW), 300)))
+        # The closed buckets in one call, then the open window
+        self.assertEqual(
+            self.windows,
+            [
+                {"start": "2024-01-01T00:00:00Z", "end": "2024-01-03T00:00:00Z"},
+                {"start": "2024-01-03T00:00:00Z"},
+            ],
+        )
+        self.assertEqual(len(self.cache), 48)
+
+        second = self.fetch(start=format_timestamp(START))
+        self.assertEqual(self.windows, [{"start": "2024-01-03T00:00:00Z"}])
+        self.assertEqual(list(second["timestamp"]), list(first["timestamp"]))
+        self.assertEqual(list(second["average_bps_in"]), list(first["average_bps_in"]))
+        self.assertEqual(self.cache.hits, 48)
+
+    def test_buckets_closing_later_are_fetched_once(self) -> None:
+        self.fetch(start=format_timestamp(START))
+        self.now += 3600
+        ts = self.fetch(start=format_timestamp(START))
+        self.assertEqual(
+            self.windows,
+            [
+                {"start": "2024-01-03T00:00:00Z", "end": "2024-01-03T01:00:00Z"},
+                {"start": "2024-01-03T01:00:00Z"},
+            ],
+        )
+        self.assertEqual(list(ts["timestamp"]), list(range(START, int(self.now), 300)))
+
+    def test_past_windows_are_fetched_once(self) -> None:
+        params = {"start": "2024-01-01T10:30:00Z", "end": "2024-01-01T12:10:00Z"}
+        first = self.fetch(**params)
+        self.assertEqual(self.windows, [{"start": "2024-01-01T10:00:00Z", "end": "2024-01-01T13:00:00Z"}])
+        self.assertEqual(first["timestamp"][0], parse_timestamp(params["start"]))
+        self.assertEqual(first["timestamp"][-1], parse_timestamp("2024-01-01T12:05:00Z"))
+
+        second = self.fetch(**params)
+        self.assertEqual(self.windows, [])
+        self.assertEqual(list(second["timestamp"]), list(first["timestamp"]))
+
+    def test_calls_without_start_are_not_cached(self) -> None:
+        self.fetch()
+        self.fetch()
+        self.assertEqual(len(self.windows), 1)
+        self.assertEqual(len(self.cache), 0)
+        self.port.statistics_timeseries("5m", start=format_timestamp(START))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_other_params_are_part_of_the_key(self) -> None:
+        params = {"start": "2024-01-01T00:00:00Z", "end": "2024-01-01T01:00:00Z"}
+        self.fetch(**params)
+        self.fetch(**params, direction="in")
+        self.assertEqual(len(self.windows), 1)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_apis_sharing_the_cache_are_kept_apart(self) -> None:
+        def handler(request: LocalRequest) -> TransportResponse:
+            self.windows.append(request.params)
+            body = timeseries_response(request.params, self.now)
+            body["samples"] = [[t, 2.0] for t, _ in body["samples"]]
+            return TransportResponse(200, json.dumps(body).encode(), {}, url=request.url)
+
+        transport = LocalTransport()
+        transport.add("get", "/ports/PORT-1", {"id": "PORT-1", "name": "eth1"})
+        transport.add("get", "/statistics/5m/timeseries", handler=handler)
+        params = {"start": "2024-01-01T00:00:00Z", "end": "2024-01-01T01:00:00Z"}
+        self.fetch(**params)
+
+        for other in (
+            pyixapi.api("https://api.other.net/v2/", *def_args, transport=transport, timeseries_cache=self.cache),
+            pyixapi.api(host, "another-key", "secret", transport=transport, timeseries_cache=self.cache),
+        ):
+            self.port = other.ports.get("PORT-1")
+            ts = self.fetch(**params)
+            self.assertEqual(len(self.windows), 1)
+            self.assertEqual(ts.mean("average_bps_in"), 2.0)
+        self.assertEqual(len(self.cache), 3)
+
+    def test_maxsize(self) -> None:
+        self.cache.maxsize = 10
+        self.fetch(start=format_timestamp(START))
+        self.assertEqual(len(self.cache), 10)
+        self.cache.clear()
+        self.assertEqual((len(self.cache), self.cache.hits, self.cache.misses), (0, 0, 0))
+
+    def test_invalid_bucket(self) -> None:
+        with self.assertRaises(ValueError):
+            TimeseriesCache(bucket=0)
+
+
+class AsyncTimeseriesCacheTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_only_the_open_window_is_fetched_again(self) -> None:
+        windows: list[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if not request.url.path.endswith("/timeseries"):
+                return httpx.Response(200, json={"id": "PORT-1", "name": "eth1"})
+            params = dict(request.url.params)
+            windows.append(params)
+            return httpx.Response(200, json=timeseries_response(params, NOW))
+
+        cache = TimeseriesCache()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("pyixapi.core.cache.time.time", return_value=NOW):
+            async with pyixapi.async_api(host, *def_args, http_session=client, timeseries_cache=cache) as api:
+                port = await api.ports.get("PORT-1")
+                first = await port.statistics_timeseries("5m", typed=True, start=format_timestamp(START))
+                second = await port.statistics_timeseries("5m", typed=True, start=format_timestamp(START))
+        self.assertEqual(len(windows), 3)
+        self.assertEqual(windows[-1], {"start": "2024-01-03T00:00:00Z"})
+        self.assertEqual(list(second["timestamp"]), list(first["timestamp"]))
+        self.assertEqual(len(first), (NOW - START) // 300)
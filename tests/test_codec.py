@@ -0,0 +1,158 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+import pyixapi
+from pyixapi.core.codec import CODECS, JSONCodec, OrjsonCodec, UjsonCodec, get_codec
+from pyixapi.core.query import ContentError, Request
+from pyixapi.core.transport import (
+    HTTPXTransport,
+    LocalTransport,
+    RequestsTransport,
+    TransportResponse,
+    Urllib3Transport,
+)
+
+from .util import def_args, host
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def missing(*names: str):
+    """
+    Make the import of the given modules fail.
+    """
+    real_import = __import__
+
+    def fake_import(name, *args, **kwargs):
+        if name in names:
+            raise ImportError(f"No module named '{name}'")
+        return real_import(name, *args, **kwargs)
+
+    return patch("builtins.__import__", side_effect=fake_import)
+
+
+class GetCodecTestCase(unittest.TestCase):
+    def test_by_name(self) -> None:
+        self.assertIsInstance(get_codec("json"), JSONCodec)
+        self.assertEqual(get_codec("json").name, "json")
+
+    def test_instance_is_returned_as_is(self) -> None:
+        codec = JSONCodec()
+        self.assertIs(get_codec(codec), codec)
+
+    def test_unknown(self) -> None:
+        with self.assertRaises(ValueError):
+            get_codec("simplejson")
+
+    def test_missing_library(self) -> None:
+        with missing("ujson"), self.assertRaises(ImportError) as ctx:
+            get_codec("ujson")
+        self.assertIn("pip install ujson", str(ctx.exception))
+
+    def test_auto_falls_back_to_json(self) -> None:
+        with missing("orjson", "ujson"):
+            self.assertEqual(get_codec().name, "json")
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_auto_prefers_orjson(self) -> None:
+        self.assertIsInstance(get_codec(), OrjsonCodec)
+
+    def test_registry_order(self) -> None:
+        self.assertEqual(list(CODECS), [OrjsonCodec.name, UjsonCodec.name, JSONCodec.name])
+
+
+class CodecRoundTripTestCase(unittest.TestCase):
+    document = {"id": "IP-1", "address": "2001:db8::1", "tags": ["a", "é€😀"], "speed": 100000, "mtu": None}
+
+    def codecs(self) -> list[JSONCodec]:
+        available = []
+        for codec_class in CODECS.values():
+            try:
+                available.append(codec_class())
+            except ImportError:
+                pass
+        return available
+
+    def test_round_trip(self) -> None:
+        for codec in self.codecs():
+            with self.subTest(codec=codec.name):
+                data = codec.dumps(self.document)
+                self.assertIsInstance(data, bytes)
+                self.assertEqual(codec.loads(data), self.document)
+
+    def test_invalid_document(self) -> None:
+        for codec in self.codecs():
+            with self.subTest(codec=codec.name), self.assertRaises(ValueError):
+                codec.loads(b"<html>")
+
+
+class RequestCodecTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transport = LocalTransport()
+        self.codec = JSONCodec()
+
+    def request(self) -> Request:
+        return Request(host + "ips", MagicMock(), transport=self.transport, codec=self.codec)
+
+    def test_response_is_decoded_by_the_codec(self) -> None:
+        self.transport.add("get", "/ips", [{"id": "IP-1"}])
+        with patch.object(self.codec, "loads", wraps=self.codec.loads) as loads:
+            request = self.request()
+            self.assertEqual(list(request.get()), [{"id": "IP-1"}])
+        loads.assert_called_once()
+
+    def test_invalid_response(self) -> None:
+        self.transport.add("get", "/ips", handler=lambda request: TransportResponse(200, b"<html>", url=request.url))
+        with self.assertRaises(ContentError):
+            list(self.request().get())
+
+    def test_body_is_encoded_by_the_codec(self) -> None:
+        self.transport.add("post", "/ips", {"id": "IP-1"}, status_code=201)
+        with patch.object(self.codec, "dumps", wraps=self.codec.dumps) as dumps:
+            request = self.request()
+            self.assertEqual(request.post({"address": "10.0.0.1"}), {"id": "IP-1"})
+        dumps.assert_called_once_with({"address": "10.0.0.1"})
+        sent = self.transport.requests[-1]
+        self.assertEqual(sent.json, {"address": "10.0.0.1"})
+        self.assertTrue(sent.headers["Content-Type"].startswith("application/json"))
+
+    def test_api_codec(self) -> None:
+        self.transport.add("get", "/ips", [{"id": "IP-1", "address": "10.0.0.1"}])
+        api = pyixapi.api(host, *def_args, transport=self.transport, json_codec="json")
+        self.assertEqual(api.json_codec.name, "json")
+        self.assertEqual([ip.address for ip in api.ips.all()], ["10.0.0.1"])
+
+    def test_api_without_codec(self) -> None:
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+        self.assertIsNone(api.json_codec)
+
+
+class TransportContentTestCase(unittest.TestCase):
+    def test_requests_transport(self) -> None:
+        session = MagicMock()
+        RequestsTransport(session).request("post", host, {}, content=b'{"a":1}')
+        self.assertEqual(session.post.call_args[1]["data"], b'{"a":1}')
+        self.assertIsNone(session.post.call_args[1]["json"])
+
+    def test_urllib3_transport(self) -> None:
+        pool = MagicMock()
+        pool.request.return_value = MagicMock(status=201, headers={}, reason="Created", data=b"{}")
+        Urllib3Transport(pool_manager=pool).request("post", host, {}, content=b'{"a":1}')
+        self.assertEqual(pool.request.call_args[1]["body"], b'{"a":1}')
+
+    def test_httpx_transport(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=request.content)
+
+        async def send() -> bytes:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                r = await HTTPXTransport(client).request("post", host, {}, content=b'{"a":1}')
+                return r.content
+
+        self.assertEqual(asyncio.run(send()), b'{"a":1}')
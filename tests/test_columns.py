@@ -0,0 +1,125 @@
+import importlib.util
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+import pyixapi
+from pyixapi.core.columns import column_types, to_columns
+from pyixapi.core.transport import LocalTransport
+from pyixapi.models import IP, NetworkServiceConfig
+
+from .util import def_args, host
+
+IPS = [
+    {"id": "IP-1", "address": "192.0.2.1", "version": 4, "prefix_length": 24, "state": "production"},
+    {"id": "IP-2", "address": "2001:db8::1", "version": 6, "prefix_length": 64, "state": "production"},
+    {"id": "IP-3", "address": "2001:db8::2", "version": 6, "prefix_length": None, "state": "testing"},
+]
+CONFIGS = [
+    {"id": "NSC-1", "vlan_config": {"vlan_type": "dot1q", "vlan": 100}, "capacity": 1000, "ips": ["IP-1"]},
+    {
+        "id": "NSC-2",
+        "vlan_config": {"vlan_type": "qinq", "outer_vlan": 200, "inner_vlan": 10},
+        "capacity": None,
+        "ips": [],
+    },
+]
+
+
+class ToColumnsTestCase(unittest.TestCase):
+    def test_columns(self) -> None:
+        columns = to_columns(IPS)
+        self.assertEqual(list(columns), ["id", "address", "version", "prefix_length", "state"])
+        self.assertEqual(columns["id"], ["IP-1", "IP-2", "IP-3"])
+        self.assertEqual(columns["prefix_length"], [24, 64, None])
+
+    def test_missing_fields(self) -> None:
+        columns = to_columns([{"id": "IP-1"}, {"id": "IP-2", "address": "192.0.2.2"}])
+        self.assertEqual(columns["address"], [None, "192.0.2.2"])
+
+    def test_selected_fields(self) -> None:
+        self.assertEqual(
+            to_columns(IPS, ["address", "id"]), {"address": [i["address"] for i in IPS], "id": ["IP-1", "IP-2", "IP-3"]}
+        )
+
+    def test_nested_dicts(self) -> None:
+        columns = to_columns(CONFIGS)
+        self.assertEqual(
+            list(columns),
+            [
+                "id",
+                "vlan_config.vlan_type",
+                "vlan_config.vlan",
+                "vlan_config.outer_vlan",
+                "vlan_config.inner_vlan",
+                "capacity",
+                "ips",
+            ],
+        )
+        self.assertEqual(columns["vlan_config.vlan"], [100, None])
+        self.assertEqual(columns["vlan_config.outer_vlan"], [None, 200])
+        self.assertEqual(columns["ips"], [["IP-1"], []])
+        self.assertEqual(
+            to_columns(CONFIGS, ["vlan_config"], flatten=False)["vlan_config"][0], CONFIGS[0]["vlan_config"]
+        )
+
+    def test_column_types(self) -> None:
+        types = column_types(IP)
+        self.assertEqual(types["id"], "category")
+        self.assertEqual(types["network_service"], "category")
+        self.assertEqual(types["state"], "category")
+        self.assertEqual(types["prefix_length"], "int")
+        self.assertEqual(column_types(NetworkServiceConfig)["vlan_config.inner_vlan"], "int")
+
+
+class RecordSetColumnsTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transport = LocalTransport()
+        self.transport.add("get", "/ips", IPS)
+        self.transport.add("get", "/network-service-configs", CONFIGS)
+        self.api = pyixapi.api(host, *def_args, transport=self.transport)
+
+    def test_to_columns(self) -> None:
+        records = self.api.ips.all()
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records.to_columns("id", "version"), {"id": ["IP-1", "IP-2", "IP-3"], "version": [4, 6, 6]})
+        self.assertEqual(list(records), [])
+
+    def test_stream(self) -> None:
+        columns = self.api.ips.all(stream=True).to_columns()
+        self.assertEqual(columns["address"], [i["address"] for i in IPS])
+
+    def test_records_are_not_built(self) -> None:
+        with patch.object(IP, "__init__") as init:
+            self.api.ips.all().to_columns()
+        init.assert_not_called()
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+    def test_to_arrow(self) -> None:
+        import pyarrow as pa
+
+        table = self.api.network_service_configs.all().to_arrow()
+        self.assertEqual(table.num_rows, 2)
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("id").type))
+        self.assertEqual(table.schema.field("capacity").type, pa.int64())
+        self.assertEqual(table.column("vlan_config.vlan").to_pylist(), [100, None])
+
+    @unittest.skipUnless(importlib.util.find_spec("pandas"), "pandas is not installed")
+    def test_to_pandas(self) -> None:
+        frame = self.api.ips.all().to_pandas()
+        self.assertEqual(len(frame), 3)
+        self.assertEqual(str(frame["id"].dtype), "category")
+        self.assertEqual(str(frame["prefix_length"].dtype), "Int64")
+        self.assertEqual(frame["address"].tolist(), [i["address"] for i in IPS])
+
+
+class AsyncRecordSetColumnsTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_to_columns(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=IPS)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api = pyixapi.async_api(host, *def_args, http_session=client)
+            columns = await api.ips.all().to_columns("id", "prefix_length")
+        self.assertEqual(columns, {"id": ["IP-1", "IP-2", "IP-3"], "prefix_length": [24, 64, None]})
@@ -1,10 +1,15 @@
+import json
+import threading
+import time
 import unittest
 from unittest.mock import patch
+from urllib.parse import urlencode
 
 import pyixapi
 from pyixapi.core.endpoint import Endpoint
 from pyixapi.core.query import RequestError
-from pyixapi.core.response import Record
+from pyixapi.core.response import Record, RecordMap
+from pyixapi.core.transport import LocalRequest, LocalTransport, TransportResponse
 from pyixapi.models import Connection
 
 from .util import Response, auth_response, def_args, host
@@ -181,3 +186,64 @@ class EndpointTestCase(unittest.TestCase):
         list(self.api.connections.all())
         headers = mock_get.call_args[1]["headers"]
         self.assertEqual(headers["Authorization"], f"Bearer {self.api.access_token.encoded}")
+
+
+class GetManyTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.objects = {
+            f"IP-{i:04d}": {"id": f"IP-{i:04d}", "address": f"10.0.{i // 256}.{i % 256}"} for i in range(500)
+        }
+        self.threads: set[str] = set()
+        self.transport = LocalTransport()
+        self.transport.add("get", "/ips", handler=self.filter_by_id)
+        self.api = pyixapi.api(host, *def_args, transport=self.transport)
+
+    def filter_by_id(self, request: LocalRequest) -> TransportResponse:
+        self.threads.add(threading.current_thread().name)
+        time.sleep(0.005)
+        ids = request.params["id"].split(",")
+        content = [self.objects[i] for i in ids if i in self.objects]
+        return TransportResponse(200, json.dumps(content).encode(), url=request.url)
+
+    def url_length(self, request: LocalRequest) -> int:
+        return len(f"{request.url}?{urlencode(request.params)}")
+
+    def test_single_call(self) -> None:
+        result = self.api.ips.get_many(["IP-0001", "IP-0002", "IP-9999", "IP-0001"])
+        self.assertIsInstance(result, RecordMap)
+        self.assertEqual(list(result), ["IP-0001", "IP-0002"])
+        self.assertEqual(result["IP-0002"].address, "10.0.0.2")
+        self.assertEqual(result.missing, ["IP-9999"])
+        self.assertEqual(len(self.transport.requests), 1)
+        self.assertEqual(self.transport.requests[0].params, {"id": "IP-0001,IP-0002,IP-9999"})
+
+    def test_chunks_stay_under_the_url_length_limit(self) -> None:
+        ids = list(self.objects) + ["IP-9999"]
+        result = self.api.ips.get_many(ids, max_url_length=300)
+
+        self.assertEqual(list(result), list(self.objects))
+        self.assertEqual(result.missing, ["IP-9999"])
+        self.assertGreater(len(self.transport.requests), 1)
+        for request in self.transport.requests:
+            self.assertLessEqual(self.url_length(request), 300)
+        # Every chunk but the last one is full
+        self.assertGreater(self.url_length(self.transport.requests[0]), 300 - len("%2CIP-0000"))
+
+    def test_chunks_run_concurrently(self) -> None:
+        self.api.ips.get_many(self.objects, max_url_length=300, max_workers=4)
+        self.assertGreater(len(self.threads), 1)
+
+        self.threads.clear()
+        self.api.ips.get_many(self.objects, max_url_length=300, max_workers=1)
+        self.assertEqual(self.threads, {threading.current_thread().name})
+
+    def test_records_and_empty_list(self) -> None:
+        ip = Record({"id": "IP-0003"}, self.api, self.api.ips)
+        self.assertEqual(list(self.api.ips.get_many([ip])), ["IP-0003"])
+        result = self.api.ips.get_many([])
+        self.assertEqual((result, result.missing), ({}, []))
+
+    def test_failing_chunk(self) -> None:
+        self.transport.add("get", "/ips", status_code=500, content={"detail": "boom"})
+        with self.assertRaises(RequestError):
+            self.api.ips.get_many(self.objects, max_url_length=300)
@@ -0,0 +1,88 @@
+import gc
+import unittest
+
+import httpx
+
+import pyixapi
+from pyixapi.core.identity import IdentityMap
+from pyixapi.core.transport import LocalTransport
+
+from .util import def_args, host
+
+CONNECTIONS = [{"id": f"CONN-{i}", "name": f"Connection {i}", "speed": 10000} for i in range(3)]
+
+
+class IdentityMapTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.identity_map = IdentityMap()
+        self.transport = LocalTransport()
+        self.transport.add("get", "/connections", CONNECTIONS)
+        self.transport.add("get", "/connections/CONN-1", CONNECTIONS[1])
+        self.api = pyixapi.api(host, *def_args, transport=self.transport, identity_map=self.identity_map)
+
+    def test_objects_are_built_once(self) -> None:
+        first = list(self.api.connections.all())
+        second = list(self.api.connections.filter(speed=10000))
+        single = self.api.connections.get("CONN-1")
+
+        self.assertEqual(len(self.identity_map), 3)
+        for a, b in zip(first, second):
+            self.assertIs(a, b)
+        self.assertIs(single, first[1])
+        self.assertIs(self.identity_map.get(("connections", "CONN-1")), single)
+
+    def test_records_are_refreshed_in_place(self) -> None:
+        connection = self.api.connections.get("CONN-1")
+        self.transport.add("get", "/connections/CONN-1", {**CONNECTIONS[1], "name": "Renamed"})
+
+        self.assertIs(self.api.connections.get("CONN-1"), connection)
+        self.assertEqual(connection.name, "Renamed")
+        self.assertEqual(connection.updates(), {})
+
+    def test_records_are_held_weakly(self) -> None:
+        records = list(self.api.connections.all())
+        self.assertEqual(len(self.identity_map), 3)
+        del records
+        gc.collect()
+        self.assertEqual(len(self.identity_map), 0)
+
+    def test_deleted_records_are_forgotten(self) -> None:
+        self.transport.add("delete", "/connections/CONN-1", status_code=204)
+        connection = self.api.connections.get("CONN-1")
+        self.assertTrue(connection.delete())
+        self.assertNotIn(("connections", "CONN-1"), self.identity_map)
+
+    def test_created_records_are_registered(self) -> None:
+        self.transport.add("post", "/connections", {"id": "CONN-9", "name": "New"}, status_code=201)
+        connection = self.api.connections.create(name="New")
+        self.transport.add("get", "/connections/CONN-9", {"id": "CONN-9", "name": "New"})
+        self.assertIs(self.api.connections.get("CONN-9"), connection)
+
+    def test_objects_without_id_are_not_registered(self) -> None:
+        self.transport.add("get", "/connections", [{"name": "anonymous"}])
+        record = next(self.api.connections.all())
+        self.assertEqual(record.name, "anonymous")
+        self.assertEqual(len(self.identity_map), 0)
+
+    def test_disabled_by_default(self) -> None:
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+        self.assertIsNone(api.identity_map)
+        self.assertIsNot(next(api.connections.all()), next(api.connections.all()))
+
+    def test_clear(self) -> None:
+        records = list(self.api.connections.all())
+        self.identity_map.clear()
+        self.assertEqual(len(self.identity_map), 0)
+        self.assertIsNot(next(self.api.connections.all()), records[0])
+
+
+class AsyncIdentityMapTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_objects_are_built_once(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=CONNECTIONS)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api = pyixapi.async_api(host, *def_args, http_session=client, identity_map=IdentityMap())
+            first = [c async for c in api.connections.all()]
+            second = [c async for c in api.connections.all()]
+        self.assertIs(first[0], second[0])
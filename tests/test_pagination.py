@@ -0,0 +1,269 @@
+import threading
+import time
+import unittest
+from typing import Any
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+
+import pyixapi
+from pyixapi.core.codec import JSONCodec
+from pyixapi.core.pagination import CursorPagination, LimitOffsetPagination, Pagination, prefetch
+from pyixapi.core.query import RequestError
+from pyixapi.core.ratelimit import RateLimiter
+from pyixapi.core.retry import Retry
+from pyixapi.core.transport import LocalRequest, LocalTransport, TransportResponse
+
+from .util import def_args, host
+
+ITEMS = [{"id": f"IP-{i:03d}", "address": f"10.0.{i // 256}.{i % 256}"} for i in range(250)]
+
+
+def wait_for(condition: Any, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def prefetch_threads() -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == "pyixapi-prefetch"]
+
+
+class PaginationTestCase(unittest.TestCase):
+    def test_invalid_settings(self) -> None:
+        with self.assertRaises(ValueError):
+            Pagination(page_size=0)
+        with self.assertRaises(ValueError):
+            Pagination(prefetch=-1)
+
+    def test_limit_offset(self) -> None:
+        pagination = LimitOffsetPagination(page_size=2)
+        url, params = pagination.first_page(host, {"version": 4})
+        self.assertEqual(params, {"version": 4, "limit": 2, "offset": 0})
+        self.assertEqual(
+            pagination.next_page(url, params, [1, 2], None), (host, {"version": 4, "limit": 2, "offset": 2})
+        )
+        self.assertIsNone(pagination.next_page(url, params, [1], None))
+        self.assertIsNone(pagination.next_page(url, params, [], None))
+        # The server ignored the limit
+        self.assertIsNone(pagination.next_page(url, params, [1, 2, 3], None))
+
+    def test_limit_offset_parameter_names(self) -> None:
+        pagination = LimitOffsetPagination(page_size=10, limit_param="page_size", offset_param="start")
+        self.assertEqual(pagination.first_page(host, {}), (host, {"page_size": 10, "start": 0}))
+
+    def test_cursor(self) -> None:
+        pagination = CursorPagination(page_size=2)
+        url, params = pagination.first_page(host + "ips", {"version": 4})
+        self.assertEqual(params, {"version": 4, "limit": 2})
+
+        r = TransportResponse(200, headers={"Link": '<ips?cursor=abc&limit=2>; rel="next", <ips>; rel="first"'})
+        self.assertEqual(pagination.next_page(url, params, [1, 2], r), (host + "ips?cursor=abc&limit=2", {}))
+
+        r = TransportResponse(200, headers={"Link": '<ips>; rel="first"'})
+        self.assertIsNone(pagination.next_page(url, params, [1, 2], r))
+        self.assertIsNone(pagination.next_page(url, params, [1, 2], TransportResponse(200)))
+
+
+class PrefetchTestCase(unittest.TestCase):
+    def test_pages_are_fetched_ahead(self) -> None:
+        fetched: list[int] = []
+
+        def pages():
+            for i in range(10):
+                fetched.append(i)
+                yield i
+
+        iterator = prefetch(pages(), 2)
+        self.assertEqual(next(iterator), 0)
+        # Two pages waiting in the queue and one waiting for room
+        self.assertTrue(wait_for(lambda: len(fetched) == 4))
+        time.sleep(0.05)
+        self.assertEqual(len(fetched), 4)
+        self.assertEqual(list(iterator), list(range(1, 10)))
+
+    def test_errors_reach_the_consumer(self) -> None:
+        def pages():
+            yield 1
+            raise RuntimeError("boom")
+
+        iterator = prefetch(pages(), 1)
+        self.assertEqual(next(iterator), 1)
+        with self.assertRaises(RuntimeError):
+            next(iterator)
+
+    def test_thread_stops_when_the_iteration_is_closed(self) -> None:
+        closed = threading.Event()
+
+        def pages():
+            try:
+                for i in range(100):
+                    yield i
+            finally:
+                closed.set()
+
+        iterator = prefetch(pages(), 1)
+        next(iterator)
+        iterator.close()
+        self.assertTrue(closed.wait(2))
+        self.assertTrue(wait_for(lambda: not prefetch_threads()))
+
+
+class PaginatedRecordSetTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transport = LocalTransport()
+
+    def limit_offset(self, fail_at: int | None = None) -> None:
+        def handler(request: LocalRequest) -> TransportResponse:
+            offset, limit = request.params["offset"], request.params["limit"]
+            if offset == fail_at:
+                return self.transport_response(500, {"detail": "boom"}, request)
+            return self.transport_response(200, ITEMS[offset : offset + limit], request)
+
+        self.transport.add("get", "/ips", handler=handler)
+
+    def transport_response(
+        self, status_code: int, content: Any, request: LocalRequest, **headers: str
+    ) -> TransportResponse:
+        return TransportResponse(status_code, JSONCodec().dumps(content), headers, url=request.url)
+
+    def test_limit_offset(self) -> None:
+        self.limit_offset()
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+
+        records = api.ips.filter(pagination=LimitOffsetPagination(page_size=100), version=4)
+        self.assertEqual([r.id for r in records], [i["id"] for i in ITEMS])
+        self.assertEqual(records.request.count, 250)
+        self.assertEqual([r.params["offset"] for r in self.transport.requests], [0, 100, 200])
+        self.assertTrue(all(r.params["version"] == 4 for r in self.transport.requests))
+
+    def test_exact_multiple_of_the_page_size(self) -> None:
+        self.limit_offset()
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+        self.assertEqual(len(list(api.ips.all(pagination=LimitOffsetPagination(page_size=125, prefetch=0)))), 250)
+        self.assertEqual([r.params["offset"] for r in self.transport.requests], [0, 125, 250])
+
+    def test_cursor(self) -> None:
+        def handler(request: LocalRequest) -> TransportResponse:
+            query = parse_qs(urlsplit(request.url).query)
+            start = int(query["cursor"][0]) if "cursor" in query else 0
+            limit = int(query["limit"][0]) if "limit" in query else request.params["limit"]
+            headers = {}
+            if start + limit < len(ITEMS):
+                headers["Link"] = f'<ips?cursor={start + limit}&limit={limit}>; rel="next"'
+            return self.transport_response(200, ITEMS[start : start + limit], request, **headers)
+
+        self.transport.add("get", "/ips", handler=handler)
+        api = pyixapi.api(host, *def_args, transport=self.transport, pagination=CursorPagination(page_size=100))
+
+        self.assertEqual([r.id for r in api.ips.all()], [i["id"] for i in ITEMS])
+        self.assertEqual(len(self.transport.requests), 3)
+
+    def test_next_page_is_prefetched(self) -> None:
+        self.limit_offset()
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+
+        records = api.ips.all(pagination=LimitOffsetPagination(page_size=10, prefetch=1))
+        next(records)
+        self.assertTrue(wait_for(lambda: len(self.transport.requests) == 3))
+        time.sleep(0.05)
+        self.assertEqual(len(self.transport.requests), 3)
+        self.assertEqual(len(list(records)), 249)
+
+    def test_pages_are_fetched_on_demand_without_prefetch(self) -> None:
+        self.limit_offset()
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+
+        records = api.ips.all(pagination=LimitOffsetPagination(page_size=10, prefetch=0))
+        next(records)
+        self.assertEqual(len(self.transport.requests), 1)
+        self.assertEqual(len(list(records)), 249)
+        self.assertEqual(len(self.transport.requests), 26)
+
+    def test_failing_page(self) -> None:
+        self.limit_offset(fail_at=100)
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+
+        records = api.ips.all(pagination=LimitOffsetPagination(page_size=100))
+        self.assertEqual(len([next(records) for _ in range(100)]), 100)
+        with self.assertRaises(RequestError):
+            next(records)
+
+    def test_len_is_not_available(self) -> None:
+        self.limit_offset()
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+        with self.assertRaises(TypeError):
+            len(api.ips.all(pagination=LimitOffsetPagination()))
+
+    def test_streaming(self) -> None:
+        self.transport.add("get", "/macs", [{"id": "MAC-1"}])
+        api = pyixapi.api(host, *def_args, transport=self.transport, pagination=LimitOffsetPagination())
+
+        # The pagination of the API does not apply to streamed lists
+        self.assertEqual([m.id for m in api.macs.all(stream=True)], ["MAC-1"])
+        self.assertNotIn("limit", self.transport.requests[0].params)
+        with self.assertRaises(ValueError):
+            list(api.macs.all(stream=True, pagination=LimitOffsetPagination()))
+
+    def test_unpaginated_endpoint(self) -> None:
+        self.transport.add("get", "/ips", ITEMS)
+        api = pyixapi.api(host, *def_args, transport=self.transport, pagination=LimitOffsetPagination(page_size=100))
+
+        # The whole list is returned whatever the offset, and fetched only once
+        self.assertEqual(len(list(api.ips.all())), 250)
+        self.assertEqual(len(self.transport.requests), 1)
+
+    def test_single_objects_are_not_paginated(self) -> None:
+        self.transport.add("get", "/ips/IP-001", ITEMS[1])
+        api = pyixapi.api(host, *def_args, transport=self.transport, pagination=LimitOffsetPagination())
+        self.assertEqual(api.ips.get("IP-001").id, "IP-001")
+        self.assertEqual(self.transport.requests[0].params, {})
+
+
+class AsyncPaginatedRecordSetTestCase(unittest.IsolatedAsyncioTestCase):
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        offset, limit = int(request.url.params["offset"]), int(request.url.params["limit"])
+        return httpx.Response(200, json=ITEMS[offset : offset + limit])
+
+    async def test_limit_offset(self) -> None:
+        for prefetch_depth in (0, 2):
+            self.requests: list[httpx.Request] = []
+            async with httpx.AsyncClient(transport=httpx.MockTransport(self.handler)) as client:
+                api = pyixapi.async_api(host, *def_args, http_session=client)
+                pagination = LimitOffsetPagination(page_size=100, prefetch=prefetch_depth)
+                records = api.ips.all(pagination=pagination)
+                ids = [r.id async for r in records]
+            self.assertEqual(ids, [i["id"] for i in ITEMS])
+            self.assertEqual(records.request.count, 250)
+            self.assertEqual([r.url.params["offset"] for r in self.requests], ["0", "100", "200"])
+
+    async def test_retry_and_rate_limiter(self) -> None:
+        self.requests = []
+        failed: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            offset = request.url.params["offset"]
+            if offset == "100" and not failed:
+                failed.append(offset)
+                self.requests.append(request)
+                return httpx.Response(503, headers={"Retry-After": "0"})
+            return self.handler(request)
+
+        limiter = RateLimiter(rate=1000, burst=10)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api = pyixapi.async_api(
+                host, *def_args, http_session=client, retry=Retry(backoff_factor=0), rate_limiter=limiter
+            )
+            # Waits must not block the event loop
+            with (
+                patch.object(RateLimiter, "acquire", side_effect=AssertionError),
+                patch("pyixapi.core.query.time.sleep", side_effect=AssertionError),
+            ):
+                ids = [r.id async for r in api.ips.all(pagination=LimitOffsetPagination(page_size=100))]
+        self.assertEqual(ids, [i["id"] for i in ITEMS])
+        self.assertEqual([r.url.params["offset"] for r in self.requests], ["0", "100", "100", "200"])
@@ -0,0 +1,201 @@
+import copy
+import json
+import random
+import unittest
+from typing import Any
+
+import pyixapi
+from pyixapi.core.patch import check_patch_format, json_patch, merge_patch
+from pyixapi.core.transport import LocalTransport
+
+from .util import def_args, host
+
+
+def apply_merge_patch(target: Any, patch: Any) -> Any:
+    if not isinstance(patch, dict):
+        return patch
+    target = dict(target) if isinstance(target, dict) else {}
+    for k, v in patch.items():
+        if v is None:
+            target.pop(k, None)
+        else:
+            target[k] = apply_merge_patch(target.get(k), v)
+    return target
+
+
+def apply_json_patch(document: Any, operations: list[dict]) -> Any:
+    document = copy.deepcopy(document)
+    for operation in operations:
+        tokens = [t.replace("~1", "/").replace("~0", "~") for t in operation["path"].split("/")[1:]]
+        if not tokens:
+            document = operation["value"]
+            continue
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token) if isinstance(parent, list) else token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            index = len(parent) if last == "-" else int(last)
+            if operation["op"] == "add":
+                parent.insert(index, operation["value"])
+            elif operation["op"] == "remove":
+                del parent[index]
+            else:
+                parent[index] = operation["value"]
+        elif operation["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = operation["value"]
+    return document
+
+
+class MergePatchTestCase(unittest.TestCase):
+    def test_nested_dicts(self) -> None:
+        old = {"vlan_config": {"vlan_type": "qinq", "outer_vlan": 100, "inner_vlan": 10}, "capacity": 1000}
+        new = {"vlan_config": {"vlan_type": "qinq", "outer_vlan": 100, "inner_vlan": 20}, "capacity": 1000}
+        self.assertEqual(merge_patch(old, new), {"vlan_config": {"inner_vlan": 20}})
+        self.assertEqual(apply_merge_patch(old, merge_patch(old, new)), new)
+
+    def test_removed_members(self) -> None:
+        self.assertEqual(merge_patch({"a": 1, "b": 2}, {"a": 1}), {"b": None})
+
+    def test_other_values_are_replaced(self) -> None:
+        self.assertEqual(merge_patch({"ips": ["IP-1", "IP-2"]}, {"ips": ["IP-1"]}), {"ips": ["IP-1"]})
+        self.assertEqual(merge_patch({"a": {"b": 1}}, {"a": 5}), {"a": 5})
+        self.assertEqual(merge_patch({"a": 1}, {"a": 1}), {})
+
+
+class JSONPatchTestCase(unittest.TestCase):
+    def test_dicts(self) -> None:
+        old = {"a": 1, "b": {"c": 2, "d": 3}, "e": 4}
+        new = {"a": 1, "b": {"c": 5, "d": 3}, "f": 6}
+        self.assertEqual(
+            json_patch(old, new),
+            [
+                {"op": "remove", "path": "/e"},
+                {"op": "replace", "path": "/b/c", "value": 5},
+                {"op": "add", "path": "/f", "value": 6},
+            ],
+        )
+
+    def test_list_insertion_and_removal(self) -> None:
+        ips = [f"IP-{i}" for i in range(20)]
+        inserted = ips[:5] + ["IP-X"] + ips[5:]
+        self.assertEqual(
+            json_patch({"ips": ips}, {"ips": inserted}), [{"op": "add", "path": "/ips/5", "value": "IP-X"}]
+        )
+        removed = ips[:5] + ips[7:]
+        self.assertEqual(
+            json_patch({"ips": ips}, {"ips": removed}),
+            [{"op": "remove", "path": "/ips/5"}, {"op": "remove", "path": "/ips/5"}],
+        )
+
+    def test_short_lists_are_replaced(self) -> None:
+        self.assertEqual(
+            json_patch({"asns": [1, 2, 3]}, {"asns": [4]}), [{"op": "replace", "path": "/asns", "value": [4]}]
+        )
+
+    def test_pointer_escaping(self) -> None:
+        self.assertEqual(
+            json_patch({"a/b": {"~c": 1}}, {"a/b": {"~c": 2}}), [{"op": "replace", "path": "/a~1b/~0c", "value": 2}]
+        )
+
+    def test_type_changes(self) -> None:
+        self.assertEqual(json_patch({"a": [1]}, {"a": {"0": 1}}), [{"op": "replace", "path": "/a", "value": {"0": 1}}])
+
+    def test_random_documents(self) -> None:
+        rng = random.Random(7)
+
+        def value(depth: int = 0) -> Any:
+            kind = rng.choice(["scalar", "scalar", "list", "dict"] if depth < 3 else ["scalar"])
+            if kind == "list":
+                return [value(depth + 1) for _ in range(rng.randint(0, 6))]
+            if kind == "dict":
+                return {rng.choice("abcd/~"): value(depth + 1) for _ in range(rng.randint(0, 4))}
+            return rng.choice([None, True, 0, 1, "x", "y"])
+
+        def mutate(v: Any) -> Any:
+            if isinstance(v, list) and v and rng.random() < 0.8:
+                v = list(v)
+                action = rng.choice(["insert", "remove", "change"])
+                index = rng.randrange(len(v))
+                if action == "insert":
+                    v.insert(index, value(2))
+                elif action == "remove":
+                    del v[index]
+                else:
+                    v[index] = mutate(v[index])
+                return v
+            if isinstance(v, dict) and v and rng.random() < 0.8:
+                v = dict(v)
+                key = rng.choice(list(v))
+                v[key] = mutate(v[key])
+                return v
+            return value(2)
+
+        for _ in range(500):
+            old = {"field": value()}
+            new = {"field": mutate(copy.deepcopy(old["field"]))}
+            self.assertEqual(apply_json_patch(old, json_patch(old, new)), new)
+            # Merge patches cannot set members to None
+            if "null" not in json.dumps(new):
+                self.assertEqual(apply_merge_patch(old, merge_patch(old, new)), new)
+
+
+class RecordPatchTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ips = [f"IP-{i}" for i in range(50)]
+        self.config = {
+            "id": "NSC-1",
+            "vlan_config": {"vlan_type": "dot1q", "vlan": 100},
+            "ips": self.ips,
+            "state": "production",
+        }
+        self.transport = LocalTransport()
+        self.transport.add("get", "/network-service-configs/NSC-1", self.config)
+        self.transport.add("patch", "/network-service-configs/NSC-1", self.config)
+
+    def change(self, patch_format: str | None) -> Any:
+        api = pyixapi.api(host, *def_args, transport=self.transport, patch_format=patch_format)
+        config = api.network_service_configs.get("NSC-1")
+        config.vlan_config["vlan"] = 200
+        config.ips.append("IP-50")
+        self.assertTrue(config.save())
+        return self.transport.requests[-1]
+
+    def test_without_format(self) -> None:
+        request = self.change(None)
+        self.assertEqual(
+            request.json, {"vlan_config": {"vlan_type": "dot1q", "vlan": 200}, "ips": self.ips + ["IP-50"]}
+        )
+
+    def test_merge_patch(self) -> None:
+        request = self.change("merge-patch")
+        self.assertEqual(request.headers["Content-Type"], "application/merge-patch+json")
+        self.assertEqual(request.json["vlan_config"], {"vlan": 200})
+        self.assertEqual(len(request.json["ips"]), 51)
+
+    def test_json_patch(self) -> None:
+        request = self.change("json-patch")
+        self.assertEqual(request.headers["Content-Type"], "application/json-patch+json")
+        self.assertCountEqual(
+            request.json,
+            [
+                {"op": "replace", "path": "/vlan_config/vlan", "value": 200},
+                {"op": "add", "path": "/ips/50", "value": "IP-50"},
+            ],
+        )
+
+    def test_updates(self) -> None:
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+        config = api.network_service_configs.get("NSC-1")
+        self.assertEqual(config.updates("json-patch"), [])
+        setattr(config, "state", "decommissioned")
+        self.assertEqual(config.updates("merge-patch"), {"state": "decommissioned"})
+        with self.assertRaises(ValueError):
+            config.updates("xml-patch")
+
+    def test_invalid_format(self) -> None:
+        self.assertIsNone(check_patch_format(None))
+        with self.assertRaises(ValueError):
+            pyixapi.api(host, *def_args, patch_format="xml-patch")
@@ -431,3 +431,44 @@ class RequestTestCase(unittest.TestCase):
 
         call_args = self.http_session.get.call_args
         self.assertEqual(call_args[1]["headers"]["accept"], "application/json;")
+
+    def test_unauthorized_call_is_replayed_once_with_renewed_token(self) -> None:
+        renewed = Token.from_jwt(make_jwt(3600))
+        reauth = MagicMock(return_value=renewed)
+        self.http_session.get.side_effect = [
+            MagicMock(ok=False, status_code=401),
+            MagicMock(ok=True, status_code=200, **{"json.return_value": [{"id": "1"}]}),
+        ]
+
+        request = Request(
+            base="https://api.example.net/v1/items",
+            token=self.token,
+            http_session=self.http_session,
+            reauth=reauth,
+        )
+        self.assertEqual(list(request.get()), [{"id": "1"}])
+
+        reauth.assert_called_once_with(self.token)
+        self.assertIs(request.token, renewed)
+        headers = self.http_session.get.call_args[1]["headers"]
+        self.assertEqual(headers["Authorization"], f"Bearer {renewed.encoded}")
+
+    def test_unauthorized_call_is_not_replayed_twice(self) -> None:
+        reauth = MagicMock(return_value=Token.from_jwt(make_jwt(3600)))
+        self.http_session.get.return_value = MagicMock(ok=False, status_code=401)
+
+        request = Request(base="https://api.example.net/v1/items", http_session=self.http_session, reauth=reauth)
+        with self.assertRaises(RequestError):
+            list(request.get())
+        reauth.assert_called_once()
+        self.assertEqual(self.http_session.get.call_count, 2)
+
+    def test_unauthorized_call_without_renewal_raises(self) -> None:
+        self.http_session.get.return_value = MagicMock(ok=False, status_code=401)
+
+        request = Request(
+            base="https://api.example.net/v1/items", http_session=self.http_session, reauth=MagicMock(return_value=None)
+        )
+        with self.assertRaises(RequestError):
+            list(request.get())
+        self.http_session.get.assert_called_once()
@@ -0,0 +1,145 @@
+import json
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+import pyixapi
+from pyixapi.core.query import AsyncRequest
+from pyixapi.core.ratelimit import RateLimiter
+from pyixapi.core.transport import LocalRequest, LocalTransport, TransportResponse
+
+from .util import def_args, host, make_jwt
+
+
+class Clock(object):
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RateLimiterTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = Clock()
+        patcher = patch("pyixapi.core.ratelimit.time.monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_invalid_settings(self) -> None:
+        with self.assertRaises(ValueError):
+            RateLimiter(0)
+        with self.assertRaises(ValueError):
+            RateLimiter(1, burst=0)
+
+    def test_burst_then_sustained_rate(self) -> None:
+        limiter = RateLimiter(rate=2, burst=3)
+        self.assertEqual([limiter.reserve() for _ in range(3)], [0, 0, 0])
+        # Callers queue behind each other at the sustained rate
+        self.assertEqual([limiter.reserve() for _ in range(3)], [0.5, 1.0, 1.5])
+
+    def test_refills_over_time_up_to_burst(self) -> None:
+        limiter = RateLimiter(rate=2, burst=2)
+        limiter.reserve()
+        limiter.reserve()
+        self.clock.now += 0.5
+        self.assertEqual(limiter.reserve(), 0)
+        self.assertEqual(limiter.reserve(), 0.5)
+        self.clock.now += 60
+        self.assertEqual([limiter.reserve() for _ in range(3)], [0, 0, 0.5])
+
+    def test_shared_per_host(self) -> None:
+        limiter = RateLimiter.for_host("https://ratelimit.example.net/api/v2/", rate=5)
+        self.assertIs(RateLimiter.for_host("https://ratelimit.example.net/api/v1", rate=10), limiter)
+        self.assertEqual(limiter.rate, 5)
+        self.assertIsNot(RateLimiter.for_host("https://other.example.net/", rate=5), limiter)
+
+    def test_thread_safe(self) -> None:
+        limiter = RateLimiter(rate=1, burst=1)
+        delays: list[float] = []
+        threads = [threading.Thread(target=lambda: delays.append(limiter.reserve())) for _ in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(sorted(delays), [float(i) for i in range(20)])
+
+
+@patch("pyixapi.core.ratelimit.time.sleep")
+class RateLimitedRequestTestCase(unittest.TestCase):
+    def test_api_calls_wait_for_the_limiter(self, sleep) -> None:
+        transport = LocalTransport()
+        transport.add("get", "/connections", [])
+        api = pyixapi.api(host, *def_args, transport=transport, rate_limiter=RateLimiter(rate=10, burst=2))
+
+        for _ in range(4):
+            list(api.connections.all())
+
+        self.assertEqual(len(transport.requests), 4)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_replayed_calls_wait_for_the_limiter(self, sleep) -> None:
+        revoked = make_jwt(1800)
+
+        def connections(request: LocalRequest) -> TransportResponse:
+            if request.headers["Authorization"] == f"Bearer {revoked}":
+                return TransportResponse(401, url=request.url)
+            return TransportResponse(200, b"[]", url=request.url)
+
+        tokens = json.dumps({"access_token": make_jwt(3600), "refresh_token": make_jwt(86400)}).encode()
+        transport = LocalTransport()
+        transport.add("get", "/connections", handler=connections)
+        transport.add("post", "/auth/refresh", handler=lambda r: TransportResponse(200, tokens, url=r.url))
+        limiter = MagicMock(spec=RateLimiter)
+        api = pyixapi.api(
+            host,
+            *def_args,
+            access_token=revoked,
+            refresh_token=make_jwt(86400),
+            transport=transport,
+            rate_limiter=limiter,
+        )
+
+        list(api.connections.all())
+
+        # The call, the refresh of the tokens and the replay of the call
+        self.assertEqual(len(transport.requests), 3)
+        self.assertEqual(limiter.acquire.call_count, 3)
+
+
+class AsyncRateLimitedRequestTestCase(unittest.IsolatedAsyncioTestCase):
+    @patch("pyixapi.core.ratelimit.asyncio.sleep")
+    async def test_waits_without_blocking(self, sleep) -> None:
+        limiter = RateLimiter(rate=10, burst=1)
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+        async with httpx.AsyncClient(transport=transport) as client:
+            for _ in range(2):
+                request = AsyncRequest(base=f"{host}items", http_session=client, rate_limiter=limiter)
+                await request._make_call()
+        sleep.assert_awaited_once()
+
+    async def test_replayed_calls_wait_for_the_limiter(self) -> None:
+        revoked = make_jwt(1800)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/auth/refresh"):
+                return httpx.Response(200, json={"access_token": make_jwt(3600), "refresh_token": make_jwt(86400)})
+            if request.headers["Authorization"] == f"Bearer {revoked}":
+                return httpx.Response(401)
+            return httpx.Response(200, json=[])
+
+        limiter = MagicMock(spec=RateLimiter)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with pyixapi.async_api(
+            host,
+            *def_args,
+            access_token=revoked,
+            refresh_token=make_jwt(86400),
+            http_session=client,
+            rate_limiter=limiter,
+        ) as api:
+            self.assertEqual([c async for c in api.connections.all()], [])
+
+        self.assertEqual(limiter.acquire_async.await_count, 3)
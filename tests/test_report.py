@@ -0,0 +1,98 @@
+import math
+import unittest
+
+import httpx
+
+import pyixapi
+from pyixapi.core.report import AsyncUtilisationReport, UtilisationReport
+from pyixapi.core.transport import LocalTransport
+
+from .util import def_args, host
+
+PORTS = [
+    {"id": "PORT-1", "name": "eth1", "speed": 1000},
+    {"id": "PORT-2", "name": "eth2", "speed": 10000},
+    {"id": "PORT-3", "name": "eth3", "speed": None},
+]
+
+
+def timeseries(bps_in: list[float], bps_out: list[float]) -> dict:
+    return {
+        "precision": 300,
+        "fields": ["timestamp", "average_bps_in", "average_bps_out"],
+        "samples": [[1704067200 + 300 * i, a, b] for i, (a, b) in enumerate(zip(bps_in, bps_out))],
+    }
+
+
+TIMESERIES = {
+    # 1 Gbit/s port, busy inbound
+    "PORT-1": timeseries([i * 1e7 for i in range(1, 101)], [1e6] * 100),
+    # 10 Gbit/s port, busier outbound
+    "PORT-2": timeseries([1e8] * 100, [i * 5e7 for i in range(1, 101)]),
+    "PORT-3": timeseries([1e6] * 100, [1e6] * 100),
+}
+
+
+class UtilisationReportTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transport = LocalTransport()
+        self.transport.add("get", "/ports", PORTS)
+        for port_id, response in TIMESERIES.items():
+            self.transport.add("get", f"/ports/{port_id}/statistics/5m/timeseries", response)
+        self.api = pyixapi.api(host, *def_args, transport=self.transport)
+
+    def test_run(self) -> None:
+        report = UtilisationReport("5m", threshold=0.5, start="2024-01-01T00:00:00Z")
+        results = report.run(self.api.ports.all())
+
+        self.assertEqual([r.record.id for r in results], ["PORT-1", "PORT-2", "PORT-3"])
+        port = results[0]
+        self.assertEqual(port.capacity, 1e9)
+        self.assertAlmostEqual(port.percentile["average_bps_in"], 9.505e8)
+        self.assertEqual(port.max["average_bps_in"], 1e9)
+        self.assertAlmostEqual(port.mean["average_bps_in"], 5.05e8)
+        self.assertEqual(port.mean["average_bps_out"], 1e6)
+        # 50 samples above 500 Mbit/s
+        self.assertEqual(port.time_above["average_bps_in"], 50 * 300)
+        self.assertEqual(port.time_above["average_bps_out"], 0)
+        self.assertEqual(port.samples, 100)
+        self.assertAlmostEqual(port.utilisation, 0.9505)
+
+        self.assertAlmostEqual(results[1].peak, 4.7525e9)
+        self.assertTrue(math.isnan(results[2].utilisation))
+        self.assertTrue(math.isnan(results[2].time_above["average_bps_in"]))
+
+        request = self.transport.requests[-1]
+        self.assertEqual(request.params, {"start": "2024-01-01T00:00:00Z"})
+
+    def test_rank(self) -> None:
+        results = UtilisationReport().run(self.api.ports.all())
+        self.assertEqual([r.record.id for r in UtilisationReport.rank(results)], ["PORT-1", "PORT-2", "PORT-3"])
+        self.assertEqual([r.record.id for r in UtilisationReport.rank(results, top=1)], ["PORT-1"])
+
+    def test_sequential(self) -> None:
+        results = UtilisationReport(max_workers=1).run(self.api.ports.all())
+        self.assertEqual(len(results), 3)
+        self.assertEqual(UtilisationReport().run([]), [])
+
+    def test_missing_fields_are_ignored(self) -> None:
+        results = UtilisationReport(fields=["average_bps_in", "max_bps_in"]).run(self.api.ports.filter(id="PORT-1"))
+        self.assertEqual(list(results[0].percentile), ["average_bps_in"])
+
+    def test_invalid_percentile(self) -> None:
+        with self.assertRaises(ValueError):
+            UtilisationReport(percentile=110)
+
+
+class AsyncUtilisationReportTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_run(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/timeseries"):
+                return httpx.Response(200, json=TIMESERIES[request.url.path.split("/")[-4]])
+            return httpx.Response(200, json=PORTS)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api = pyixapi.async_api(host, *def_args, http_session=client)
+            results = await AsyncUtilisationReport(max_workers=2).run(api.ports.all())
+        self.assertEqual([r.record.id for r in AsyncUtilisationReport.rank(results)], ["PORT-1", "PORT-2", "PORT-3"])
+        self.assertAlmostEqual(results[1].utilisation, 0.47525)
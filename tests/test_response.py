@@ -1,10 +1,17 @@
+import copy
+import json
 import unittest
-from typing import TYPE_CHECKING, cast
-from unittest.mock import MagicMock
+from typing import TYPE_CHECKING, Callable, cast
+from unittest.mock import MagicMock, patch
+from urllib.parse import urlsplit
 
-from pyixapi.core.response import Record, RecordSet, get_return
+import pyixapi
+from pyixapi.core.identity import IdentityMap
+from pyixapi.core.response import CompactRecord, Record, RecordSet, compact_model, get_return
+from pyixapi.core.transport import LocalRequest, LocalTransport, TransportResponse
+from pyixapi.models import IP, Connection
 
-from .util import Response, mock_api, mock_endpoint
+from .util import Response, def_args, host, mock_api, mock_endpoint
 
 if TYPE_CHECKING:
     from pyixapi.core.query import Request
@@ -377,6 +384,55 @@ class RecordTestCase(unittest.TestCase):
         diff = record._diff()
         self.assertIn("tags", diff)
 
+    def test_changes_are_tracked_on_assignment(self) -> None:
+        record = Record({"id": "CONN-001", "name": "Connection 1", "speed": 1000}, self.api, self.endpoint)
+        self.assertIsNone(record._assigned)
+        record.name = "Renamed"
+        record.not_a_field = True
+        self.assertEqual(record._assigned, {"name"})
+
+        with patch.object(Record, "serialize") as serialize:
+            self.assertEqual(record.updates(), {"name": "Renamed"})
+        serialize.assert_not_called()
+
+    def test_assigning_the_same_value_is_not_a_change(self) -> None:
+        record = Record({"id": "CONN-001", "name": "Connection 1"}, self.api, self.endpoint)
+        record.name = "Connection 1"
+        self.assertEqual(record.updates(), {})
+
+    def test_changes_in_place_are_detected(self) -> None:
+        values = {"id": "CONN-001", "tags": ["a"], "meta": {"vlan": {"id": 10}}}
+        record = Record(values, self.api, self.endpoint)
+        record.tags.append("b")
+        record.meta["vlan"]["id"] = 20
+
+        self.assertEqual(record.updates(), {"tags": ["a", "b"], "meta": {"vlan": {"id": 20}}})
+        self.assertEqual(record.serialize(init=True), {"id": "CONN-001", "tags": ["a"], "meta": {"vlan": {"id": 10}}})
+        # The response the record was built from is left untouched
+        self.assertEqual(values["meta"], {"vlan": {"id": 10}})
+
+    def test_changes_of_nested_records_are_not_built_again(self) -> None:
+        class WithNested(Record):
+            account = Record
+
+        values = {"id": "CONN-001", "account": {"id": "ACC-1"}, "ports": [{"id": "P-1"}, {"id": "P-2"}]}
+        record = WithNested(values, self.api, self.endpoint)
+        record.ports.pop()
+        with patch.object(WithNested, "_parse_value", side_effect=AssertionError):
+            self.assertEqual(record.updates(), {"ports": ["P-1"]})
+            self.assertEqual(
+                record.serialize(init=True), {"id": "CONN-001", "account": "ACC-1", "ports": ["P-1", "P-2"]}
+            )
+
+    def test_refresh_resets_changes(self) -> None:
+        record = Record({"id": "CONN-001", "name": "Connection 1", "speed": 1000}, self.api, self.endpoint)
+        record.name = "Renamed"
+        self.assertTrue(record._refresh({"id": "CONN-001", "name": "Renamed"}))
+        self.assertEqual(record.updates(), {})
+        # Fields missing from the response are kept as attributes
+        self.assertEqual(record.speed, 1000)
+        self.assertNotIn("speed", record.serialize())
+
     def test_updates_with_falsy_id(self) -> None:
         record = Record({"id": "", "name": "Test"}, self.api, self.endpoint)
         record.name = "Modified"
@@ -405,3 +461,239 @@ class RecordTestCase(unittest.TestCase):
         self.assertIn("CONN-001", request.url)
         self.assertIn("statistics", request.url)
         self.assertIn("connections", request.url)
+
+
+class LazyRecordTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.api = mock_api()
+        self.api.lazy_records = True
+        self.endpoint = mock_endpoint(name="connections", url="https://api.example.net/v1/connections")
+        self.values = {
+            "id": "CONN-001",
+            "name": "Connection 1",
+            "ports": [{"id": "PORT-1"}, {"id": "PORT-2"}],
+            "vlan_config": {"vlan_type": "dot1q", "vlan": 100},
+            "account": {"id": "ACC-1", "name": "Account 1"},
+        }
+
+    def test_fields_are_built_on_first_access(self) -> None:
+        record = Record(self.values, self.api, self.endpoint)
+        self.assertNotIn("name", vars(record))
+        self.assertNotIn("ports", vars(record))
+
+        self.assertEqual(record.name, "Connection 1")
+        self.assertIn("name", vars(record))
+        self.assertNotIn("ports", vars(record))
+        self.assertIsInstance(record.ports[0], Record)
+        self.assertIs(record.ports, record.ports)
+
+    def test_missing_attribute_raises(self) -> None:
+        record = Record(self.values, self.api, self.endpoint)
+        self.assertFalse(hasattr(record, "not_in_response"))
+        with self.assertRaises(AttributeError):
+            record._not_in_response
+
+    def test_same_result_as_eager_records(self) -> None:
+        eager = Record(self.values, mock_api(), self.endpoint)
+        lazy = Record(self.values, self.api, self.endpoint)
+        lazy.name
+        self.assertEqual(dict(lazy), dict(eager))
+        self.assertEqual(list(dict(lazy)), list(self.values))
+        self.assertEqual(lazy.serialize(init=True), eager.serialize(init=True))
+        self.assertEqual(lazy.updates(), {})
+
+    def test_fields_shadowed_by_class_attributes(self) -> None:
+        class CustomRecord(Record):
+            account = Record
+            ports = [Record]
+
+        record = CustomRecord(self.values, self.api, self.endpoint)
+        self.assertIsInstance(record.account, Record)
+        self.assertEqual(record.account.name, "Account 1")
+        self.assertEqual(record.serialize()["account"], "ACC-1")
+        self.assertEqual(record.ports[1].id, "PORT-2")
+
+    def test_changes_before_first_access(self) -> None:
+        record = Record(self.values, self.api, self.endpoint)
+        record.name = "Renamed"
+        self.assertEqual(record.name, "Renamed")
+        self.assertEqual(record.updates(), {"name": "Renamed"})
+
+    def test_save_refreshes_from_response(self) -> None:
+        record = Record(self.values, self.api, self.endpoint)
+        record.name = "Renamed"
+        mock_request = MagicMock()
+        mock_request.patch.return_value = {**self.values, "name": "Saved"}
+        record._request = MagicMock(return_value=mock_request)
+
+        self.assertTrue(record.save())
+        mock_request.patch.assert_called_once_with({"name": "Renamed"}, content_type=None)
+        self.assertEqual(record.name, "Saved")
+        self.assertEqual(record.updates(), {})
+
+    def test_record_set(self) -> None:
+        transport = LocalTransport()
+        transport.add("get", "/connections", [{**self.values, "id": f"CONN-{i}"} for i in range(3)])
+        api = pyixapi.api(host, *def_args, transport=transport, lazy_records=True)
+        connections = [c for c in api.connections.all() if c.id != "CONN-1"]
+        self.assertEqual([c.id for c in connections], ["CONN-0", "CONN-2"])
+        self.assertEqual(connections[0].ports[0].id, "PORT-1")
+
+
+class CompactRecordTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.api = mock_api()
+        self.endpoint = mock_endpoint(name="connections", url="https://api.example.net/v1/connections")
+        self.values = {
+            "id": "CONN-001",
+            "name": "Connection 1",
+            "ports": [{"id": "PORT-1"}, {"id": "PORT-2"}],
+            "asns": [64500],
+            "account": {"id": "ACC-1", "name": "Account 1"},
+        }
+
+    def test_layout(self) -> None:
+        record = compact_model(Connection)(self.values, self.api, self.endpoint)
+        self.assertIsInstance(record, Connection)
+        self.assertEqual(vars(record), {})
+        self.assertEqual(record.id, "CONN-001")
+        self.assertEqual(vars(record), {})
+        self.assertIsInstance(record.ports[0], CompactRecord)
+        self.assertIs(record.ports, record.ports)
+        self.assertIs(compact_model(Connection), compact_model(Connection))
+
+        other = compact_model(Connection)({**self.values, "id": "CONN-002"}, self.api, self.endpoint)
+        self.assertIs(record._fields, other._fields)
+
+    def test_missing_attribute_raises(self) -> None:
+        record = CompactRecord(self.values, self.api, self.endpoint)
+        self.assertFalse(hasattr(record, "not_in_response"))
+        self.assertEqual(str(CompactRecord({}, self.api, self.endpoint)), str(self.endpoint))
+
+    def test_same_result_as_records(self) -> None:
+        record = Record(self.values, self.api, self.endpoint)
+        compact = CompactRecord(self.values, self.api, self.endpoint)
+        self.assertEqual(dict(compact), dict(record))
+        self.assertEqual(compact.serialize(), record.serialize())
+        self.assertEqual(compact.serialize(init=True), record.serialize(init=True))
+        self.assertEqual(compact.updates(), {})
+
+    def test_changes(self) -> None:
+        record = CompactRecord(self.values, self.api, self.endpoint)
+        record.name = "Renamed"
+        record.asns.append(64501)
+        self.assertEqual(record.updates(), {"name": "Renamed", "asns": [64500, 64501]})
+
+    def test_copy(self) -> None:
+        record = compact_model(Connection)(self.values, self.api, self.endpoint)
+        record.name = "Renamed"
+        copied = copy.copy(record)
+        self.assertEqual(dict(copied), dict(record))
+        self.assertEqual(copied.updates(), {"name": "Renamed"})
+        copied.asns = [64501]
+        self.assertEqual(record.asns, [64500])
+
+    def test_fields_shadowed_by_class_attributes(self) -> None:
+        class CustomRecord(Record):
+            account = Record
+
+        record = compact_model(CustomRecord)(self.values, self.api, self.endpoint)
+        self.assertEqual(record.account.name, "Account 1")
+        self.assertEqual(record.serialize()["account"], "ACC-1")
+
+    def test_save_refreshes_from_response(self) -> None:
+        record = CompactRecord(self.values, self.api, self.endpoint)
+        record.name = "Renamed"
+        mock_request = MagicMock()
+        mock_request.patch.return_value = {"id": "CONN-001", "name": "Saved"}
+        record._request = MagicMock(return_value=mock_request)
+
+        self.assertTrue(record.save())
+        mock_request.patch.assert_called_once_with({"name": "Renamed"}, content_type=None)
+        self.assertEqual(record.name, "Saved")
+        # Fields missing from the response are kept, as with other records
+        self.assertEqual(record.asns, [64500])
+        self.assertEqual(record.updates(), {})
+
+    def test_api(self) -> None:
+        transport = LocalTransport()
+        transport.add("get", "/connections", [{**self.values, "id": f"CONN-{i}"} for i in range(3)])
+        api = pyixapi.api(host, *def_args, transport=transport, compact_records=True, identity_map=IdentityMap())
+        connections = list(api.connections.all())
+        self.assertIsInstance(connections[0], Connection)
+        self.assertIsInstance(connections[0], CompactRecord)
+        self.assertIs(next(api.connections.all()), connections[0])
+
+
+class PrefetchTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transport = LocalTransport()
+        self.configs = [
+            {
+                "id": f"NSC-{i}",
+                "connection": f"CONN-{i % 2}",
+                "ips": [f"IP-{i}-4", f"IP-{i}-6"],
+                "managing_account": "ACC-1",
+                "consuming_account": f"ACC-{i + 2}",
+            }
+            for i in range(10)
+        ]
+        self.configs[9]["ips"].append("IP-404")
+        objects = {
+            "/connections": [{"id": "CONN-0", "name": "C0"}, {"id": "CONN-1", "name": "C1"}],
+            "/ips": [
+                {"id": f"IP-{i}-{v}", "address": f"10.0.0.{i}", "prefix_length": 32} for i in range(10) for v in (4, 6)
+            ],
+            "/accounts": [{"id": f"ACC-{i}", "name": f"A{i}"} for i in range(1, 12)],
+        }
+        self.transport.add("get", "/network-service-configs", self.configs)
+        for path, content in objects.items():
+            self.transport.add("get", path, handler=self.filter_by_id(content))
+        self.api = pyixapi.api(host, *def_args, transport=self.transport)
+        self.api._version = 2
+
+    def filter_by_id(self, content: list[dict]) -> Callable[[LocalRequest], TransportResponse]:
+        def handler(request: LocalRequest) -> TransportResponse:
+            ids = request.params["id"].split(",")
+            found = [o for o in content if o["id"] in ids]
+            return TransportResponse(200, json.dumps(found).encode(), url=request.url)
+
+        return handler
+
+    def paths(self) -> list[str]:
+        return [urlsplit(r.url).path.rsplit("/", 1)[-1] for r in self.transport.requests]
+
+    def test_references_are_resolved_in_bulk(self) -> None:
+        configs = list(self.api.network_service_configs.all().prefetch("connection", "ips"))
+
+        self.assertEqual(self.paths(), ["network-service-configs", "connections", "ips"])
+        self.assertIsInstance(configs[0].connection, Connection)
+        self.assertEqual([c.connection.name for c in configs[:2]], ["C0", "C1"])
+        self.assertIs(configs[0].connection, configs[2].connection)
+        self.assertIsInstance(configs[0].ips[1], IP)
+        # Objects which were not found are kept as IDs
+        self.assertEqual(configs[9].ips[2], "IP-404")
+
+    def test_fields_sharing_an_endpoint_are_fetched_together(self) -> None:
+        configs = list(
+            self.api.network_service_configs.filter(prefetch=["managing_account", "consuming_account"], state="up")
+        )
+        self.assertEqual(self.paths(), ["network-service-configs", "accounts"])
+        self.assertEqual(self.transport.requests[0].params, {"state": "up"})
+        self.assertEqual(configs[3].consuming_account.name, "A5")
+
+    def test_serialization_is_unchanged(self) -> None:
+        config = next(self.api.network_service_configs.all(prefetch=["connection", "ips"]))
+        self.assertEqual(config.serialize()["connection"], "CONN-0")
+        self.assertEqual(config.serialize()["ips"], ["IP-0-4", "IP-0-6"])
+        self.assertEqual(config.updates(), {})
+
+    def test_unknown_reference(self) -> None:
+        with self.assertRaises(ValueError):
+            self.api.network_service_configs.all().prefetch("state")
+        self.assertEqual(self.transport.requests, [])
+
+    def test_nothing_to_resolve(self) -> None:
+        self.transport.add("get", "/network-service-configs", [])
+        self.assertEqual(list(self.api.network_service_configs.all(prefetch=["connection"])), [])
+        self.assertEqual(len(self.transport.requests), 1)
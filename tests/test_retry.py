@@ -0,0 +1,133 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import httpx
+
+import pyixapi
+from pyixapi.core.api import API
+from pyixapi.core.query import AsyncRequest, RequestError
+from pyixapi.core.retry import Attempt, Retry
+from pyixapi.core.transport import LocalRequest, LocalTransport, TransportResponse
+
+from .util import def_args, host
+
+
+def flaky(statuses: list[int], headers: dict[str, str] | None = None):
+    """
+    Build a LocalTransport handler answering with each of ``statuses`` in turn, then 200.
+    """
+    remaining = list(statuses)
+
+    def handler(request: LocalRequest) -> TransportResponse:
+        if remaining:
+            return TransportResponse(remaining.pop(0), b"{}", headers, url=request.url)
+        return TransportResponse(200, b'[{"id": "CONN-001"}]', url=request.url)
+
+    return handler
+
+
+class RetryTestCase(unittest.TestCase):
+    def test_is_retryable(self) -> None:
+        retry = Retry()
+        self.assertTrue(retry.is_retryable("get", 503))
+        self.assertTrue(retry.is_retryable("delete", 429))
+        self.assertFalse(retry.is_retryable("get", 500))
+        self.assertFalse(retry.is_retryable("post", 503))
+
+    def test_exponential_backoff_is_capped(self) -> None:
+        retry = Retry(backoff_factor=1, backoff_max=5, jitter=0)
+        self.assertEqual([retry.backoff(n) for n in range(1, 5)], [1, 2, 4, 5])
+
+    def test_jitter_shortens_waits(self) -> None:
+        retry = Retry(backoff_factor=1, jitter=0.5)
+        for _ in range(50):
+            self.assertTrue(1 <= retry.backoff(2) <= 2)
+
+    def test_retry_after_seconds_and_date(self) -> None:
+        retry = Retry()
+        self.assertEqual(retry.retry_after(TransportResponse(503, headers={"Retry-After": "7"})), 7)
+        date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        delay = retry.retry_after(TransportResponse(503, headers={"Retry-After": date}))
+        self.assertTrue(delay is not None and 28 <= delay <= 30)
+        self.assertIsNone(retry.retry_after(TransportResponse(503, headers={"Retry-After": "soon"})))
+        self.assertIsNone(retry.retry_after(TransportResponse(503)))
+
+    def test_next_delay(self) -> None:
+        retry = Retry(total=2, jitter=0)
+        r = TransportResponse(429, headers={"Retry-After": "3"})
+        self.assertEqual(retry.next_delay("get", 1, r), 3)
+        self.assertIsNone(retry.next_delay("get", 3, r))
+        self.assertEqual(retry.next_delay("get", 2, TransportResponse(502)), 1)
+        self.assertEqual(Retry(respect_retry_after=False, jitter=0).next_delay("get", 1, r), 0.5)
+
+    def test_long_retry_after_gives_up(self) -> None:
+        r = TransportResponse(429, headers={"Retry-After": "3600"})
+        self.assertIsNone(Retry().next_delay("get", 1, r))
+        self.assertIsNone(Retry(backoff_max=60).next_delay("get", 1, r))
+        self.assertEqual(Retry(retry_after_max=3600).next_delay("get", 1, r), 3600)
+        self.assertEqual(Retry(jitter=0, retry_after_max=10).next_delay("get", 1, TransportResponse(503)), 0.5)
+
+
+@patch("pyixapi.core.query.time.sleep")
+class RetryRequestTestCase(unittest.TestCase):
+    def make_api(self, handler, **kwargs) -> tuple[API, LocalTransport, list[Attempt]]:
+        attempts: list[Attempt] = []
+        transport = LocalTransport()
+        transport.add("get", "/connections", handler=handler)
+        transport.add("post", "/connections", handler=handler)
+        retry = Retry(jitter=0, on_attempt=attempts.append, **kwargs)
+        return pyixapi.api(host, *def_args, transport=transport, retry=retry), transport, attempts
+
+    def test_transient_failures_are_retried(self, sleep) -> None:
+        api, transport, attempts = self.make_api(flaky([503, 502]))
+
+        self.assertEqual([c.id for c in api.connections.all()], ["CONN-001"])
+        self.assertEqual(len(transport.requests), 3)
+        self.assertEqual([a.status_code for a in attempts], [503, 502, 200])
+        self.assertEqual([a.delay for a in attempts], [0.5, 1.0, None])
+        self.assertTrue(all(a.elapsed >= 0 for a in attempts))
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.5, 1.0])
+
+    def test_retry_after_is_honoured(self, sleep) -> None:
+        api, _, _ = self.make_api(flaky([429], headers={"Retry-After": "2"}))
+        list(api.connections.all())
+        sleep.assert_called_once_with(2.0)
+
+    def test_gives_up_after_total(self, sleep) -> None:
+        api, transport, attempts = self.make_api(flaky([503] * 5), total=2)
+        with self.assertRaises(RequestError):
+            list(api.connections.all())
+        self.assertEqual(len(transport.requests), 3)
+        self.assertIsNone(attempts[-1].delay)
+
+    def test_non_idempotent_verbs_are_not_retried(self, sleep) -> None:
+        api, transport, _ = self.make_api(flaky([503]))
+        with self.assertRaises(RequestError):
+            api.connections.create(name="C1")
+        self.assertEqual(len(transport.requests), 1)
+        sleep.assert_not_called()
+
+    def test_no_retry_by_default(self, sleep) -> None:
+        transport = LocalTransport()
+        transport.add("get", "/connections", handler=flaky([503]))
+        api = pyixapi.api(host, *def_args, transport=transport)
+        with self.assertRaises(RequestError):
+            list(api.connections.all())
+        self.assertEqual(len(transport.requests), 1)
+
+
+class AsyncRetryTestCase(unittest.IsolatedAsyncioTestCase):
+    @patch("pyixapi.core.query.asyncio.sleep")
+    async def test_transient_failures_are_retried(self, sleep) -> None:
+        statuses = [503, 200]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(statuses.pop(0), json=[])
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            request = AsyncRequest(base=f"{host}items", http_session=client, retry=Retry(jitter=0))
+            self.assertEqual([i async for i in request.get()], [])
+        self.assertEqual([a.status_code for a in request.attempts], [503, 200])
+        sleep.assert_awaited_once_with(0.5)
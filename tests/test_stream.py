@@ -0,0 +1,127 @@
+import json
+import unittest
+from typing import Iterator
+from unittest.mock import MagicMock
+
+import pyixapi
+from pyixapi.core.query import ContentError, RequestError
+from pyixapi.core.stream import iter_json_items
+from pyixapi.core.transport import LocalRequest, LocalTransport, RequestsTransport, TransportResponse, Urllib3Transport
+
+from .util import def_args, host
+
+
+def chunked(document: str, size: int) -> list[bytes]:
+    data = document.encode("utf-8")
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class IterJSONItemsTestCase(unittest.TestCase):
+    documents = [
+        [],
+        [{"id": "IP-1", "address": "2001:db8::1", "tags": ["a", "b"]}, {"id": "IP-2", "note": "é€😀"}],
+        [12345, -1.5e10, 0, "x", True, False, None, [], {}],
+        {"id": "IP-1"},
+        42,
+    ]
+
+    def test_any_chunking(self) -> None:
+        for document in self.documents:
+            expected = document if isinstance(document, list) else [document]
+            for text in (json.dumps(document, ensure_ascii=False), json.dumps(document, indent=2)):
+                for size in (1, 2, 3, 7, 4096):
+                    with self.subTest(text=text, size=size):
+                        self.assertEqual(list(iter_json_items(chunked(text, size))), expected)
+
+    def test_invalid_documents(self) -> None:
+        for text in ("", " ", "[1,]", "[,1]", "[1 2]", "[1,,2]", "[1", "[1]]", "[1] x", '{"a": 1'):
+            for size in (1, 3):
+                with self.subTest(text=text, size=size), self.assertRaises(json.JSONDecodeError):
+                    list(iter_json_items(chunked(text, size)))
+
+    def test_items_are_yielded_before_the_end_of_the_document(self) -> None:
+        received: list[bytes] = []
+
+        def chunks() -> Iterator[bytes]:
+            for chunk in (b'[{"id": 1}, ', b'{"id": 2}', b"]"):
+                received.append(chunk)
+                yield chunk
+
+        items = iter_json_items(chunks())
+        self.assertEqual(next(items), {"id": 1})
+        self.assertEqual(len(received), 1)
+        self.assertEqual(list(items), [{"id": 2}])
+
+
+class StreamedRecordSetTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transport = LocalTransport()
+        self.released = False
+
+    def streamed(self, chunks: list[bytes], status_code: int = 200) -> None:
+        def handler(request: LocalRequest) -> TransportResponse:
+            return TransportResponse(status_code, stream=iter(chunks), release=self.release, url=request.url)
+
+        self.transport.add("get", "/ips", handler=handler)
+
+    def release(self) -> None:
+        self.released = True
+
+    def test_records_are_built_while_streaming(self) -> None:
+        items = [{"id": f"IP-{i}", "address": f"10.0.0.{i}"} for i in range(100)]
+        self.streamed(chunked(json.dumps(items), 16))
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+
+        records = api.ips.filter(stream=True, version=4)
+        self.assertEqual(records.request.filters, {"version": 4})
+        self.assertEqual([r.address for r in records], [i["address"] for i in items])
+        self.assertEqual(records.request.count, 100)
+        self.assertTrue(self.released)
+
+    def test_len_is_not_available(self) -> None:
+        self.streamed([b"[]"])
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+        with self.assertRaises(TypeError):
+            len(api.ips.all(stream=True))
+
+    def test_errors(self) -> None:
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+        self.streamed([b'{"detail": "boom"}'], status_code=500)
+        with self.assertRaises(RequestError) as ctx:
+            list(api.ips.all(stream=True))
+        self.assertIn("boom", str(ctx.exception))
+
+        self.streamed([b"<html>"])
+        with self.assertRaises(ContentError):
+            list(api.ips.all(stream=True))
+        self.assertTrue(self.released)
+
+    def test_transports_without_streaming_are_chunked(self) -> None:
+        self.transport.add("get", "/macs", [{"id": "MAC-1"}, {"id": "MAC-2"}])
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+        self.assertEqual([m.id for m in api.macs.all(stream=True)], ["MAC-1", "MAC-2"])
+
+
+class StreamingTransportTestCase(unittest.TestCase):
+    def test_requests_transport_asks_for_streaming(self) -> None:
+        session = MagicMock()
+        RequestsTransport(session).request("get", host, {}, stream=True)
+        self.assertTrue(session.get.call_args[1]["stream"])
+
+    def test_urllib3_transport_does_not_preload(self) -> None:
+        pool = MagicMock()
+        pool.request.return_value = MagicMock(status=200, headers={}, reason="OK")
+        pool.request.return_value.stream.return_value = iter([b"[1,", b"2]"])
+
+        r = Urllib3Transport(pool_manager=pool).request("get", host, {}, stream=True)
+
+        self.assertFalse(pool.request.call_args[1]["preload_content"])
+        self.assertEqual(list(iter_json_items(r.iter_content())), [1, 2])
+        pool.request.return_value.release_conn.assert_called_once()
+
+    def test_content_reads_the_stream(self) -> None:
+        released = MagicMock()
+        r = TransportResponse(200, stream=iter([b'{"a"', b": 1}"]), release=released)
+        self.assertEqual(r.json(), {"a": 1})
+        self.assertEqual(list(r.iter_content(chunk_size=3)), [b'{"a', b'": ', b"1}"])
+        released.assert_called_once()
@@ -0,0 +1,179 @@
+import importlib.util
+import math
+import unittest
+
+import httpx
+
+import pyixapi
+from pyixapi.core.timeseries import Timeseries, parse_timestamp
+from pyixapi.core.transport import LocalTransport
+
+from .util import def_args, host
+
+FIELDS = ["timestamp", "average_bps_in", "average_bps_out"]
+RESPONSE = {
+    "title": "PORT-001 5m",
+    "precision": 300,
+    "origin_timezone": "Europe/Berlin",
+    "next_update_at": "2024-01-01T00:25:00Z",
+    "fields": FIELDS,
+    "samples": [
+        ["2024-01-01T00:00:00Z", 100, 10],
+        ["2024-01-01T00:05:00Z", 400, None],
+        ["2024-01-01T00:10:00Z", 300, 30],
+        ["2024-01-01T00:15:00Z", 200, 40],
+    ],
+}
+START = 1704067200.0
+
+
+class TimeseriesTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ts = Timeseries.from_response(RESPONSE)
+
+    def test_from_response(self) -> None:
+        self.assertEqual(len(self.ts), 4)
+        self.assertEqual(self.ts.fields, ["average_bps_in", "average_bps_out"])
+        self.assertEqual(list(self.ts["timestamp"]), [START + 300 * i for i in range(4)])
+        self.assertEqual(list(self.ts["average_bps_in"]), [100, 400, 300, 200])
+        self.assertTrue(math.isnan(self.ts["average_bps_out"][1]))
+        self.assertEqual(self.ts.precision, 300)
+        self.assertEqual(self.ts.meta["title"], "PORT-001 5m")
+        self.assertNotIn("samples", self.ts.meta)
+
+    def test_empty_response(self) -> None:
+        ts = Timeseries.from_response({"fields": FIELDS, "samples": []})
+        self.assertEqual(len(ts), 0)
+        self.assertEqual(ts.fields, ["average_bps_in", "average_bps_out"])
+        self.assertTrue(math.isnan(ts.percentile(95, "average_bps_in")))
+
+    def test_parse_timestamp(self) -> None:
+        self.assertEqual(parse_timestamp("2024-01-01T00:00:00Z"), START)
+        self.assertEqual(parse_timestamp("2024-01-01T01:00:00+01:00"), START)
+        self.assertEqual(parse_timestamp("2024-01-01T00:00:00"), START)
+
+    def test_samples_are_sorted(self) -> None:
+        ts = Timeseries([3, 1, 2], {"a": [30, 10, 20]})
+        self.assertEqual(list(ts["timestamp"]), [1, 2, 3])
+        self.assertEqual(list(ts["a"]), [10, 20, 30])
+
+    def test_mismatched_lengths(self) -> None:
+        with self.assertRaises(ValueError):
+            Timeseries([1, 2], {"a": [1]})
+
+    def test_rate(self) -> None:
+        counters = Timeseries([0, 10, 20, 40], {"octets": [0, 1000, 3000, 500]})
+        rate = counters.rate()
+        self.assertEqual(list(rate["timestamp"]), [10, 20, 40])
+        # The counter was reset before the last sample
+        self.assertEqual(list(rate["octets"]), [100, 200, 25])
+        with self.assertRaises(KeyError):
+            counters.rate("packets")
+
+    def test_percentile(self) -> None:
+        ts = Timeseries(range(10), {"a": range(1, 11)})
+        self.assertAlmostEqual(ts.percentile(95, "a"), 9.55)
+        self.assertEqual(ts.percentile(0, "a"), 1)
+        self.assertEqual(ts.percentile(100, "a"), 10)
+        self.assertEqual(ts.percentile(50, "a"), 5.5)
+        # Samples without a value are left out
+        self.assertEqual(self.ts.percentile(100, "average_bps_out"), 40)
+        with self.assertRaises(ValueError):
+            ts.percentile(101, "a")
+
+    def test_statistics(self) -> None:
+        self.assertEqual(self.ts.mean("average_bps_in"), 250)
+        self.assertAlmostEqual(self.ts.mean("average_bps_out"), 80 / 3)
+        self.assertEqual(self.ts.max("average_bps_out"), 40)
+        self.assertEqual(self.ts.time_above("average_bps_in", 200), 600)
+        self.assertEqual(self.ts.time_above("average_bps_out", 0), 900)
+        empty = Timeseries([], {"a": []})
+        self.assertTrue(math.isnan(empty.mean("a")))
+        self.assertTrue(math.isnan(empty.max("a")))
+
+    def test_interval(self) -> None:
+        self.assertEqual(self.ts.interval, 300)
+        self.assertEqual(Timeseries([0, 60, 60, 180], {}).interval, 60)
+        self.assertEqual(Timeseries([0], {}).interval, 0)
+
+    def test_resample(self) -> None:
+        hourly = self.ts.resample(600, "max")
+        self.assertEqual(list(hourly["timestamp"]), [START, START + 600])
+        self.assertEqual(list(hourly["average_bps_in"]), [400, 300])
+        self.assertEqual(list(hourly["average_bps_out"]), [10, 40])
+        self.assertEqual(hourly.precision, 600)
+
+        mean = self.ts.resample(600)
+        self.assertEqual(list(mean["average_bps_in"]), [250, 250])
+        self.assertEqual(list(mean["average_bps_out"]), [10, 35])
+
+        with self.assertRaises(ValueError):
+            self.ts.resample(600, "median")
+        with self.assertRaises(ValueError):
+            self.ts.resample(0)
+
+    def test_merge(self) -> None:
+        other = Timeseries([START + 900, START + 1200], {"average_bps_in": [250, 500], "max_bps_in": [1, 2]})
+        merged = self.ts.merge(other)
+        self.assertEqual(list(merged["timestamp"]), [START + 300 * i for i in range(5)])
+        self.assertEqual(list(merged["average_bps_in"]), [100, 400, 300, 250, 500])
+        self.assertEqual(merged.fields, ["average_bps_in", "average_bps_out", "max_bps_in"])
+        self.assertTrue(math.isnan(merged["average_bps_out"][4]))
+        self.assertTrue(math.isnan(merged["max_bps_in"][0]))
+        self.assertEqual(list(merged["max_bps_in"])[3:], [1, 2])
+
+    def test_merge_several(self) -> None:
+        parts = [Timeseries([t], {"a": [t * 10]}) for t in (3, 1, 2, 1)]
+        merged = parts[0].merge(*parts[1:])
+        self.assertEqual(list(merged["timestamp"]), [1, 2, 3])
+        self.assertEqual(list(merged["a"]), [10, 20, 30])
+
+    def test_window(self) -> None:
+        window = self.ts.window(START + 300, START + 900)
+        self.assertEqual(list(window["timestamp"]), [START + 300, START + 600])
+        self.assertEqual(list(window["average_bps_in"]), [400, 300])
+        self.assertEqual(window.precision, 300)
+        self.assertEqual(len(self.ts.window(START + 600)), 2)
+        self.assertEqual(len(self.ts.window(end=START)), 0)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy is not installed")
+    def test_to_numpy(self) -> None:
+        values = self.ts.to_numpy("average_bps_in")
+        self.assertEqual(values.tolist(), [100, 400, 300, 200])
+        # The array shares the memory of the timeseries
+        values[0] = 1
+        self.assertEqual(self.ts["average_bps_in"][0], 1)
+
+
+class ModelTimeseriesTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transport = LocalTransport()
+        self.transport.add("get", "/ports/PORT-001", {"id": "PORT-001", "name": "eth0", "speed": 10000})
+        self.transport.add("get", "/ports/PORT-001/statistics/5m/timeseries", RESPONSE)
+        self.api = pyixapi.api(host, *def_args, transport=self.transport)
+
+    def test_typed(self) -> None:
+        port = self.api.ports.get("PORT-001")
+        ts = port.statistics_timeseries("5m", typed=True, start="2024-01-01T00:00:00Z")
+        self.assertIsInstance(ts, Timeseries)
+        self.assertEqual(len(ts), 4)
+        self.assertEqual(self.transport.requests[-1].params, {"start": "2024-01-01T00:00:00Z"})
+
+    def test_untyped(self) -> None:
+        port = self.api.ports.get("PORT-001")
+        self.assertEqual(port.statistics_timeseries("5m"), RESPONSE)
+
+
+class AsyncModelTimeseriesTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_typed(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/timeseries"):
+                return httpx.Response(200, json=RESPONSE)
+            return httpx.Response(200, json={"id": "CONN-001", "name": "Connection"})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api = pyixapi.async_api(host, *def_args, http_session=client)
+            connection = await api.connections.get("CONN-001")
+            ts = await connection.statistics_timeseries("5m", typed=True)
+        self.assertIsInstance(ts, Timeseries)
+        self.assertEqual(list(ts["average_bps_in"]), [100, 400, 300, 200])
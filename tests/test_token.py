@@ -1,10 +1,18 @@
+import asyncio
+import json
+import threading
+import time
 import unittest
 import warnings
 from datetime import datetime, timedelta, timezone
 
-from pyixapi.core.token import InvalidTokenException, Token, TokenException
+import httpx
 
-from .util import sample_jwt, sample_jwt_exp
+import pyixapi
+from pyixapi.core.token import AsyncTokenManager, InvalidTokenException, Token, TokenException, TokenManager
+from pyixapi.core.transport import LocalRequest, LocalTransport, TransportResponse
+
+from .util import def_args, host, make_jwt, sample_jwt, sample_jwt_exp
 
 
 class TokenTestCase(unittest.TestCase):
@@ -65,3 +73,130 @@ class TokenTestCase(unittest.TestCase):
             self.assertTrue(len(w) > 0)
             self.assertTrue(issubclass(w[0].category, DeprecationWarning))
             self.assertIn("deprecated", str(w[0].message))
+
+
+def token_pair(access_expires_in: int = 3600) -> bytes:
+    return json.dumps({"access_token": make_jwt(access_expires_in), "refresh_token": make_jwt(86400)}).encode()
+
+
+class TokenManagerTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transport = LocalTransport()
+        self.renewed = threading.Event()
+
+    def route(self, path: str, status_code: int = 200) -> None:
+        def handler(request: LocalRequest) -> TransportResponse:
+            self.renewed.set()
+            return TransportResponse(status_code, token_pair() if status_code == 200 else b"{}", url=request.url)
+
+        self.transport.add("post", path, handler=handler)
+
+    def test_next_renewal_uses_margin(self) -> None:
+        api = pyixapi.api(host, *def_args, access_token=make_jwt(600), transport=self.transport)
+        manager = TokenManager(api, margin=60)
+        self.assertAlmostEqual(manager.next_renewal(), 540, delta=2)
+        api.access_token = None
+        self.assertEqual(manager.next_renewal(), 0)
+
+    def test_disabled_by_default(self) -> None:
+        self.assertIsNone(pyixapi.api(host, *def_args).token_manager)
+
+    def test_refreshes_before_expiry_in_background(self) -> None:
+        self.route("/auth/refresh")
+        api = pyixapi.api(host, *def_args, refresh_margin=60, transport=self.transport)
+        api._set_tokens({"access_token": make_jwt(30), "refresh_token": make_jwt(86400)})
+
+        self.assertTrue(self.renewed.wait(5))
+        with api:
+            self.assertTrue(api.token_manager.running)
+            self.assertGreater(api.access_token.ttl, 3000)
+        self.assertFalse(api.token_manager.running)
+        self.assertEqual([r.url for r in self.transport.requests], [f"{api.url}/auth/refresh"])
+
+    def test_starts_with_given_tokens(self) -> None:
+        self.route("/auth/refresh")
+        with pyixapi.api(
+            host,
+            *def_args,
+            access_token=make_jwt(30),
+            refresh_token=make_jwt(86400),
+            refresh_margin=60,
+            transport=self.transport,
+        ) as api:
+            self.assertTrue(api.token_manager.running)
+            self.assertTrue(self.renewed.wait(5))
+        self.assertFalse(api.token_manager.running)
+
+    def test_falls_back_to_authentication_when_refresh_fails(self) -> None:
+        self.route("/auth/refresh", status_code=401)
+        self.route("/auth/token")
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+        api.access_token = Token.from_jwt(make_jwt(30))
+        api.refresh_token = Token.from_jwt(make_jwt(86400))
+
+        manager = TokenManager(api, margin=60)
+        manager.renew()
+
+        self.assertEqual([r.url.rsplit("/", 1)[-1] for r in self.transport.requests], ["refresh", "token"])
+        self.assertGreater(api.access_token.ttl, 3000)
+
+    def test_failure_is_kept_and_retried(self) -> None:
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+        api.access_token = Token.from_jwt(make_jwt(30))
+        manager = TokenManager(api, margin=60, retry_interval=0.01)
+        manager.start()
+        while manager.last_error is None:
+            time.sleep(0.001)
+        self.route("/auth/token")
+
+        self.assertTrue(self.renewed.wait(5))
+        manager.stop()
+        self.assertIsNone(manager.last_error)
+        self.assertGreater(api.access_token.ttl, 3000)
+
+
+class AsyncTokenManagerTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_refreshes_in_a_task(self) -> None:
+        refreshed = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            refreshed.append(request.url.path)
+            return httpx.Response(200, content=token_pair())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with pyixapi.async_api(host, *def_args, http_session=client, refresh_margin=60) as api:
+            self.assertIsInstance(api.token_manager, AsyncTokenManager)
+            api._set_tokens({"access_token": make_jwt(30), "refresh_token": make_jwt(86400)})
+            self.assertTrue(api.token_manager.running)
+            for _ in range(100):
+                if refreshed:
+                    break
+                await asyncio.sleep(0.01)
+            self.assertGreater(api.access_token.ttl, 3000)
+        self.assertFalse(api.token_manager.running)
+        self.assertEqual(len(refreshed), 1)
+
+    async def test_starts_with_given_tokens(self) -> None:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(200, content=token_pair())))
+        api = pyixapi.async_api(host, *def_args, access_token=make_jwt(3600), http_session=client, refresh_margin=60)
+        self.assertTrue(api.token_manager.running)
+        await api.aclose()
+
+        # Built outside of an event loop, the task starts with the context manager
+        api = await asyncio.to_thread(
+            pyixapi.async_api, host, *def_args, access_token=make_jwt(3600), http_session=client, refresh_margin=60
+        )
+        self.assertFalse(api.token_manager.running)
+        async with api:
+            self.assertTrue(api.token_manager.running)
+
+    async def test_renewal_shares_the_lock_of_unauthorized_calls(self) -> None:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(200, content=token_pair())))
+        async with pyixapi.async_api(host, *def_args, http_session=client, refresh_margin=60) as api:
+            api.refresh_token = Token.from_jwt(make_jwt(86400))
+            async with api._async_auth_lock:
+                renewal = asyncio.ensure_future(api.token_manager.renew())
+                await asyncio.sleep(0.01)
+                self.assertFalse(renewal.done())
+            await renewal
+            self.assertGreater(api.access_token.ttl, 3000)
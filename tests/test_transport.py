@@ -0,0 +1,183 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import MagicMock
+
+import httpx
+
+import pyixapi
+from pyixapi.core.query import Request, RequestError
+from pyixapi.core.transport import (
+    HTTPXTransport,
+    LocalTransport,
+    RequestsTransport,
+    Transport,
+    TransportResponse,
+    Urllib3Transport,
+)
+
+from .util import def_args, host
+
+
+class TransportResponseTestCase(unittest.TestCase):
+    def test_ok_text_and_json(self) -> None:
+        r = TransportResponse(200, b'{"id": "1"}')
+        self.assertTrue(r.ok)
+        self.assertEqual(r.text, '{"id": "1"}')
+        self.assertEqual(r.json(), {"id": "1"})
+
+    def test_redirects_are_ok_but_errors_are_not(self) -> None:
+        self.assertTrue(TransportResponse(304).ok)
+        self.assertFalse(TransportResponse(404).ok)
+
+    def test_base_transport_is_abstract(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            Transport().request("get", host, {})
+
+
+class RequestsTransportTestCase(unittest.TestCase):
+    def test_delegates_to_session_verb(self) -> None:
+        session = MagicMock()
+        transport = RequestsTransport(session)
+        transport.request("patch", host, {"accept": "x"}, params={"a": 1}, json={"b": 2}, proxies={"https": "p"})
+        session.patch.assert_called_once_with(
+            host, headers={"accept": "x"}, params={"a": 1}, json={"b": 2}, proxies={"https": "p"}
+        )
+        transport.close()
+        session.close.assert_called_once()
+
+
+class Urllib3TransportTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = MagicMock()
+        self.pool.request.return_value = MagicMock(
+            status=200, data=b'[{"id": "1"}]', headers={"ETag": '"abc"'}, reason="OK"
+        )
+        self.transport = Urllib3Transport(pool_manager=self.pool)
+
+    def test_encodes_params_and_body(self) -> None:
+        r = self.transport.request(
+            "post", f"{host}items", {"Content-Type": "application/json;"}, params={"id": ["1", "2"]}, json={"x": 1}
+        )
+        args, kwargs = self.pool.request.call_args
+        self.assertEqual(args, ("POST", f"{host}items?id=1&id=2"))
+        self.assertEqual(json.loads(kwargs["body"]), {"x": 1})
+        self.assertEqual(r.json(), [{"id": "1"}])
+        self.assertEqual(r.headers["etag"], '"abc"')
+
+    def test_leaves_out_none_params(self) -> None:
+        self.transport.request("get", f"{host}items", {}, params={"id": ["1", "2"], "state": None, "name": "a"})
+        args, _ = self.pool.request.call_args
+        self.assertEqual(args, ("GET", f"{host}items?id=1&id=2&name=a"))
+        self.transport.request("get", f"{host}items", {}, params={"state": None})
+        args, _ = self.pool.request.call_args
+        self.assertEqual(args, ("GET", f"{host}items"))
+
+    def test_json_body_content_type(self) -> None:
+        seen: dict[str, str | None] = {}
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                seen["Content-Type"] = self.headers["Content-Type"]
+                self.rfile.read(int(self.headers["Content-Length"]))
+                self.send_response(201)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        transport = Urllib3Transport()
+        r = transport.request("post", f"http://127.0.0.1:{server.server_port}/items", {}, json={"x": 1})
+        transport.close()
+        self.assertEqual(r.status_code, 201)
+        self.assertEqual(seen["Content-Type"], "application/json")
+
+        # A content type given by the caller is kept
+        self.transport.request("post", f"{host}items", {"Content-Type": "application/merge-patch+json"}, json={})
+        self.assertEqual(self.pool.request.call_args[1]["headers"]["Content-Type"], "application/merge-patch+json")
+
+    def test_get_without_body(self) -> None:
+        self.transport.request("get", f"{host}items", {})
+        self.assertIsNone(self.pool.request.call_args[1]["body"])
+
+    def test_uses_one_proxy_manager_per_proxy(self) -> None:
+        proxies = {"https": "http://proxy:8080"}
+        pool = self.transport._pool_for(f"{host}items", proxies)
+        self.assertIsNot(pool, self.pool)
+        self.assertIs(self.transport._pool_for(f"{host}other", proxies), pool)
+        self.assertIs(self.transport._pool_for("http://plain.example.net/", proxies), self.pool)
+        self.transport.close()
+        self.pool.clear.assert_called_once()
+
+    def test_default_pool_manager(self) -> None:
+        transport = Urllib3Transport(maxsize=4)
+        self.assertEqual(transport.pool_manager.connection_pool_kw["maxsize"], 4)
+
+
+class LocalTransportTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transport = LocalTransport()
+
+    def test_routes_by_verb_and_path(self) -> None:
+        self.transport.add("get", "/connections", [{"id": "CONN-001"}])
+        self.transport.add("post", "/connections", {"id": "CONN-002"}, status_code=201)
+
+        r = self.transport.request("get", f"{host}connections/", {})
+        self.assertEqual(r.json(), [{"id": "CONN-001"}])
+        r = self.transport.request("post", f"{host}connections", {}, json={"name": "x"})
+        self.assertEqual(r.status_code, 201)
+        self.assertEqual(self.transport.requests[-1].json, {"name": "x"})
+
+    def test_unknown_route_is_404(self) -> None:
+        r = self.transport.request("get", f"{host}nothing", {})
+        self.assertEqual(r.status_code, 404)
+        self.assertFalse(r.ok)
+
+    def test_latest_route_wins_and_handlers(self) -> None:
+        self.transport.add("get", "/items", [])
+        self.transport.add("get", "/items", handler=lambda req: TransportResponse(200, req.params["q"].encode()))
+        self.assertEqual(self.transport.request("get", f"{host}items", {}, params={"q": "1"}).json(), 1)
+
+    def test_drives_the_api(self) -> None:
+        self.transport.add("get", "/connections", [{"id": "CONN-001"}, {"id": "CONN-002"}])
+        self.transport.add("get", "/connections/CONN-003", {"detail": "gone"}, status_code=500)
+
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+        self.assertEqual([c.id for c in api.connections.filter(state="production")], ["CONN-001", "CONN-002"])
+        self.assertEqual(self.transport.requests[-1].params, {"state": "production"})
+        with self.assertRaises(RequestError):
+            api.connections.get("CONN-003")
+
+    def test_record_requests_use_the_api_transport(self) -> None:
+        self.transport.add("get", "/ports", [{"id": "PORT-001"}])
+        self.transport.add("get", "/ports/PORT-001/statistics", {"average_in": 1})
+        api = pyixapi.api(host, *def_args, transport=self.transport)
+        port = next(api.ports.all())
+        self.assertEqual(port.statistics(), {"average_in": 1})
+
+    def test_request_defaults_to_requests_transport(self) -> None:
+        request = Request(base=host, http_session=MagicMock())
+        self.assertIsInstance(request.transport, RequestsTransport)
+
+
+class HTTPXTransportTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_normalises_response(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(503, json={"detail": "busy"}, headers={"Retry-After": "1"})
+
+        transport = HTTPXTransport(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        r = await transport.request("get", f"{host}items", {}, params={"a": "1"})
+        await transport.close()
+
+        self.assertFalse(r.ok)
+        self.assertEqual(r.reason, "Service Unavailable")
+        self.assertEqual(r.headers["Retry-After"], "1")
+        self.assertEqual(r.url, f"{host}items?a=1")
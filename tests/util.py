@@ -1,3 +1,4 @@
+import functools
 import json
 from datetime import datetime, timedelta, timezone
 from typing import Any
@@ -5,6 +6,9 @@ from unittest.mock import MagicMock
 
 import jwt
 
+from pyixapi.core.api import API
+from pyixapi.core.query import Request
+
 host = "https://api.example.net/v1/"
 def_args = (
     "-GnNlMD8hBuxSSUJmpbfUkss9dyOKfTV1SnZibNyyr4",
@@ -78,6 +82,25 @@ def mock_api() -> MagicMock:
     api.access_token.encoded = "fake-token"
     api.user_agent = "pyixapi/test"
     api.proxies = None
+    api.transport = None
+    api._renew_after_unauthorized = None
+    api.retry = None
+    api.rate_limiter = None
+    api.cache = None
+    api.cache_scope = ""
+    api.conditional_cache = None
+    api.json_codec = None
+    api.pagination = None
+    api.batcher = None
+    api.identity_map = None
+    api.lazy_records = False
+    api.compact_records = False
+    api.patch_format = None
+    api.timeseries_cache = None
+    # Requests are built by the API, as with a real one
+    api._request_class = Request
+    api._request = functools.partial(API._request, api)
+    api._request_kwargs = functools.partial(API._request_kwargs, api)
     return api
 
 